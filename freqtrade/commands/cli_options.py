@@ -222,6 +222,60 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Backtesting engine to use. `columnar` keeps candles as NumPy arrays and '
+        'only processes candles with an entry signal or an open trade '
+        f'(default: `{constants.BACKTEST_ENGINE_DEFAULT}`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "backtest_jobs": Arg(
+        '--backtest-jobs',
+        help='The number of strategies of `--strategy-list` to backtest in parallel '
+        '(backtesting worker processes). '
+        'If -1, all CPUs are used, for -2, all CPUs but one are used, etc. '
+        'If 1 (default) is given, strategies are backtested one after the other.',
+        type=int,
+        metavar='JOBS',
+        default=1,
+    ),
+    "indicator_jobs": Arg(
+        '--indicator-jobs',
+        help='The number of pairs to calculate indicators for concurrently. '
+        'If -1, all CPUs are used, for -2, all CPUs but one are used, etc. '
+        'If 1 (default) is given, pairs are analyzed one after the other.',
+        type=int,
+        metavar='JOBS',
+    ),
+    "indicator_pool": Arg(
+        '--indicator-pool',
+        help='Run concurrent indicator calculations (`--indicator-jobs`) in `threads` '
+        'or worker `processes`. Processes avoid contention on the GIL for strategies '
+        'calculating indicators in Python / pandas code '
+        f'(default: `{constants.INDICATOR_POOL_DEFAULT}`).',
+        choices=constants.INDICATOR_POOLS,
+    ),
+    "data_load_jobs": Arg(
+        '--data-load-jobs',
+        help='The number of pairs to load data for concurrently. Json data is loaded in '
+        'worker processes, other data formats in threads. '
+        'If -1, all CPUs are used, for -2, all CPUs but one are used, etc. '
+        'If 1 (default) is given, pairs are loaded one after the other.',
+        type=int,
+        metavar='JOBS',
+    ),
+    "indicator_cache": Arg(
+        '--indicator-cache',
+        help='Store populated indicators in `user_data/indicator_cache/`, and reuse them while '
+        'indicator code, strategy parameters and data are unchanged.',
+        action='store_true',
+    ),
+    "backtest_float_math": Arg(
+        '--backtest-float-math',
+        help='Calculate trade values and profits with float math instead of precise '
+        '(string based) math. Considerably faster, but results may differ in the last digits.',
+        action='store_true',
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
@@ -262,6 +316,19 @@ AVAILABLE_CLI_OPTIONS = {
         action='store_true',
         default=False,
     ),
+    "epoch_cache": Arg(
+        '--epoch-cache',
+        help='Reuse results of epochs with identical parameters (of this run, or of earlier '
+        'runs with identical strategy, configuration and data) instead of backtesting them.',
+        action='store_true',
+    ),
+    "hyperopt_scheduler": Arg(
+        '--hyperopt-scheduler',
+        help='Scheduling of epochs. `batch` evaluates epochs in batches of `-j` epochs, '
+        '`async` starts a new epoch as soon as any epoch finished '
+        f'(default: `{constants.HYPEROPT_SCHEDULER_DEFAULT}`).',
+        choices=constants.HYPEROPT_SCHEDULERS,
+    ),
 
     "print_all": Arg(
         '--print-all',
@@ -463,6 +530,21 @@ AVAILABLE_CLI_OPTIONS = {
         help='Allow data prepending. (Data-appending is disabled)',
         action='store_true',
     ),
+    "download_jobs": Arg(
+        '--download-jobs',
+        help='Download candle (OHLCV) data of this many pairs / timeframes concurrently. '
+        'Data is stored in chunks, so interrupted downloads resume from the last chunk. '
+        'Default: `1`.',
+        type=check_int_positive,
+        metavar='JOBS',
+    ),
+    "convert_jobs": Arg(
+        '--convert-jobs',
+        help='Convert trades of this many pairs concurrently (in worker processes). '
+        'Default: `1`.',
+        type=check_int_positive,
+        metavar='JOBS',
+    ),
     "erase": Arg(
         '--erase',
         help='Clean all existing data for the selected exchange/pairs/timeframes.',
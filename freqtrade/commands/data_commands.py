@@ -78,6 +78,7 @@ def start_convert_trades(args: Dict[str, Any]) -> None:
         datadir=config['datadir'], timerange=timerange, erase=bool(config.get('erase')),
         data_format_ohlcv=config['dataformat_ohlcv'],
         data_format_trades=config['dataformat_trades'],
+        convert_jobs=config.get('convert_jobs', 1),
     )
 
 
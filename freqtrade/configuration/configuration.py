@@ -276,6 +276,27 @@ class Configuration:
         self._args_to_config(config, argname='backtest_cache',
                              logstring='Parameter --cache={} detected ...')
 
+        self._args_to_config(config, argname='backtest_engine',
+                             logstring='Parameter --backtest-engine={} detected ...')
+
+        self._args_to_config(config, argname='backtest_jobs',
+                             logstring='Parameter --backtest-jobs detected: {}')
+
+        self._args_to_config(config, argname='indicator_jobs',
+                             logstring='Parameter --indicator-jobs detected: {}')
+
+        self._args_to_config(config, argname='indicator_pool',
+                             logstring='Parameter --indicator-pool detected: {}')
+
+        self._args_to_config(config, argname='indicator_cache',
+                             logstring='Parameter --indicator-cache detected.')
+
+        self._args_to_config(config, argname='data_load_jobs',
+                             logstring='Parameter --data-load-jobs detected: {}')
+
+        self._args_to_config(config, argname='backtest_float_math',
+                             logstring='Parameter --backtest-float-math detected.')
+
         self._args_to_config(config, argname='disableparamexport',
                              logstring='Parameter --disableparamexport detected: {} ...')
 
@@ -314,6 +335,12 @@ class Configuration:
         self._args_to_config(config, argname='analyze_per_epoch',
                              logstring='Parameter --analyze-per-epoch detected.')
 
+        self._args_to_config(config, argname='epoch_cache',
+                             logstring='Parameter --epoch-cache detected.')
+
+        self._args_to_config(config, argname='hyperopt_scheduler',
+                             logstring='Using hyperopt scheduler: {}')
+
         self._args_to_config(config, argname='print_all',
                              logstring='Parameter --print-all detected ...')
 
@@ -414,6 +441,10 @@ class Configuration:
 
         self._args_to_config(config, argname='prepend_data',
                              logstring='Prepend detected. Allowing data prepending.')
+        self._args_to_config(config, argname='download_jobs',
+                             logstring='Downloading {} pairs / timeframes concurrently.')
+        self._args_to_config(config, argname='convert_jobs',
+                             logstring='Converting trades of {} pairs concurrently.')
         self._args_to_config(config, argname='erase',
                              logstring='Erase detected. Deleting existing data.')
 
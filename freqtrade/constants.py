@@ -39,10 +39,16 @@ AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList', 'ProducerPairList', '
 AVAILABLE_PROTECTIONS = ['CooldownPeriod',
                          'LowProfitPairs', 'MaxDrawdown', 'StoplossGuard']
 AVAILABLE_DATAHANDLERS_TRADES = ['json', 'jsongz', 'hdf5', 'feather']
-AVAILABLE_DATAHANDLERS = AVAILABLE_DATAHANDLERS_TRADES + ['parquet']
+AVAILABLE_DATAHANDLERS = AVAILABLE_DATAHANDLERS_TRADES + ['parquet', 'partitioned', 'arrow']
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
 BACKTEST_CACHE_AGE = ['none', 'day', 'week', 'month']
 BACKTEST_CACHE_DEFAULT = 'day'
+BACKTEST_ENGINES = ['lists', 'columnar']
+BACKTEST_ENGINE_DEFAULT = 'lists'
+HYPEROPT_SCHEDULERS = ['batch', 'async']
+HYPEROPT_SCHEDULER_DEFAULT = 'batch'
+INDICATOR_POOLS = ['threads', 'processes']
+INDICATOR_POOL_DEFAULT = 'threads'
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = '%Y-%m-%d %H:%M:%S'
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -120,6 +126,8 @@ CONF_SCHEMA = {
     'properties': {
         'max_open_trades': {'type': ['integer', 'number'], 'minimum': -1},
         'new_pairs_days': {'type': 'integer', 'default': 30},
+        'download_jobs': {'type': 'integer', 'minimum': 1},
+        'convert_jobs': {'type': 'integer', 'minimum': 1},
         'timeframe': {'type': 'string'},
         'stake_currency': {'type': 'string'},
         'stake_amount': {
@@ -146,6 +154,9 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'incremental_analysis': {'type': 'boolean'},
+        'incremental_analysis_full_interval': {'type': 'integer', 'minimum': 1},
+        'analysis_jobs': {'type': 'integer'},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -174,6 +185,14 @@ CONF_SCHEMA = {
             'type': 'array',
             'items': {'type': 'string', 'enum': BACKTEST_BREAKDOWNS}
         },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES},
+        'backtest_jobs': {'type': 'integer'},
+        'indicator_jobs': {'type': 'integer'},
+        'indicator_pool': {'type': 'string', 'enum': INDICATOR_POOLS},
+        'indicator_cache': {'type': 'boolean'},
+        'data_load_jobs': {'type': 'integer'},
+        'backtest_float_math': {'type': 'boolean'},
+        'backtest_wallet_check': {'type': 'boolean'},
         'bot_name': {'type': 'string'},
         'unfilledtimeout': {
             'type': 'object',
@@ -431,6 +450,8 @@ CONF_SCHEMA = {
         'db_url': {'type': 'string'},
         'export': {'type': 'string', 'enum': EXPORT_OPTIONS, 'default': 'trades'},
         'disableparamexport': {'type': 'boolean'},
+        'epoch_cache': {'type': 'boolean'},
+        'hyperopt_scheduler': {'type': 'string', 'enum': HYPEROPT_SCHEDULERS},
         'initial_state': {'type': 'string', 'enum': ['running', 'stopped']},
         'force_entry_enable': {'type': 'boolean'},
         'disable_dataframe_checks': {'type': 'boolean'},
@@ -483,6 +504,8 @@ CONF_SCHEMA = {
                 'unknown_fee_rate': {'type': 'number'},
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
+                'enable_ws': {'type': 'boolean'},
+                'resample_higher_timeframes': {'type': 'boolean'},
                 'ccxt_config': {'type': 'object'},
                 'ccxt_async_config': {'type': 'object'}
             },
@@ -4,7 +4,7 @@ Functions to convert data from one format to another
 import itertools
 import logging
 from operator import itemgetter
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 import numpy as np
 import pandas as pd
@@ -61,6 +61,15 @@ def clean_ohlcv_dataframe(data: DataFrame, timeframe: str, pair: str, *,
     :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
     :return: DataFrame
     """
+    if _ohlcv_is_clean(data, timeframe, fill_missing):
+        # Nothing to clean - avoid copying the candles.
+        if drop_incomplete:
+            data = data.iloc[:-1]
+            logger.debug('Dropping last candle')
+        data = data.copy(deep=False)
+        data.index = pd.RangeIndex(len(data))
+        return data
+
     # group by index and aggregate results to eliminate duplicate ticks
     data = data.groupby(by='date', as_index=False, sort=True).agg({
         'open': 'first',
@@ -80,6 +89,31 @@ def clean_ohlcv_dataframe(data: DataFrame, timeframe: str, pair: str, *,
         return data
 
 
+def _ohlcv_is_clean(data: DataFrame, timeframe: str, fill_missing: bool) -> bool:
+    """
+    Check if clean_ohlcv_dataframe() would return the candles unchanged.
+    Candles must be sorted by date without duplicates - and, if missing candles are filled,
+    without gaps or missing values and aligned to the timeframe.
+    """
+    from freqtrade.exchange import timeframe_to_msecs
+
+    if (data.empty or list(data.columns) != DEFAULT_DATAFRAME_COLUMNS
+            or not pd.api.types.is_datetime64_any_dtype(data['date'])):
+        return False
+    dates = data['date'].values.view(np.int64)
+    steps = np.diff(dates)
+    if not fill_missing:
+        return bool((steps > 0).all())
+    timeframe_ns = timeframe_to_msecs(timeframe) * 1_000_000
+    # Missing candles are filled by resampling, with bins starting at the start of the day
+    day_ns = 86400 * 1_000_000_000
+    return bool(
+        (dates[0] % day_ns) % timeframe_ns == 0
+        and (steps == timeframe_ns).all()
+        and not any(data[col].isna().any() for col in DEFAULT_DATAFRAME_COLUMNS[1:])
+    )
+
+
 def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
     """
     Fills up missing data with 0 volume rows,
@@ -122,6 +156,33 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     return df
 
 
+def ohlcv_resample(dataframe: DataFrame, timeframe: str) -> DataFrame:
+    """
+    Resample candle (OHLCV) data to a higher timeframe.
+    :param dataframe: DataFrame containing candle (OHLCV) data
+    :param timeframe: Timeframe to resample to. Must be a multiple of the dataframe's timeframe,
+                      and divide a day.
+    :return: DataFrame with candles of the new timeframe. Candles are aligned to the start of
+             the day - so the first and last candle may be incomplete.
+    :raises: ValueError if the timeframe doesn't divide a day - exchanges align these
+             differently (e.g. weekly candles starting on monday).
+    """
+    from freqtrade.exchange import timeframe_to_minutes
+
+    minutes = timeframe_to_minutes(timeframe)
+    if 1440 % minutes != 0:
+        raise ValueError(f'Cannot resample to timeframe {timeframe}.')
+
+    df = dataframe.resample(f'{minutes}min', on='date').agg({
+        'open': 'first',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last',
+        'volume': 'sum',
+    })
+    return df.reset_index()
+
+
 def trim_dataframe(df: DataFrame, timerange, df_date_col: str = 'date',
                    startup_candles: int = 0) -> DataFrame:
     """
@@ -132,14 +193,22 @@ def trim_dataframe(df: DataFrame, timerange, df_date_col: str = 'date',
     :param startup_candles: When not 0, is used instead the timerange start date
     :return: trimmed dataframe
     """
+    # Slicing sorted data avoids copying the dataframe
+    is_sorted = df[df_date_col].is_monotonic_increasing
     if startup_candles:
         # Trim candles instead of timeframe in case of given startup_candle count
         df = df.iloc[startup_candles:, :]
     else:
         if timerange.starttype == 'date':
-            df = df.loc[df[df_date_col] >= timerange.startdt, :]
+            if is_sorted:
+                df = df.iloc[df[df_date_col].searchsorted(timerange.startdt, side='left'):, :]
+            else:
+                df = df.loc[df[df_date_col] >= timerange.startdt, :]
     if timerange.stoptype == 'date':
-        df = df.loc[df[df_date_col] <= timerange.stopdt, :]
+        if is_sorted:
+            df = df.iloc[:df[df_date_col].searchsorted(timerange.stopdt, side='right'), :]
+        else:
+            df = df.loc[df[df_date_col] <= timerange.stopdt, :]
     return df
 
 
@@ -217,14 +286,54 @@ def trades_to_ohlcv(trades: TradeList, timeframe: str) -> DataFrame:
     :return: OHLCV Dataframe.
     :raises: ValueError if no trades are provided
     """
-    from freqtrade.exchange import timeframe_to_minutes
-    timeframe_minutes = timeframe_to_minutes(timeframe)
     if not trades:
         raise ValueError('Trade-list empty.')
+    return _trades_df_to_ohlcv(_trades_to_dataframe(trades), timeframe)
+
+
+def trades_chunks_to_ohlcv(trades_chunks: Iterable[TradeList],
+                           timeframes: List[str]) -> Dict[str, DataFrame]:
+    """
+    Converts time-ordered chunks of trades to OHLCV data of multiple timeframes,
+    in one pass over the trades - only one chunk of trades is kept in memory.
+    :param trades_chunks: Iterable of trades lists, sorted by timestamp
+    :param timeframes: Timeframes to resample data to
+    :return: Dict of timeframe: OHLCV Dataframe
+    :raises: ValueError if no trades are provided
+    """
+    candles: Dict[str, List[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    for trades in trades_chunks:
+        if not trades:
+            continue
+        df = _trades_to_dataframe(trades)
+        for timeframe in timeframes:
+            candles[timeframe].append(_trades_df_to_ohlcv(df, timeframe))
+
+    result: Dict[str, DataFrame] = {}
+    for timeframe, frames in candles.items():
+        if not frames:
+            raise ValueError('Trade-list empty.')
+        # Combine candles spanning multiple chunks
+        result[timeframe] = pd.concat(frames).groupby('date', as_index=False, sort=True).agg({
+            'open': 'first',
+            'high': 'max',
+            'low': 'min',
+            'close': 'last',
+            'volume': 'sum',
+        })
+    return result
+
+
+def _trades_to_dataframe(trades: TradeList) -> DataFrame:
     df = pd.DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS)
     df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms',
                                      utc=True,)
-    df = df.set_index('timestamp')
+    return df.set_index('timestamp')
+
+
+def _trades_df_to_ohlcv(df: DataFrame, timeframe: str) -> DataFrame:
+    from freqtrade.exchange import timeframe_to_minutes
+    timeframe_minutes = timeframe_to_minutes(timeframe)
 
     df_new = df['price'].resample(f'{timeframe_minutes}min').ohlc()
     df_new['volume'] = df['amount'].resample(f'{timeframe_minutes}min').sum()
@@ -425,7 +425,77 @@ class DataProvider:
         if self._exchange is None:
             raise OperationalException(NO_EXCHANGE_EXCEPTION)
         final_pairs = (pairlist + helping_pairs) if helping_pairs else pairlist
-        self._exchange.refresh_latest_ohlcv(final_pairs)
+        if not self._config.get('exchange', {}).get('resample_higher_timeframes', False):
+            self._exchange.refresh_latest_ohlcv(final_pairs)
+            return
+
+        resampled = self._plan_resampling(final_pairs)
+        self._exchange.refresh_latest_ohlcv(
+            [pair_key for pair_key in final_pairs if pair_key not in resampled])
+        # Fetch candles which can't be resampled from the exchange (e.g. new pairs)
+        missing = [pair_key for pair_key, base_key in resampled.items()
+                   if not self._exchange.resample_latest_ohlcv(pair_key, base_key)]
+        if missing:
+            self._exchange.refresh_latest_ohlcv(missing)
+
+    def _plan_resampling(
+            self, pairs: ListPairsWithTimeframes) -> Dict[PairWithTimeframe, PairWithTimeframe]:
+        """
+        Plan which candles to resample instead of fetching them from the exchange.
+        Candles are only resampled if the requests due exceed the exchange's request budget
+        of one bot iteration - and only as many as necessary to stay within the budget,
+        starting with the timeframes requiring the fewest lower timeframe candles.
+        Otherwise all candles are fetched, as resampled candles may differ slightly from
+        candles of the exchange (e.g. for missing trades).
+        :param pairs: List of (pair, timeframe, candle_type) to refresh
+        :return: Dict of (pair, timeframe, candle_type) to resample, mapped to the
+            (pair, timeframe, candle_type) to resample from.
+        """
+        if self._exchange is None:
+            raise OperationalException(NO_EXCHANGE_EXCEPTION)
+        due = self._exchange.ohlcv_requests_due(pairs)
+        excess = len(due) - self._exchange.ohlcv_request_budget()
+        if excess <= 0:
+            return {}
+        resampleable = self._get_resampled_pairs(pairs)
+        candidates = sorted(
+            (pair_key for pair_key in due if pair_key in resampleable),
+            key=lambda pair_key: (timeframe_to_seconds(pair_key[1])
+                                  // timeframe_to_seconds(resampleable[pair_key][1]), pair_key))
+        resampled = {pair_key: resampleable[pair_key] for pair_key in candidates[:excess]}
+        logger.debug(f"{len(due)} candle requests exceed the request budget by {excess}, "
+                     f"resampling {len(resampled)} timeframes.")
+        return resampled
+
+    @staticmethod
+    def _get_resampled_pairs(
+            pairs: ListPairsWithTimeframes) -> Dict[PairWithTimeframe, PairWithTimeframe]:
+        """
+        Plan which candles can be refreshed by resampling fetched candles of a lower timeframe
+        of the same pair - instead of fetching them from the exchange.
+        Only timeframes dividing a day are resampled, as exchanges may align longer
+        timeframes differently (e.g. weekly candles starting on monday).
+        :param pairs: List of (pair, timeframe, candle_type) to refresh
+        :return: Dict of (pair, timeframe, candle_type) to resample, mapped to the
+            (pair, timeframe, candle_type) to resample from.
+        """
+        timeframes: Dict[Tuple[str, CandleType], List[str]] = {}
+        for pair, timeframe, candle_type in set(pairs):
+            if candle_type in (CandleType.SPOT, CandleType.FUTURES):
+                timeframes.setdefault((pair, candle_type), []).append(timeframe)
+
+        resampled: Dict[PairWithTimeframe, PairWithTimeframe] = {}
+        for (pair, candle_type), pair_timeframes in timeframes.items():
+            fetched: List[str] = []
+            for timeframe in sorted(pair_timeframes, key=timeframe_to_seconds):
+                seconds = timeframe_to_seconds(timeframe)
+                base = next((base for base in reversed(fetched)
+                             if seconds % timeframe_to_seconds(base) == 0), None)
+                if base and 86400 % seconds == 0:
+                    resampled[(pair, timeframe, candle_type)] = (pair, base, candle_type)
+                else:
+                    fetched.append(timeframe)
+        return resampled
 
     @property
     def available_pairs(self) -> ListPairsWithTimeframes:
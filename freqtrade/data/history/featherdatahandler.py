@@ -1,7 +1,11 @@
 import logging
-from typing import Optional
+from typing import Iterator, List, Optional
 
-from pandas import DataFrame, read_feather, to_datetime
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame, DatetimeTZDtype, read_feather, to_datetime
+from pandas.arrays import DatetimeArray
+from pyarrow import feather
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS, TradeList
@@ -120,6 +124,100 @@ class FeatherDataHandler(IDataHandler):
 
         return tradesdata.values.tolist()
 
+    def _trades_iter(self, pair: str, timerange: Optional[TimeRange],
+                     chunk_size: int) -> Iterator[TradeList]:
+        """
+        Read trades in chunks - the file is read one record batch at a time.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return
+        with pa.memory_map(str(filename)) as source:
+            reader = pa.ipc.open_file(source)
+            batches: List[pa.RecordBatch] = []
+            rows = 0
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                batches.append(batch)
+                rows += batch.num_rows
+                while rows >= chunk_size:
+                    table = pa.Table.from_batches(batches)
+                    yield table.slice(0, chunk_size).to_pandas().values.tolist()
+                    batches = table.slice(chunk_size).to_batches()
+                    rows -= chunk_size
+            if rows:
+                yield pa.Table.from_batches(batches).to_pandas().values.tolist()
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
+
+
+class ArrowDataHandler(FeatherDataHandler):
+    """
+    Stores OHLCV data as uncompressed Arrow IPC files, which are memory-mapped when loading.
+    Loaded dataframes are zero-copy views on the file - the operating system pages candles
+    in and out of memory as needed, so the data doesn't have to fit into RAM.
+    Columns of loaded dataframes are read-only.
+    """
+
+    def ohlcv_store(
+            self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
+        """
+        Store data as uncompressed Arrow IPC file, in one record batch.
+        The file is replaced atomically, so dataframes mapping the prior file remain valid.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        tmp_filename = filename.with_name(f"{filename.name}.tmp")
+        data.reset_index(drop=True).loc[:, self._columns].to_feather(
+            tmp_filename, compression='uncompressed', chunksize=max(len(data), 1))
+        tmp_filename.replace(filename)
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange], candle_type: CandleType
+                    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Memory-maps the file and returns a dataframe backed by the mapped file.
+        Files containing multiple record batches or compressed files (e.g. written by the
+        feather datahandler) are loaded into memory instead.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Optionally implemented by subclasses to avoid loading
+                        all data where possible.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._pair_data_filename(
+            self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True)
+            if not filename.exists():
+                return DataFrame(columns=self._columns)
+
+        table = feather.read_table(filename, memory_map=True)
+        columns = {}
+        for name, column in zip(self._columns, table.itercolumns()):
+            array = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+            if name == 'date':
+                array = array.cast(pa.timestamp('ns', tz='UTC'))
+                columns[name] = DatetimeArray(array.to_numpy(zero_copy_only=False),
+                                              dtype=DatetimeTZDtype(tz='UTC'), copy=False)
+            else:
+                columns[name] = np.asarray(array.to_numpy(zero_copy_only=False), dtype=np.float64)
+        return DataFrame(columns, copy=False)
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "arrow"
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 import numpy as np
 import pandas as pd
@@ -131,11 +131,23 @@ class HDF5DataHandler(IDataHandler):
         :param timerange: Timerange to load trades for - currently not implemented
         :return: List of trades
         """
+        trades = list(self._trades_read(pair, timerange))
+        return trades[0] if trades else []
+
+    def _trades_iter(self, pair: str, timerange: Optional[TimeRange],
+                     chunk_size: int) -> Iterator[TradeList]:
+        """
+        Read trades in chunks - only one chunk is read from the file at a time.
+        """
+        yield from self._trades_read(pair, timerange, chunk_size)
+
+    def _trades_read(self, pair: str, timerange: Optional[TimeRange],
+                     chunk_size: Optional[int] = None) -> Iterator[TradeList]:
         key = self._pair_trades_key(pair)
         filename = self._pair_trades_filename(self._datadir, pair)
 
         if not filename.exists():
-            return []
+            return
         where = []
         if timerange:
             if timerange.starttype == 'date':
@@ -143,9 +155,13 @@ class HDF5DataHandler(IDataHandler):
             if timerange.stoptype == 'date':
                 where.append(f"timestamp < {timerange.stopts * 1e3}")
 
-        trades: pd.DataFrame = pd.read_hdf(filename, key=key, mode="r", where=where)
-        trades[['id', 'type']] = trades[['id', 'type']].replace({np.nan: None})
-        return trades.values.tolist()
+        if chunk_size is None:
+            chunks = [pd.read_hdf(filename, key=key, mode="r", where=where)]
+        else:
+            chunks = pd.read_hdf(filename, key=key, mode="r", where=where, chunksize=chunk_size)
+        for trades in chunks:
+            trades[['id', 'type']] = trades[['id', 'type']].replace({np.nan: None})
+            yield trades.values.tolist()
 
     @classmethod
     def _get_file_extension(cls):
@@ -1,27 +1,35 @@
+import asyncio
 import logging
 import operator
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import rapidjson
+from joblib import Parallel, delayed, effective_n_jobs
 from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import (DATETIME_PRINT_FORMAT, DEFAULT_DATAFRAME_COLUMNS,
-                                 DL_DATA_TIMEFRAMES, Config)
+                                 DL_DATA_TIMEFRAMES, Config, TradeList)
 from freqtrade.data.converter import (clean_ohlcv_dataframe, ohlcv_to_dataframe,
-                                      trades_remove_duplicates, trades_to_ohlcv)
+                                      trades_chunks_to_ohlcv, trades_remove_duplicates)
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange import Exchange
+from freqtrade.exchange import Exchange, timeframe_to_msecs
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
-from freqtrade.util import format_ms_time
+from freqtrade.util import dt_ts, format_ms_time
 from freqtrade.util.binance_mig import migrate_binance_futures_data
 
 
 logger = logging.getLogger(__name__)
 
+# Number of candle requests per pair downloaded before appending them to the download journal
+# (checkpoint)
+DOWNLOAD_CHUNK_CALLS = 100
+
 
 def load_pair_history(pair: str,
                       timeframe: str,
@@ -72,6 +80,8 @@ def load_data(datadir: Path,
               data_format: str = 'json',
               candle_type: CandleType = CandleType.SPOT,
               user_futures_funding_rate: Optional[int] = None,
+              load_jobs: int = 1,
+              progress_callback: Optional[Callable[[], Any]] = None,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -85,6 +95,8 @@ def load_data(datadir: Path,
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param load_jobs: Number of pairs to load concurrently. -1 uses all CPUs.
+    :param progress_callback: Called once for every loaded pair
     :return: dict(<pair>:<Dataframe>)
     """
     result: Dict[str, DataFrame] = {}
@@ -93,14 +105,17 @@ def load_data(datadir: Path,
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,
-                                 datadir=datadir, timerange=timerange,
-                                 fill_up_missing=fill_up_missing,
-                                 startup_candles=startup_candles,
-                                 data_handler=data_handler,
-                                 candle_type=candle_type,
-                                 )
+    histories = _load_pairs_history(pairs, load_jobs, data_format,
+                                    timeframe=timeframe,
+                                    datadir=datadir, timerange=timerange,
+                                    fill_up_missing=fill_up_missing,
+                                    startup_candles=startup_candles,
+                                    data_handler=data_handler,
+                                    candle_type=candle_type,
+                                    )
+    for pair, hist in zip(pairs, histories):
+        if progress_callback:
+            progress_callback()
         if not hist.empty:
             result[pair] = hist
         else:
@@ -114,6 +129,76 @@ def load_data(datadir: Path,
     return result
 
 
+class _LogRecordCollector(logging.Handler):
+    """
+    Collects log records of a worker process, to emit them in the main process.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Format the message, arguments and exceptions may not be picklable
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _call_with_logs(func: Callable, log_level: int,
+                    **kwargs) -> Tuple[Any, List[logging.LogRecord]]:
+    """
+    Call func in a worker process - returning the result and the log records created.
+    """
+    root_logger = logging.getLogger()
+    collector = _LogRecordCollector()
+    root_logger.addHandler(collector)
+    root_logger.setLevel(log_level)
+    try:
+        return func(**kwargs), collector.records
+    finally:
+        root_logger.removeHandler(collector)
+
+
+def _run_in_processes(jobs: int, func: Callable, calls: Iterable[Dict[str, Any]]) -> Iterator:
+    """
+    Call func with each of the keyword arguments in calls, in worker processes.
+    Log records of the workers are emitted in the main process.
+    :return: Iterator of results, in the order of calls
+    """
+    log_level = logger.getEffectiveLevel()
+    results = Parallel(n_jobs=jobs, return_as='generator')(
+        delayed(_call_with_logs)(func, log_level, **kwargs) for kwargs in calls)
+    for result, records in results:
+        for record in records:
+            record_logger = logging.getLogger(record.name)
+            if record_logger.isEnabledFor(record.levelno):
+                record_logger.handle(record)
+        yield result
+
+
+def _load_pairs_history(pairs: List[str], load_jobs: int, data_format: Optional[str],
+                        **kwargs) -> Iterable[DataFrame]:
+    """
+    Load multiple pairs, concurrently if load_jobs is not 1.
+    Json data is parsed in worker processes, while other formats are loaded in threads.
+    :return: Iterable of dataframes, in the order of pairs
+    """
+    jobs = min(effective_n_jobs(load_jobs), len(pairs))
+    if jobs <= 1:
+        return (load_pair_history(pair=pair, **kwargs) for pair in pairs)
+
+    if data_format not in ('json', 'jsongz'):
+        logger.info(f"Loading data for {len(pairs)} pairs using {jobs} threads.")
+        return Parallel(n_jobs=jobs, backend='threading', return_as='generator')(
+            delayed(load_pair_history)(pair=pair, **kwargs) for pair in pairs)
+
+    logger.info(f"Loading data for {len(pairs)} pairs using {jobs} worker processes.")
+    return _run_in_processes(jobs, load_pair_history,
+                             ({'pair': pair, **kwargs} for pair in pairs))
+
+
 def refresh_data(*, datadir: Path,
                  timeframe: str,
                  pairs: List[str],
@@ -246,16 +331,7 @@ def _download_pair_history(pair: str, *,
                                                candle_type=candle_type,
                                                until_ms=until_ms if until_ms else None
                                                )
-        # TODO: Maybe move parsing to exchange class (?)
-        new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
-                                           fill_missing=False, drop_incomplete=True)
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
-                                         fill_missing=False, drop_incomplete=False)
+        data = _merge_downloaded_data(data, new_data, timeframe, pair)
 
         logger.debug("New Start: %s",
                      f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
@@ -274,22 +350,233 @@ def _download_pair_history(pair: str, *,
         return False
 
 
+def _merge_downloaded_data(data: DataFrame, new_data: List, timeframe: str,
+                           pair: str, drop_incomplete: bool = True) -> DataFrame:
+    """
+    Combine stored candles with downloaded candles.
+    """
+    # TODO: Maybe move parsing to exchange class (?)
+    new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
+                                       fill_missing=False, drop_incomplete=drop_incomplete)
+    if data.empty:
+        return new_dataframe
+    # Run cleaning again to ensure there were no duplicate candles
+    # Especially between existing and new data.
+    return clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
+                                 fill_missing=False, drop_incomplete=False)
+
+
+def _download_journal(data_handler: IDataHandler, pair: str, timeframe: str,
+                      candle_type: CandleType) -> Path:
+    """
+    Append-only file of downloaded candles which are not stored yet - one chunk per line.
+    """
+    filename = data_handler._pair_data_filename(
+        data_handler._datadir, pair, timeframe, candle_type)
+    return filename.with_name(f'{filename.name}.download')
+
+
+def _append_download_journal(journal: Path, candles: List) -> None:
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    with journal.open('a') as fp:
+        fp.write(rapidjson.dumps(candles, number_mode=rapidjson.NM_NATIVE) + '\n')
+
+
+def _store_download_journal(pair: str, timeframe: str, candle_type: CandleType,
+                            data_handler: IDataHandler, data: Optional[DataFrame] = None
+                            ) -> Optional[DataFrame]:
+    """
+    Store the candles of the download journal with the stored data, and remove the journal.
+    :param data: Stored data, if already loaded
+    :return: Stored data, or None if there is no download journal.
+    """
+    journal = _download_journal(data_handler, pair, timeframe, candle_type)
+    if not journal.is_file():
+        return None
+    chunks = []
+    with journal.open() as fp:
+        for line in fp:
+            try:
+                chunks.append(rapidjson.loads(line, number_mode=rapidjson.NM_NATIVE))
+            except ValueError:
+                # Last chunk of an interrupted download may be incomplete
+                break
+    if data is None:
+        data = data_handler.ohlcv_load(pair, timeframe, candle_type=candle_type,
+                                       fill_missing=False, warn_no_data=False)
+    candles = list(chain.from_iterable(chunks))
+    if candles:
+        data = _merge_downloaded_data(data, candles, timeframe, pair, drop_incomplete=False)
+        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+    journal.unlink()
+    return data
+
+
+async def _async_download_pair_history(pair: str, *,
+                                       datadir: Path,
+                                       exchange: Exchange,
+                                       timeframe: str,
+                                       process: str,
+                                       new_pairs_days: int,
+                                       data_handler: IDataHandler,
+                                       timerange: Optional[TimeRange],
+                                       candle_type: CandleType,
+                                       erase: bool,
+                                       prepend: bool,
+                                       ) -> bool:
+    """
+    Download candles like _download_pair_history(), appending them to a download journal
+    after every DOWNLOAD_CHUNK_CALLS requests. The journal is stored with the existing data
+    once the download ends - or on the next download, if the download has been interrupted.
+    An interrupted download therefore resumes from the last chunk appended to the journal.
+    Chunks are downloaded from the newest to the oldest candle when prepending, so stored
+    data never has a gap.
+    Files are written in the default executor, to not block the event loop.
+    :return: bool with success state
+    """
+    loop = asyncio.get_running_loop()
+    journal = _download_journal(data_handler, pair, timeframe, candle_type)
+    data: Optional[DataFrame] = None
+    try:
+        if erase:
+            journal.unlink(missing_ok=True)
+            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
+        elif await loop.run_in_executor(None, _store_download_journal,
+                                        pair, timeframe, candle_type, data_handler) is not None:
+            logger.info(f'Stored candles of an interrupted download of "{pair}", {timeframe}, '
+                        f'{candle_type}.')
+
+        data, since_ms, until_ms = _load_cached_data_for_updating(
+            pair, timeframe, timerange,
+            data_handler=data_handler,
+            candle_type=candle_type,
+            prepend=prepend)
+
+        logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
+                    f'{candle_type} and store in {datadir}. '
+                    f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+                    f'{format_ms_time(until_ms) if until_ms else "now"}'
+                    )
+        start_ms = since_ms or int(
+            (datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+        end_ms = until_ms or dt_ts()
+        chunk_ms = DOWNLOAD_CHUNK_CALLS * timeframe_to_msecs(timeframe) * (
+            exchange.ohlcv_candle_limit(timeframe, candle_type, start_ms))
+
+        chunks = [(since, min(since + chunk_ms, end_ms))
+                  for since in range(start_ms, end_ms, chunk_ms)]
+        is_new_pair = data.empty
+        for chunk_since, chunk_until in (reversed(chunks) if prepend else chunks):
+            last_chunk = chunk_until == end_ms
+            _, _, _, new_data, _ = await exchange._async_get_historic_ohlcv(
+                pair=pair, timeframe=timeframe, since_ms=chunk_since,
+                until_ms=until_ms if last_chunk else chunk_until,
+                is_new_pair=is_new_pair, raise_=True, candle_type=candle_type)
+            if last_chunk:
+                # Drop the incomplete candle
+                new_data = new_data[:-1]
+            else:
+                # Only the last candle of the last chunk may be incomplete
+                new_data = [candle for candle in new_data if candle[0] < chunk_until]
+            if not new_data:
+                continue
+            is_new_pair = False
+            await loop.run_in_executor(None, _append_download_journal, journal, new_data)
+        success = True
+
+    except Exception:
+        logger.exception(
+            f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+        )
+        success = False
+
+    try:
+        # Also store candles of failed downloads - retries resume from there.
+        data = await loop.run_in_executor(None, _store_download_journal,
+                                          pair, timeframe, candle_type, data_handler, data)
+    except Exception:
+        logger.exception(
+            f'Failed to store history data for pair: "{pair}", timeframe: {timeframe}.'
+        )
+        return False
+    if data is not None:
+        logger.info(f"Downloaded data for {pair}, {timeframe}, {candle_type} "
+                    f"with length {len(data)}.")
+    return success
+
+
+def _download_pairs_history(jobs: List[Tuple[str, str, CandleType, str]], *,
+                            download_jobs: int, exchange: Exchange, **kwargs
+                            ) -> List[Tuple[str, str, CandleType]]:
+    """
+    Download multiple pairs / timeframes concurrently, in the exchange's event loop.
+    Requests of all downloads share the exchange's rate limit (ccxt throttling) - so
+    downloads are bounded by the rate limit, instead of the latency of individual requests.
+    :param jobs: List of (pair, timeframe, candle_type, process) to download
+    :param download_jobs: Number of pairs / timeframes to download at the same time
+    :param kwargs: Passed to _async_download_pair_history()
+    :return: List of (pair, timeframe, candle_type) which failed to download
+    """
+    async def download_all():
+        semaphore = asyncio.Semaphore(download_jobs)
+
+        async def download(pair: str, timeframe: str, candle_type: CandleType, process: str):
+            async with semaphore:
+                return await _async_download_pair_history(
+                    pair, exchange=exchange, timeframe=timeframe, candle_type=candle_type,
+                    process=process, **kwargs)
+
+        return await asyncio.gather(*(download(*job) for job in jobs))
+
+    with exchange._loop_lock:
+        results = exchange.loop.run_until_complete(download_all())
+    failed = [job[:3] for job, success in zip(jobs, results) if not success]
+    if failed:
+        failed_jobs = ', '.join(f'{pair} {timeframe} {candle_type}'
+                                for pair, timeframe, candle_type in failed)
+        logger.warning(f"Failed to download {len(failed)} of {len(jobs)} pairs / timeframes: "
+                       f"{failed_jobs}. Run download-data again to resume these downloads.")
+    return failed
+
+
 def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],
                                 datadir: Path, trading_mode: str,
                                 timerange: Optional[TimeRange] = None,
                                 new_pairs_days: int = 30, erase: bool = False,
                                 data_format: Optional[str] = None,
                                 prepend: bool = False,
+                                download_jobs: int = 1,
                                 ) -> List[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param download_jobs: Number of pairs / timeframes to download concurrently.
     :return: List of pairs that are not available.
     """
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
     process = ''
+    if download_jobs > 1:
+        jobs: List[Tuple[str, str, CandleType, str]] = []
+        for idx, pair in enumerate(pairs, start=1):
+            if pair not in exchange.markets:
+                pairs_not_available.append(pair)
+                logger.info(f"Skipping pair {pair}...")
+                continue
+            process = f'{idx}/{len(pairs)}'
+            jobs.extend((pair, str(timeframe), candle_type, process) for timeframe in timeframes)
+            if trading_mode == 'futures':
+                tf_mark = str(exchange.get_option('mark_ohlcv_timeframe'))
+                fr_candle_type = CandleType.from_string(exchange.get_option('mark_ohlcv_price'))
+                jobs.extend((pair, tf_mark, funding_candle_type, process)
+                            for funding_candle_type in (CandleType.FUNDING_RATE, fr_candle_type))
+        _download_pairs_history(jobs, download_jobs=download_jobs, exchange=exchange,
+                                datadir=datadir, data_handler=data_handler, timerange=timerange,
+                                new_pairs_days=new_pairs_days, erase=erase, prepend=prepend)
+        return pairs_not_available
+
     for idx, pair in enumerate(pairs, start=1):
         if pair not in exchange.markets:
             pairs_not_available.append(pair)
@@ -421,6 +708,62 @@ def refresh_backtest_trades_data(exchange: Exchange, pairs: List[str], datadir:
     return pairs_not_available
 
 
+def _convert_pair_trades_to_ohlcv(
+    pair: str,
+    timeframes: List[str],
+    erase: bool,
+    data_handler_ohlcv: IDataHandler,
+    data_handler_trades: IDataHandler,
+    candle_type: CandleType,
+) -> None:
+    """
+    Convert the trades of one pair to ohlcv data of all timeframes, in one pass over the trades.
+    Unless erase is set, only trades from the start of the last stored candle on are converted,
+    and the resulting candles replace the stored candles from that date on.
+    All trades are converted if the stored trades start before the stored candles.
+    """
+    existing: Dict[str, DataFrame] = {}
+    for timeframe in timeframes:
+        if erase:
+            if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                logger.info(f'Deleting existing data for pair {pair}, interval {timeframe}.')
+        else:
+            existing[timeframe] = data_handler_ohlcv.ohlcv_load(
+                pair, timeframe, candle_type, fill_missing=False, warn_no_data=False)
+
+    timerange = None
+    if existing and all(not df.empty for df in existing.values()):
+        first_candle = min(df.iloc[0]['date'] for df in existing.values())
+        first_trades: TradeList = next(data_handler_trades.trades_iter(pair, chunk_size=1), [])
+        if first_trades and first_trades[0][0] < first_candle.timestamp() * 1000:
+            # Trades have been downloaded further back since the last conversion
+            logger.info(f'Trades of {pair} start before the stored candles, '
+                        'converting all trades.')
+            existing = {}
+    if existing and all(not df.empty for df in existing.values()):
+        since = min(df.iloc[-1]['date'] for df in existing.values())
+        logger.info(f'Converting trades of {pair} since {since:{DATETIME_PRINT_FORMAT}}.')
+        timerange = TimeRange('date', None, int(since.timestamp()), 0)
+    else:
+        existing = {}
+
+    try:
+        ohlcvs = trades_chunks_to_ohlcv(
+            data_handler_trades.trades_iter(pair, timerange=timerange), timeframes)
+    except ValueError:
+        logger.exception(f'Could not convert {pair} to OHLCV.')
+        return
+
+    for timeframe, ohlcv in ohlcvs.items():
+        if timeframe in existing:
+            # Candles from the last stored candle on are complete in the converted data
+            last_date = existing[timeframe].iloc[-1]['date']
+            ohlcv = concat([existing[timeframe][existing[timeframe]['date'] < last_date],
+                            ohlcv[ohlcv['date'] >= last_date]], ignore_index=True)
+        # Store ohlcv
+        data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
+
+
 def convert_trades_to_ohlcv(
     pairs: List[str],
     timeframes: List[str],
@@ -429,26 +772,32 @@ def convert_trades_to_ohlcv(
     erase: bool = False,
     data_format_ohlcv: str = 'json',
     data_format_trades: str = 'jsongz',
-    candle_type: CandleType = CandleType.SPOT
+    candle_type: CandleType = CandleType.SPOT,
+    convert_jobs: int = 1,
 ) -> None:
     """
     Convert stored trades data to ohlcv data
+    :param convert_jobs: Number of pairs to convert concurrently (in worker processes).
     """
     data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
     data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
 
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair)
-        for timeframe in timeframes:
-            if erase:
-                if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                    logger.info(f'Deleting existing data for pair {pair}, interval {timeframe}.')
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.exception(f'Could not convert {pair} to OHLCV.')
+    calls: List[Dict[str, Any]] = [{
+        'pair': pair,
+        'timeframes': timeframes,
+        'erase': erase,
+        'data_handler_ohlcv': data_handler_ohlcv,
+        'data_handler_trades': data_handler_trades,
+        'candle_type': candle_type,
+    } for pair in pairs]
+    jobs = min(effective_n_jobs(convert_jobs), len(pairs))
+    if jobs > 1:
+        logger.info(f"Converting trades of {len(pairs)} pairs using {jobs} worker processes.")
+        for _ in _run_in_processes(jobs, _convert_pair_trades_to_ohlcv, calls):
+            pass
+    else:
+        for kwargs in calls:
+            _convert_pair_trades_to_ohlcv(**kwargs)
 
 
 def get_timerange(data: Dict[str, DataFrame]) -> Tuple[datetime, datetime]:
@@ -541,6 +890,7 @@ def download_data_main(config: Config) -> None:
                 datadir=config['datadir'], timerange=timerange, erase=bool(config.get('erase')),
                 data_format_ohlcv=config['dataformat_ohlcv'],
                 data_format_trades=config['dataformat_trades'],
+                convert_jobs=config.get('convert_jobs', 1),
             )
         else:
             if not exchange.get_option('ohlcv_has_history', True):
@@ -556,7 +906,8 @@ def download_data_main(config: Config) -> None:
                 new_pairs_days=config['new_pairs_days'],
                 erase=bool(config.get('erase')), data_format=config['dataformat_ohlcv'],
                 trading_mode=config.get('trading_mode', 'spot'),
-                prepend=config.get('prepend_data', False)
+                prepend=config.get('prepend_data', False),
+                download_jobs=config.get('download_jobs', 1),
             )
     finally:
         if pairs_not_available:
@@ -8,8 +8,9 @@ import re
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timezone
+from itertools import takewhile
 from pathlib import Path
-from typing import List, Optional, Tuple, Type
+from typing import Iterator, List, Optional, Tuple, Type
 
 from pandas import DataFrame
 
@@ -218,6 +219,47 @@ class IDataHandler(ABC):
         """
         return trades_remove_duplicates(self._trades_load(pair, timerange=timerange))
 
+    def trades_iter(self, pair: str, timerange: Optional[TimeRange] = None,
+                    chunk_size: int = 1_000_000) -> Iterator[TradeList]:
+        """
+        Load trades in chunks of time-ordered trades.
+        Removes duplicates in the process - also duplicates spanning two chunks.
+        :param pair: Load trades for this pair
+        :param timerange: Only return trades within this timerange
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of List of trades
+        """
+        # Trades of the previous chunk with the last timestamp of that chunk
+        boundary: TradeList = []
+        for trades in self._trades_iter(pair, timerange, chunk_size):
+            if timerange and (timerange.starttype == 'date' or timerange.stoptype == 'date'):
+                # Not all datahandlers filter the timerange while loading
+                trades = [t for t in trades if
+                          (timerange.starttype != 'date' or t[0] >= timerange.startts * 1000)
+                          and (timerange.stoptype != 'date' or t[0] < timerange.stopts * 1000)]
+            trades = trades_remove_duplicates(trades)
+            if boundary:
+                trades = [t for t in trades if t[0] != boundary[0][0] or t not in boundary]
+            if not trades:
+                continue
+            boundary = list(takewhile(lambda t: t[0] == trades[-1][0], reversed(trades)))
+            yield trades
+
+    def _trades_iter(self, pair: str, timerange: Optional[TimeRange],
+                     chunk_size: int) -> Iterator[TradeList]:
+        """
+        Read trades in chunks, as stored in the file.
+        Loads all trades at once - datahandlers able to read parts of a file
+        override this to limit memory usage.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for - may be ignored
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of List of trades
+        """
+        logger.warning(f"The {self._get_file_extension()} data format does not support "
+                       f"reading trades in chunks. Loading all trades of {pair} at once.")
+        yield from misc.chunks(self._trades_load(pair, timerange=timerange), chunk_size)
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -411,9 +453,15 @@ def get_datahandlerclass(datatype: str) -> Type[IDataHandler]:
     elif datatype == 'feather':
         from .featherdatahandler import FeatherDataHandler
         return FeatherDataHandler
+    elif datatype == 'arrow':
+        from .featherdatahandler import ArrowDataHandler
+        return ArrowDataHandler
     elif datatype == 'parquet':
         from .parquetdatahandler import ParquetDataHandler
         return ParquetDataHandler
+    elif datatype == 'partitioned':
+        from .partitioneddatahandler import PartitionedDataHandler
+        return PartitionedDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
@@ -1,5 +1,7 @@
+import gzip
+import json
 import logging
-from typing import Optional
+from typing import Iterator, List, Optional
 
 import numpy as np
 from pandas import DataFrame, read_json, to_datetime
@@ -15,6 +17,10 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+# Characters of the trades file read at once while reading trades in chunks
+TRADES_READ_SIZE = 1024 * 1024
+_TRADES_SEPARATORS = ' \t\r\n,'
+
 
 class JsonDataHandler(IDataHandler):
 
@@ -134,6 +140,53 @@ class JsonDataHandler(IDataHandler):
             pass
         return tradesdata
 
+    def _trades_iter(self, pair: str, timerange: Optional[TimeRange],
+                     chunk_size: int) -> Iterator[TradeList]:
+        """
+        Read trades in chunks. The file is parsed incrementally, one trade after the other -
+        so only the current chunk of trades is kept in memory.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.is_file():
+            return
+        decoder = json.JSONDecoder()
+        with (gzip.open(filename, 'rt') if self._use_zip else filename.open()) as fp:
+            buffer = fp.read(TRADES_READ_SIZE).lstrip()
+            if not buffer.startswith('['):
+                raise ValueError(f'Trades file {filename} does not contain a list of trades.')
+            pos = 1
+            eof = False
+            trades: List = []
+            while True:
+                while pos < len(buffer) and buffer[pos] in _TRADES_SEPARATORS:
+                    pos += 1
+                if buffer.startswith(']', pos):
+                    break
+                try:
+                    trade, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Trade is incomplete - read the next part of the file.
+                    if eof:
+                        raise
+                    read = fp.read(TRADES_READ_SIZE)
+                    eof = not read
+                    buffer = buffer[pos:] + read
+                    pos = 0
+                    continue
+                trades.append(trade)
+                if len(trades) == chunk_size:
+                    yield self._trades_to_list(trades)
+                    trades = []
+        if trades:
+            yield self._trades_to_list(trades)
+
+    @staticmethod
+    def _trades_to_list(trades: List) -> TradeList:
+        if isinstance(trades[0], dict):
+            # Convert trades dict to list
+            return trades_dict_to_list(trades)
+        return trades
+
     @classmethod
     def _get_file_extension(cls):
         return "json.gz" if cls._use_zip else "json"
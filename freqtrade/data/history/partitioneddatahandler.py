@@ -0,0 +1,229 @@
+import logging
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pandas import DataFrame, Timestamp, concat, read_parquet, to_datetime
+
+from freqtrade import misc
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, TradeList
+from freqtrade.enums import CandleType
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Partition name -> [first candle date (ms), last candle date (ms), number of candles]
+PartitionIndex = Dict[str, List[int]]
+
+
+class PartitionedDataHandler(IDataHandler):
+    """
+    Stores the candles of each pair / timeframe / candle type in a directory,
+    with one parquet file per month, and an index of the first and last candle of each month.
+    Loading a timerange only reads the months overlapping the timerange, appending candles
+    only rewrites the months the new candles belong to.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    _index_file = 'index.json'
+
+    @classmethod
+    def create_dir_if_needed(cls, datadir: Path):
+        """
+        Creates the directory holding the partitions of one pair
+        """
+        datadir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _partition_name(date: Timestamp) -> str:
+        return f"{date.year:04d}-{date.month:02d}"
+
+    def _load_index(self, dirname: Path) -> PartitionIndex:
+        return misc.file_load_json(dirname / self._index_file) or {}
+
+    def _store_partitions(self, dirname: Path, data: DataFrame, index: PartitionIndex) -> None:
+        """
+        Write the candles in data to their monthly partition, replacing existing partitions.
+        Updates the index in place.
+        :param dirname: Directory containing the partitions
+        :param data: Dataframe containing OHLCV data, sorted by date
+        :param index: Index of the partitions in dirname
+        """
+        dates = data['date']
+        for (year, month), partition in data.groupby([dates.dt.year, dates.dt.month], sort=False):
+            name = f"{year:04d}-{month:02d}"
+            partition.reset_index(drop=True).to_parquet(dirname / f"{name}.parquet", index=False)
+            index[name] = [
+                int(partition['date'].iloc[0].value // 1_000_000),
+                int(partition['date'].iloc[-1].value // 1_000_000),
+                len(partition),
+            ]
+        misc.file_dump_json(dirname / self._index_file, dict(sorted(index.items())), log=False)
+
+    def _prepare_data(self, data: DataFrame) -> DataFrame:
+        data = data.loc[:, self._columns]
+        return data.assign(date=to_datetime(data['date'], unit='ms', utc=True)).sort_values('date')
+
+    def ohlcv_store(
+            self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
+        """
+        Store data in monthly parquet partitions, replacing all existing data for this pair.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if dirname.exists():
+            shutil.rmtree(dirname)
+        self.create_dir_if_needed(dirname)
+        self._store_partitions(dirname, self._prepare_data(data), {})
+
+    def ohlcv_data_min_max(self, pair: str, timeframe: str,
+                           candle_type: CandleType) -> Tuple[datetime, datetime]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Read from the partition index - without loading any candles.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max)
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        index = self._load_index(dirname)
+        if not index:
+            return (
+                datetime.fromtimestamp(0, tz=timezone.utc),
+                datetime.fromtimestamp(0, tz=timezone.utc)
+            )
+        return (
+            datetime.fromtimestamp(min(p[0] for p in index.values()) / 1000, tz=timezone.utc),
+            datetime.fromtimestamp(max(p[1] for p in index.values()) / 1000, tz=timezone.utc),
+        )
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange], candle_type: CandleType
+                    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Only partitions overlapping the timerange are read, and candles outside of the timerange
+        are filtered while reading.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        index = self._load_index(dirname)
+
+        filters = []
+        start_ms = 0
+        stop_ms = None
+        if timerange:
+            if timerange.starttype == 'date':
+                start_ms = timerange.startts * 1000
+                filters.append(('date', '>=', Timestamp(start_ms, unit='ms', tz='UTC')))
+            if timerange.stoptype == 'date':
+                stop_ms = timerange.stopts * 1000
+                filters.append(('date', '<=', Timestamp(stop_ms, unit='ms', tz='UTC')))
+
+        partitions = [
+            name for name, (first, last, _) in sorted(index.items())
+            if last >= start_ms and (stop_ms is None or first <= stop_ms)
+        ]
+        if not partitions:
+            return DataFrame(columns=self._columns)
+
+        pairdata = concat([
+            read_parquet(dirname / f"{name}.parquet", filters=filters or None)
+            for name in partitions
+        ], ignore_index=True)
+        pairdata.columns = self._columns
+        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
+                                          'low': 'float', 'close': 'float', 'volume': 'float'})
+        pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
+        return pairdata
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if the directory did not exist.
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if dirname.exists():
+            shutil.rmtree(dirname)
+            return True
+        return False
+
+    def ohlcv_append(
+        self,
+        pair: str,
+        timeframe: str,
+        data: DataFrame,
+        candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Only the partitions the new candles belong to are rewritten - candles already stored
+        for the same date are replaced.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        if data.empty:
+            return
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(dirname)
+        index = self._load_index(dirname)
+        data = self._prepare_data(data)
+
+        existing = [
+            read_parquet(dirname / f"{name}.parquet")
+            for name in data['date'].map(self._partition_name).unique() if name in index
+        ]
+        if existing:
+            data = concat([*existing, data], ignore_index=True)
+            data = data.drop_duplicates(subset='date', keep='last').sort_values('date')
+        self._store_partitions(dirname, data, index)
+
+    def trades_store(self, pair: str, data: TradeList) -> None:
+        """
+        Store trades data (list of Dicts) to file
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        raise NotImplementedError()
+
+    def trades_append(self, pair: str, data: TradeList):
+        """
+        Append data to existing files
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        raise NotImplementedError()
+
+    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
+        """
+        Load a pair from file
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for - currently not implemented
+        :return: List of trades
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "partitioned"
@@ -0,0 +1,104 @@
+"""
+Array-backed store of the cached candles of one pair / timeframe / candle type.
+"""
+import numpy as np
+from pandas import DataFrame, DatetimeTZDtype
+from pandas.arrays import DatetimeArray
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.exchange.exchange_utils import timeframe_to_msecs
+
+
+OHLCV_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+
+
+class CandleBuffer:
+    """
+    Fixed-capacity store of the most recent candles.
+    Candles are kept in arrays of twice the capacity. New candles are appended in place.
+    Only once the arrays are full - or buffered candles change - the most recent candles are
+    moved to newly allocated arrays, so appending a candle is amortized O(1).
+    dataframe() returns a DataFrame view on the arrays, without copying the candles.
+    """
+
+    def __init__(self, timeframe: str, capacity: int) -> None:
+        self._timeframe_ns = timeframe_to_msecs(timeframe) * 1_000_000
+        self._capacity = max(capacity, 1)
+        self._dates = np.empty(2 * self._capacity, dtype=np.int64)
+        self._values = np.empty((len(OHLCV_COLUMNS), 2 * self._capacity), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _reallocate(self, keep: int) -> None:
+        """
+        Move the last `keep` candles to the start of new arrays.
+        New arrays are used so dataframes returned before remain unchanged.
+        """
+        dates = np.empty_like(self._dates)
+        values = np.empty_like(self._values)
+        dates[:keep] = self._dates[self._end - keep:self._end]
+        values[:, :keep] = self._values[:, self._end - keep:self._end]
+        self._dates, self._values = dates, values
+        self._start, self._end = 0, keep
+
+    def _merge(self, dates: np.ndarray, values: np.ndarray) -> None:
+        """
+        Merge candles into buffered candles of the same date - keeping the first open,
+        the highest high, the lowest low, the last close and the highest volume.
+        Arrays are reallocated if candles change, so dataframes returned before remain unchanged.
+        """
+        positions = np.searchsorted(self._dates[self._start:self._end], dates)
+        merged = self._values[:, self._start + positions]
+        merged[1] = np.fmax(merged[1], values[1])
+        merged[2] = np.fmin(merged[2], values[2])
+        merged[3] = values[3]
+        merged[4] = np.fmax(merged[4], values[4])
+        if not np.array_equal(merged, self._values[:, self._start + positions], equal_nan=True):
+            self._reallocate(len(self))
+            self._values[:, positions] = merged
+
+    def update(self, candles: DataFrame) -> bool:
+        """
+        Add candles, merging candles already buffered (see _merge()).
+        :param candles: Dataframe with DEFAULT_DATAFRAME_COLUMNS, sorted by date, without gaps
+        :return: False if there is a gap between the buffered candles and `candles`,
+            or `candles` start before the buffered candles - nothing is added in this case.
+        """
+        if candles.empty:
+            return True
+        dates = np.asarray(candles['date'].values, dtype='datetime64[ns]').view(np.int64)
+        values = candles[OHLCV_COLUMNS].to_numpy(dtype=np.float64).T
+        if len(self):
+            last_date = self._dates[self._end - 1]
+            if (dates[0] > last_date + self._timeframe_ns
+                    or dates[0] < self._dates[self._start]):
+                return False
+            new = dates > last_date
+            if not new.all():
+                self._merge(dates[~new], values[:, ~new])
+            dates, values = dates[new], values[:, new]
+
+        count = min(len(dates), self._capacity)
+        dates, values = dates[-count:], values[:, -count:]
+        if self._end + count > len(self._dates):
+            self._reallocate(min(len(self), self._capacity - count))
+        self._dates[self._end:self._end + count] = dates
+        self._values[:, self._end:self._end + count] = values
+        self._end += count
+        self._start = max(self._start, self._end - self._capacity)
+        return True
+
+    def dataframe(self) -> DataFrame:
+        """
+        Buffered candles, as view on the buffer.
+        Later updates are not visible in the returned dataframe.
+        """
+        dates = DatetimeArray(self._dates[self._start:self._end].view('datetime64[ns]'),
+                              dtype=DatetimeTZDtype(tz='UTC'), copy=False)
+        columns = {'date': dates}
+        for idx, col in enumerate(OHLCV_COLUMNS):
+            columns[col] = self._values[idx, self._start:self._end]
+        return DataFrame(columns, copy=False)
@@ -5,6 +5,7 @@ Cryptocurrency Exchanges support
 import asyncio
 import inspect
 import logging
+import sys
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor
@@ -13,20 +14,24 @@ from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple, Union
 
 import ccxt
 import ccxt.async_support as ccxt_async
+import ccxt.pro as ccxt_pro
 from cachetools import TTLCache
 from ccxt import TICK_SIZE
 from dateutil import parser
 from pandas import DataFrame, concat
 
-from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES, BidAsk,
-                                 BuySell, Config, EntryExit, ExchangeConfig,
-                                 ListPairsWithTimeframes, MakerTaker, OBLiteral, PairWithTimeframe)
-from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe, trades_dict_to_list
-from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, TradingMode
+from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES,
+                                 PROCESS_THROTTLE_SECS, BidAsk, BuySell, Config, EntryExit,
+                                 ExchangeConfig, ListPairsWithTimeframes, MakerTaker, OBLiteral,
+                                 PairWithTimeframe)
+from freqtrade.data.converter import (clean_ohlcv_dataframe, ohlcv_resample, ohlcv_to_dataframe,
+                                      trades_dict_to_list)
+from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.enums.pricetype import PriceType
 from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,
                                   InvalidOrderException, OperationalException, PricingError,
                                   RetryableOrderError, TemporaryError)
+from freqtrade.exchange.candle_buffer import CandleBuffer
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, remove_exchange_credentials,
                                        retrier, retrier_async)
 from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, CcxtModuleType,
@@ -37,6 +42,7 @@ from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, Ccxt
                                                timeframe_to_minutes, timeframe_to_msecs,
                                                timeframe_to_next_date, timeframe_to_prev_date,
                                                timeframe_to_seconds)
+from freqtrade.exchange.exchange_ws import CCXTOHLCVStream, OHLCVStream
 from freqtrade.exchange.types import OHLCVResponse, OrderBook, Ticker, Tickers
 from freqtrade.misc import (chunks, deep_merge_dicts, file_dump_json, file_load_json,
                             safe_value_fallback2)
@@ -129,6 +135,10 @@ class Exchange:
 
         # Holds candles
         self._klines: Dict[PairWithTimeframe, DataFrame] = {}
+        # Arrays backing the candles in _klines
+        self._kline_buffers: Dict[PairWithTimeframe, CandleBuffer] = {}
+        # Pushes candle updates via websocket, if enabled
+        self._ohlcv_stream: Optional[OHLCVStream] = None
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -180,12 +190,16 @@ class Exchange:
             exchange_conf, ccxt_async, ccxt_kwargs=ccxt_async_config)
 
         logger.info(f'Using Exchange "{self.name}"')
+        if (exchange_conf.get('enable_ws', False)
+                and config.get('runmode') in (RunMode.DRY_RUN, RunMode.LIVE)):
+            self._ohlcv_stream = self._init_ohlcv_stream(exchange_conf, ccxt_async_config)
         self.required_candle_call_count = 1
+        self._startup_candle_count: int = 0
         if validate:
             # Initial markets load
             self._load_markets()
             self.validate_config(config)
-            self._startup_candle_count: int = config.get('startup_candle_count', 0)
+            self._startup_candle_count = config.get('startup_candle_count', 0)
             self.required_candle_call_count = self.validate_required_startup_candles(
                 self._startup_candle_count, config.get('timeframe', ''))
 
@@ -205,6 +219,9 @@ class Exchange:
 
     def close(self):
         logger.debug("Exchange object destroyed, closing async loop")
+        if getattr(self, '_ohlcv_stream', None):
+            self._ohlcv_stream.close()
+            self._ohlcv_stream = None
         if (self._api_async and inspect.iscoroutinefunction(self._api_async.close)
                 and self._api_async.session):
             logger.debug("Closing async ccxt session.")
@@ -212,11 +229,39 @@ class Exchange:
         if self.loop and not self.loop.is_closed():
             self.loop.close()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the exchange without api connections, async loop and locks - e.g. to send it
+        to backtesting / hyperopt worker processes. The unpickled exchange can't communicate
+        with the exchange.
+        """
+        state = self.__dict__.copy()
+        state.update({'_api': None, '_api_async': None, '_ohlcv_stream': None,
+                      'loop': None, '_loop_lock': None, '_cache_lock': None})
+        return state
+
     def _init_async_loop(self) -> asyncio.AbstractEventLoop:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         return loop
 
+    def _init_ohlcv_stream(self, exchange_config: Dict[str, Any],
+                           ccxt_kwargs: Dict) -> Optional[OHLCVStream]:
+        """
+        Initialize the websocket candle stream.
+        Can be overridden by subclasses to provide other OHLCVStream implementations.
+        :return: OHLCVStream, or None if the exchange doesn't support streaming candles.
+        """
+        if not is_exchange_known_ccxt(exchange_config['name'], ccxt_pro):
+            logger.warning(f"{self.name} does not support websockets, using REST calls.")
+            return None
+        api = self._init_ccxt(exchange_config, ccxt_pro, ccxt_kwargs=ccxt_kwargs)
+        if not api.has.get('watchOHLCV'):
+            logger.warning(f"{self.name} does not support streaming candles, using REST calls.")
+            return None
+        logger.info("Streaming candles via websockets.")
+        return CCXTOHLCVStream(api)
+
     def validate_config(self, config):
         # Check if timeframe is available
         self.validate_timeframes(config.get('timeframe'))
@@ -1989,6 +2034,7 @@ class Exchange:
                 logger.info(
                     f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}")
                 del self._klines[(pair, timeframe, candle_type)]
+                self._kline_buffers.pop((pair, timeframe, candle_type), None)
 
         if (not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data)):
             # Multiple calls for one pair - to get more history
@@ -2008,10 +2054,13 @@ class Exchange:
 
     def _build_ohlcv_dl_jobs(
             self, pair_list: ListPairsWithTimeframes, since_ms: Optional[int],
-            cache: bool) -> Tuple[List[Coroutine], List[Tuple[str, str, CandleType]]]:
+            cache: bool, drop_incomplete: Optional[bool] = None
+    ) -> Tuple[List[Coroutine], List[Tuple[str, str, CandleType]]]:
         """
         Build Coroutines to execute as part of refresh_latest_ohlcv
         """
+        if drop_incomplete is None:
+            drop_incomplete = self._ohlcv_partial_candle
         input_coroutines: List[Coroutine[Any, Any, OHLCVResponse]] = []
         cached_pairs = []
         for pair, timeframe, candle_type in set(pair_list):
@@ -2025,6 +2074,11 @@ class Exchange:
 
             if ((pair, timeframe, candle_type) not in self._klines or not cache
                     or self._now_is_time_to_refresh(pair, timeframe, candle_type)):
+                if (cache and not since_ms
+                        and self._refresh_from_stream((pair, timeframe, candle_type),
+                                                      drop_incomplete)):
+                    cached_pairs.append((pair, timeframe, candle_type))
+                    continue
 
                 input_coroutines.append(
                     self._build_coroutine(pair, timeframe, candle_type, since_ms, cache))
@@ -2037,6 +2091,66 @@ class Exchange:
 
         return input_coroutines, cached_pairs
 
+    def _refresh_from_stream(self, pair_key: PairWithTimeframe, drop_incomplete: bool) -> bool:
+        """
+        Add candles pushed by the websocket stream to the cached candles.
+        Subscribes to the pair, so candles are streamed from the next refresh on.
+        :param drop_incomplete: Drop the current (incomplete) candle - like the REST call.
+            Otherwise the incomplete candle is added, and the previously cached incomplete
+            candle is replaced by its final version.
+        :return: True if cached candles are up to date, False if candles are missing
+            and a REST call is required to fill the gap.
+        """
+        pair, timeframe, candle_type = pair_key
+        if (self._ohlcv_stream is None
+                or candle_type not in (CandleType.SPOT, CandleType.FUTURES)):
+            return False
+        self._ohlcv_stream.subscribe(pair_key)
+        if pair_key not in self._klines:
+            return False
+
+        timeframe_ms = timeframe_to_msecs(timeframe)
+        last_date = dt_ts(self._klines[pair_key]['date'].iloc[-1])
+        current_open = dt_ts(timeframe_to_prev_date(timeframe))
+        if drop_incomplete:
+            first_date, last_needed = last_date + timeframe_ms, current_open - timeframe_ms
+        else:
+            first_date, last_needed = last_date, current_open
+        candles = [candle for candle in self._ohlcv_stream.ohlcv(pair_key)
+                   if first_date <= candle[0] <= last_needed]
+        if (not candles or candles[0][0] != first_date or candles[-1][0] != last_needed
+                or len(candles) != (candles[-1][0] - candles[0][0]) // timeframe_ms + 1):
+            logger.debug(f"Candle stream for {pair_key} is incomplete, using REST call.")
+            return False
+
+        new_candles = ohlcv_to_dataframe(candles, timeframe, pair=pair, fill_missing=False,
+                                         drop_incomplete=False)
+        self._store_klines(pair_key, new_candles)
+        self._pairs_last_refresh_time[pair_key] = candles[-1][0] // 1000
+        return True
+
+    def _store_klines(self, pair_key: PairWithTimeframe, candles: DataFrame) -> DataFrame:
+        """
+        Add candles to the cached candles of this pair.
+        :param candles: Dataframe of new candles, without gaps
+        :return: All cached candles of this pair
+        """
+        buffer = self._kline_buffers.get(pair_key)
+        if buffer is None or not buffer.update(candles):
+            # New pair - or gap between cached and new candles
+            pair, timeframe, _ = pair_key
+            if pair_key in self._klines:
+                candles = clean_ohlcv_dataframe(concat([self._klines[pair_key], candles], axis=0),
+                                                timeframe, pair, fill_missing=True,
+                                                drop_incomplete=False)
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
+            # Age out old candles
+            buffer = CandleBuffer(timeframe, candle_limit + self._startup_candle_count)
+            buffer.update(candles)
+            self._kline_buffers[pair_key] = buffer
+        self._klines[pair_key] = buffer.dataframe()
+        return self._klines[pair_key]
+
     def _process_ohlcv_df(self, pair: str, timeframe: str, c_type: CandleType, ticks: List[List],
                           cache: bool, drop_incomplete: bool) -> DataFrame:
         # keeping last candle time as last refreshed time of the pair
@@ -2047,18 +2161,8 @@ class Exchange:
         ohlcv_df = ohlcv_to_dataframe(ticks, timeframe, pair=pair, fill_missing=True,
                                       drop_incomplete=drop_incomplete)
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(concat([old, ohlcv_df], axis=0), timeframe, pair,
-                                                 fill_missing=True, drop_incomplete=False)
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+            # Reassign so we return the updated, combined df
+            ohlcv_df = self._store_klines((pair, timeframe, c_type), ohlcv_df)
         return ohlcv_df
 
     def refresh_latest_ohlcv(self, pair_list: ListPairsWithTimeframes, *,
@@ -2079,7 +2183,8 @@ class Exchange:
         logger.debug("Refreshing candle (OHLCV) data for %d pairs", len(pair_list))
 
         # Gather coroutines to run
-        input_coroutines, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
+        input_coroutines, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache,
+                                                                   drop_incomplete)
 
         results_df = {}
         # Chunk requests into batches of 100 to avoid overwelming ccxt Throttling
@@ -2111,6 +2216,66 @@ class Exchange:
 
         return results_df
 
+    def ohlcv_request_budget(self) -> int:
+        """
+        Number of candle requests the exchange's rate limit allows within one bot iteration
+        (internals.process_throttle_secs). ccxt delays additional requests, delaying the
+        iteration.
+        """
+        throttle_secs = self._config.get('internals', {}).get(
+            'process_throttle_secs', PROCESS_THROTTLE_SECS)
+        rate_limit = self._api_async.rateLimit if self._api_async.enableRateLimit else 0
+        if not rate_limit:
+            return sys.maxsize
+        return max(int(throttle_secs * 1000 // rate_limit), 1)
+
+    def ohlcv_requests_due(self, pair_list: ListPairsWithTimeframes) -> List[PairWithTimeframe]:
+        """
+        Candles refresh_latest_ohlcv() would fetch from the exchange - as they are not cached,
+        or a new candle is due. Cached candles which can be refreshed from the candle stream
+        are expected not to require a request.
+        """
+        return [
+            (pair, timeframe, candle_type) for pair, timeframe, candle_type in set(pair_list)
+            if (pair, timeframe, candle_type) not in self._klines
+            or (self._now_is_time_to_refresh(pair, timeframe, candle_type)
+                and (self._ohlcv_stream is None
+                     or candle_type not in (CandleType.SPOT, CandleType.FUTURES)))
+        ]
+
+    def resample_latest_ohlcv(self, pair_key: PairWithTimeframe,
+                              base_key: PairWithTimeframe) -> bool:
+        """
+        Refresh cached candles by resampling cached candles of a lower timeframe, instead of
+        fetching them from the exchange.
+        Candles of base_key must have been refreshed before.
+        :param pair_key: (pair, timeframe, candle_type) to refresh
+        :param base_key: (pair, timeframe, candle_type) to resample, with a timeframe
+            dividing the timeframe of pair_key
+        :return: True if cached candles are up to date, False if candles are missing
+            and must be fetched from the exchange.
+        """
+        if pair_key not in self._klines or base_key not in self._klines:
+            return False
+        pair, timeframe, candle_type = pair_key
+        if not self._now_is_time_to_refresh(pair, timeframe, candle_type):
+            return True
+
+        start = self._klines[pair_key]['date'].iloc[-1] + timedelta(
+            seconds=timeframe_to_seconds(timeframe))
+        end = timeframe_to_prev_date(timeframe)
+        base = self._klines[base_key]
+        base = base.loc[(base['date'] >= start) & (base['date'] < end)]
+        if base.empty or len(base) != (end - start) // timedelta(
+                seconds=timeframe_to_seconds(base_key[1])):
+            return False
+
+        candles = ohlcv_resample(base, timeframe)
+        self._store_klines(pair_key, candles)
+        self._pairs_last_refresh_time[pair_key] = dt_ts(candles['date'].iloc[-1]) // 1000
+        logger.debug(f"Resampled {len(candles)} candles of {pair_key} from {base_key[1]}.")
+        return True
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
@@ -0,0 +1,102 @@
+"""
+Streaming candle (OHLCV) sources, pushing candle updates from the exchange via websockets.
+"""
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any, Dict, List
+
+import ccxt
+
+from freqtrade.constants import PairWithTimeframe
+from freqtrade.exchange.exchange_utils import timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+
+class OHLCVStream(ABC):
+    """
+    Interface for sources of candles pushed by the exchange.
+    Exchange.refresh_latest_ohlcv() reads candles from the stream, and only falls back
+    to REST calls if the stream is missing candles.
+    """
+
+    @abstractmethod
+    def subscribe(self, pair_key: PairWithTimeframe) -> None:
+        """
+        Start receiving candle updates for this pair / timeframe / candle type.
+        Subscribing to an already subscribed pair must be a no-op.
+        """
+
+    @abstractmethod
+    def ohlcv(self, pair_key: PairWithTimeframe) -> List[List]:
+        """
+        Most recent candles received for this pair / timeframe / candle type.
+        :return: List of [timestamp_ms, open, high, low, close, volume], sorted by date.
+            May include the current (incomplete) candle.
+        """
+
+    def close(self) -> None:
+        """
+        Stop receiving candle updates.
+        """
+
+
+class CCXTOHLCVStream(OHLCVStream):
+    """
+    Stream candles through ccxt.pro `watch_ohlcv()`.
+    The websocket connections run in a separate event loop, in a background thread - so
+    candle updates are received while the bot is busy with other tasks.
+    Subscriptions expire if the candles of a pair have not been requested for a few candles.
+    """
+    # Seconds to wait before reconnecting after errors
+    reconnect_delay: float = 1.0
+
+    def __init__(self, api: Any) -> None:
+        self._api = api
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._loop.run_forever, name='ohlcv_stream', daemon=True)
+        self._thread.start()
+        self._watchers: Dict[PairWithTimeframe, Future] = {}
+        self._last_requested: Dict[PairWithTimeframe, float] = {}
+
+    def subscribe(self, pair_key: PairWithTimeframe) -> None:
+        self._last_requested[pair_key] = time.time()
+        watcher = self._watchers.get(pair_key)
+        if watcher is None or watcher.done():
+            self._watchers[pair_key] = asyncio.run_coroutine_threadsafe(
+                self._watch(pair_key), self._loop)
+
+    def _is_expired(self, pair_key: PairWithTimeframe) -> bool:
+        timeframe_secs = timeframe_to_seconds(pair_key[1])
+        return time.time() - self._last_requested.get(pair_key, 0) > 3 * timeframe_secs
+
+    async def _watch(self, pair_key: PairWithTimeframe) -> None:
+        pair, timeframe, _ = pair_key
+        while not self._is_expired(pair_key):
+            try:
+                await self._api.watch_ohlcv(pair, timeframe)
+            except ccxt.BaseError as e:
+                logger.warning(f"Candle stream for {pair_key} failed: {e}. Reconnecting ...")
+                await asyncio.sleep(self.reconnect_delay)
+        logger.info(f"Candle stream for {pair_key} expired.")
+
+    def ohlcv(self, pair_key: PairWithTimeframe) -> List[List]:
+        self._last_requested[pair_key] = time.time()
+        pair, timeframe, _ = pair_key
+        return list(self._api.ohlcvs.get(pair, {}).get(timeframe, []))
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        for watcher in self._watchers.values():
+            watcher.cancel()
+        if self._thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._api.close(), self._loop).result(timeout=10)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+        self._loop.close()
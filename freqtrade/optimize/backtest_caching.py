@@ -1,16 +1,33 @@
 import hashlib
+import inspect
+import sysconfig
 from copy import deepcopy
 from pathlib import Path
-from typing import Union
+from types import CodeType
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import rapidjson
+import talib
 
+from freqtrade import __version__
 
-def get_strategy_run_id(strategy) -> str:
+
+# Hyperopt options that have no impact on results of individual epochs.
+HYPEROPT_RUN_KEYS = ('epochs', 'spaces', 'hyperopt_jobs', 'hyperopt_random_state', 'print_all',
+                     'print_colorized', 'print_json', 'disableparamexport', 'epoch_cache',
+                     'hyperopt_scheduler', 'verbosity')
+
+# Configuration which can influence populated indicators.
+INDICATOR_CONFIG_KEYS = ('timeframe', 'stake_currency', 'trading_mode', 'margin_mode',
+                         'candle_type_def', 'dataformat_ohlcv', 'datadir')
+
+
+def get_strategy_run_id(strategy, ignore_keys: Tuple[str, ...] = ()) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignore_keys: Additional config keys without impact on the results.
     :return: hex string id.
     """
     digest = hashlib.sha1()
@@ -18,7 +35,7 @@ def get_strategy_run_id(strategy) -> str:
 
     # Options that have no impact on results of individual backtest.
     not_important_keys = ('strategy_list', 'original_config', 'telegram', 'api_server')
-    for k in not_important_keys:
+    for k in not_important_keys + ignore_keys:
         if k in config:
             del config[k]
 
@@ -34,6 +51,131 @@ def get_strategy_run_id(strategy) -> str:
     return digest.hexdigest().lower()
 
 
+def get_hyperopt_run_id(strategy, files: List[Path]) -> str:
+    """
+    Generate identification hash for a hyperopt run. Epochs with identical parameters
+    of runs with an identical hash have identical results.
+    :param strategy: strategy object.
+    :param files: Additional files with impact on the results (loss function, data).
+        Files which don't exist are skipped.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1(get_strategy_run_id(strategy, HYPEROPT_RUN_KEYS).encode('utf-8'))
+    for file in files:
+        if not file.is_file():
+            continue
+        with file.open('rb') as fp:
+            while chunk := fp.read(1024 * 1024):
+                digest.update(chunk)
+    return digest.hexdigest().lower()
+
+
+def _is_strategy_code(function: Any) -> bool:
+    """
+    Check if function is user code (e.g. a strategy method or helper function).
+    Code of freqtrade and installed packages is covered by the versions hashed instead.
+    """
+    code = getattr(function, '__code__', None)
+    if not isinstance(code, CodeType):
+        return False
+    library_paths = [Path(__file__).parents[1]] + [
+        Path(sysconfig.get_paths()[name]) for name in ('stdlib', 'purelib', 'platlib')]
+    file = Path(code.co_filename).resolve()
+    return not any(file.is_relative_to(path.resolve()) for path in library_paths)
+
+
+def _code_names(code: CodeType) -> Set[str]:
+    """Names (globals and attributes) referenced by code, including nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _get_indicator_code(strategy) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+    """
+    Collect the source of populate_indicators(), of @informative functions and of the
+    strategy methods and helper functions they reference.
+    :param strategy: strategy object.
+    :return: Tuple of sources and of simple values referenced (strategy parameters, constants
+        and class attributes) - or None if source code is not available.
+    """
+    from freqtrade.strategy.parameters import BaseParameter
+
+    queue = [type(strategy).populate_indicators] + [f for _, f in strategy._ft_informative]
+    seen: Set[Any] = set()
+    sources: List[str] = []
+    values: Dict[str, Any] = {}
+    while queue:
+        function = inspect.unwrap(queue.pop(0))
+        if function in seen:
+            continue
+        seen.add(function)
+        try:
+            sources.append(inspect.getsource(function))
+        except (OSError, TypeError):
+            return None
+        for name in sorted(_code_names(function.__code__)):
+            value = inspect.getattr_static(strategy, name, None)
+            if value is None:
+                value = getattr(function, '__globals__', {}).get(name)
+            if isinstance(value, BaseParameter):
+                values[name] = value.value
+            elif isinstance(value, (staticmethod, classmethod)):
+                value = value.__func__
+            elif isinstance(value, property):
+                value = value.fget
+            if _is_strategy_code(value):
+                queue.append(value)
+            elif isinstance(value, (bool, int, float, str)):
+                values[name] = value
+    return sources, values
+
+
+def get_indicator_run_id(strategy, files: List[Path]) -> str:
+    """
+    Generate identification hash for the indicators of a strategy.
+    Only code and settings used while populating indicators are considered - so changes to
+    entry / exit signals keep the hash unchanged.
+    This is the source of populate_indicators(), @informative functions and helper functions
+    they call, referenced parameters and constants, and the freqtrade and TA-Lib versions.
+    :param strategy: strategy object.
+    :param files: Data files of informative pairs. Modification times are considered.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()
+    config = {k: strategy.config.get(k) for k in INDICATOR_CONFIG_KEYS}
+    versions = [__version__, talib.__version__]
+    indicator_code = _get_indicator_code(strategy)
+    if indicator_code:
+        sources, values = indicator_code
+    else:
+        # Source not available - fall back to the full strategy file and all parameters
+        with Path(strategy.__file__).open('rb') as fp:
+            sources = [fp.read().decode('utf-8')]
+        values = {name: param.value for name, param in strategy.enumerate_parameters()}
+    digest.update(rapidjson.dumps([config, values, versions, sources], default=str,
+                                  number_mode=rapidjson.NM_NAN).encode('utf-8'))
+    for file in files:
+        digest.update(str(file).encode('utf-8'))
+        if file.is_file():
+            digest.update(str(file.stat().st_mtime_ns).encode('utf-8'))
+    return digest.hexdigest().lower()
+
+
+def get_epoch_params_hash(params_details: dict) -> str:
+    """
+    Hash of the parameters applied in one hyperopt epoch.
+    :param params_details: Parameters per space, as stored in hyperopt results.
+    :return: hex string id.
+    """
+    return hashlib.sha1(rapidjson.dumps(
+        params_details, default=str, number_mode=rapidjson.NM_NAN,
+        mapping_mode=rapidjson.MM_SORT_KEYS
+    ).encode('utf-8')).hexdigest().lower()
+
+
 def get_backtest_metadata_filename(filename: Union[Path, str]) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
@@ -7,10 +7,12 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs, wrap_non_picklable_objects
 from numpy import nan
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -27,7 +29,9 @@ from freqtrade.exchange import (amount_to_contract_precision, price_to_precision
 from freqtrade.exchange.exchange import Exchange
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.bt_pair_data import BTDetailData, BTPairData
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, generate_rejected_signals,
                                                  generate_trade_signal_candles,
                                                  show_backtest_results,
@@ -37,6 +41,7 @@ from freqtrade.persistence import LocalTrade, Order, PairLocks, Trade
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+from freqtrade.resolvers.strategy_resolver import check_override
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util.binance_mig import migrate_binance_futures_data
@@ -155,6 +160,12 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get('position_stacking', False)
         self.enable_protections: bool = self.config.get('enable_protections', False)
+        self.backtest_engine: str = self.config.get('backtest_engine',
+                                                    constants.BACKTEST_ENGINE_DEFAULT)
+        # Precomputed exit checks of the columnar engine
+        self._fast_exits = False
+        self._roi_durations = np.empty(0, dtype=np.int64)
+        self._roi_ratios = np.empty(0, dtype=np.float64)
         migrate_binance_futures_data(config)
 
         self.init_backtest()
@@ -176,6 +187,7 @@ class Backtesting:
         LoggingMixin.show_output = True
         PairLocks.use_db = True
         Trade.use_db = True
+        LocalTrade.float_math = False
 
     def init_backtest_detail(self) -> None:
         # Load detail timeframe if specified
@@ -189,6 +201,8 @@ class Backtesting:
         else:
             self.timeframe_detail_min = 0
         self.detail_data: Dict[str, DataFrame] = {}
+        # Detail data converted to arrays, together with the dataframe it was created from.
+        self._detail_candles: Dict[str, Tuple[DataFrame, BTDetailData]] = {}
         self.futures_data: Dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -230,7 +244,7 @@ class Backtesting:
         Loads backtest data and returns the data combined with the timerange
         as tuple.
         """
-        self.progress.init_step(BacktestState.DATALOAD, 1)
+        self.progress.init_step(BacktestState.DATALOAD, len(self.pairlists.whitelist))
 
         data = history.load_data(
             datadir=self.config['datadir'],
@@ -240,7 +254,9 @@ class Backtesting:
             startup_candles=self.config['startup_candle_count'],
             fail_without_data=True,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
-            candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+            candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+            load_jobs=self.config.get('data_load_jobs', 1),
+            progress_callback=self.progress.increment,
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -253,7 +269,6 @@ class Backtesting:
         self.timerange.adjust_start_if_necessary(timeframe_to_seconds(self.timeframe),
                                                  self.required_startup, min_date)
 
-        self.progress.set_new_value(1)
         return data, self.timerange
 
     def load_bt_data_detail(self) -> None:
@@ -269,7 +284,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+                candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+                load_jobs=self.config.get('data_load_jobs', 1),
             )
         else:
             self.detail_data = {}
@@ -283,7 +299,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=CandleType.FUNDING_RATE
+                candle_type=CandleType.FUNDING_RATE,
+                load_jobs=self.config.get('data_load_jobs', 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contian index candles!)
@@ -295,7 +312,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price"))
+                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                load_jobs=self.config.get('data_load_jobs', 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -324,6 +342,7 @@ class Backtesting:
         PairLocks.use_db = False
         PairLocks.timeframe = self.config['timeframe']
         Trade.use_db = False
+        LocalTrade.float_math = self.config.get('backtest_float_math', False)
         PairLocks.reset_locks()
         Trade.reset_trades()
         self.rejected_trades = 0
@@ -360,46 +379,83 @@ class Backtesting:
 
         # Create dict with data
         for pair in processed.keys():
-            pair_data = processed[pair]
             self.check_abort()
             self.progress.increment()
-
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ['buy', 'sell'], axis=1, errors='ignore')
-
-            df_analyzed = self.strategy.advise_exit(
-                self.strategy.advise_entry(pair_data, {'pair': pair}),
-                {'pair': pair}
-            ).copy()
-            # Trim startup period from analyzed dataframe
-            df_analyzed = processed[pair] = pair_data = trim_dataframe(
-                df_analyzed, self.timerange, startup_candles=self.required_startup)
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(
-                pair, self.timeframe, df_analyzed, self.config['candle_type_def'])
-
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
-
-            # To avoid using data from future, we use entry/exit signals shifted
-            # from the previous candle
-            for col in HEADERS[5:]:
-                tag_col = col in ('enter_tag', 'exit_tag')
-                if col in df_analyzed.columns:
-                    df_analyzed[col] = df_analyzed.loc[:, col].replace(
-                        [nan], [0 if not tag_col else None]).shift(1)
-                elif not df_analyzed.empty:
-                    df_analyzed[col] = 0 if not tag_col else None
-
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            df_analyzed = self._get_pair_signals(processed, pair)
 
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_arrays(self, processed: Dict[str, DataFrame]) -> Dict[str, BTPairData]:
+        """
+        Columnar counterpart of _get_ohlcv_as_lists(), used by the columnar engine.
+        Keeps candles as NumPy arrays instead of creating one python list per candle.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
+        data: Dict[str, BTPairData] = {}
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+
+        for pair in processed.keys():
+            self.check_abort()
+            self.progress.increment()
+            df_analyzed = self._get_pair_signals(processed, pair)
+            if df_analyzed.empty:
+                data[pair] = BTPairData(
+                    np.empty(0, dtype=np.int64), np.empty((0, len(HEADERS) - 3)),
+                    np.empty(0, dtype=object), np.empty(0, dtype=object))
+                continue
+
+            data[pair] = BTPairData(
+                df_analyzed['date'].values.view(np.int64),
+                df_analyzed[HEADERS[OPEN_IDX:ENTER_TAG_IDX]].to_numpy(dtype=np.float64),
+                df_analyzed['enter_tag'].to_numpy(dtype=object),
+                df_analyzed['exit_tag'].to_numpy(dtype=object),
+            )
+        return data
+
+    def _get_pair_signals(self, processed: Dict[str, DataFrame], pair: str) -> DataFrame:
+        """
+        Populate entry / exit signals for one pair and trim the startup period.
+        Updates the dataprovider cache and returns the dataframe with signals shifted
+        by one candle, ready to be converted for the backtest loop.
+        """
+        pair_data = processed[pair]
+        if not pair_data.empty:
+            # Cleanup from prior runs
+            pair_data.drop(HEADERS[5:] + ['buy', 'sell'], axis=1, errors='ignore')
+
+        df_analyzed = self.strategy.advise_exit(
+            self.strategy.advise_entry(pair_data, {'pair': pair}),
+            {'pair': pair}
+        )
+        # Trim startup period from analyzed dataframe
+        df_analyzed = processed[pair] = pair_data = trim_dataframe(
+            df_analyzed, self.timerange, startup_candles=self.required_startup)
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(
+            pair, self.timeframe, df_analyzed, self.config['candle_type_def'])
+
+        # Only copy the columns used by the backtest - indicators are left untouched.
+        # Signals are shifted on this copy, that way the entry signal/tag
+        # remains on the correct candle for callbacks.
+        df_signals = df_analyzed[[col for col in HEADERS[:5] if col in df_analyzed.columns]].copy()
+
+        # To avoid using data from future, we use entry/exit signals shifted
+        # from the previous candle
+        for col in HEADERS[5:]:
+            tag_col = col in ('enter_tag', 'exit_tag')
+            if col in df_analyzed.columns:
+                df_signals[col] = df_analyzed[col].replace(
+                    [nan], [0 if not tag_col else None]).shift(1)
+            elif not df_analyzed.empty:
+                df_signals[col] = 0 if not tag_col else None
+
+        return df_signals.drop(df_signals.head(1).index)
+
     def _get_close_rate(self, row: Tuple, trade: LocalTrade, exit: ExitCheckTuple,
                         trade_dur: int) -> float:
         """
@@ -550,7 +606,7 @@ class Backtesting:
                 pos_trade = self._enter_trade(
                     trade.pair, row, 'short' if trade.is_short else 'long', stake_amount, trade)
                 if pos_trade is not None:
-                    self.wallets.update()
+                    self.wallets.update_pair(trade.pair)
                     return pos_trade
 
         if stake_amount is not None and stake_amount < 0.0:
@@ -573,7 +629,7 @@ class Backtesting:
                 if self._get_order_filled(order.ft_price, row):
                     order.close_bt_order(current_date, trade)
                     trade.recalc_trade_from_orders()
-                self.wallets.update()
+                self.wallets.update_pair(trade.pair)
                 return pos_trade
 
         return trade
@@ -914,8 +970,8 @@ class Backtesting:
 
         return trade
 
-    def handle_left_open(self, open_trades: Dict[str, List[LocalTrade]],
-                         data: Dict[str, List[Tuple]]) -> None:
+    def handle_left_open(self, open_trades: Dict[str, Dict[LocalTrade, None]],
+                         data: Dict[str, Sequence]) -> None:
         """
         Handling of left open trades at the end of backtesting
         """
@@ -1094,7 +1150,7 @@ class Backtesting:
                 # Close trade
                 open_trade_count_start -= 1
                 LocalTrade.remove_bt_trade(t)
-                self.wallets.update()
+                self.wallets.update_pair(pair)
 
         # 2. Process entries.
         # without positionstacking, we can only have one open trade per pair.
@@ -1117,7 +1173,7 @@ class Backtesting:
                     open_trade_count_start += 1
                     # logger.debug(f"{pair} - Emulate creation of new trade: {trade}.")
                     LocalTrade.add_bt_trade(trade)
-                    self.wallets.update()
+                    self.wallets.update_pair(pair)
             else:
                 self._collate_rejected(pair, row)
 
@@ -1127,7 +1183,7 @@ class Backtesting:
             if order and self._get_order_filled(order.ft_price, row):
                 order.close_bt_order(current_time, trade)
                 trade.open_order_id = None
-                self.wallets.update()
+                self.wallets.update_pair(pair)
 
                 # 4. Create exit orders (if any)
             if not trade.open_order_id:
@@ -1148,32 +1204,72 @@ class Backtesting:
 
                     # logger.debug(f"{pair} - Backtesting exit {trade}")
                     LocalTrade.close_bt_trade(trade)
-                self.wallets.update()
+                self.wallets.update_pair(pair)
                 self.run_protections(pair, current_time, trade.trade_direction)
         return open_trade_count_start
 
-    def backtest(self, processed: Dict,
-                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    def _index_detail_data(self, data: Dict[str, Sequence]) -> None:
         """
-        Implement backtesting functionality
-
-        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
-        Of course try to not have ugly code. By some accessor are sometime slower than functions.
-        Avoid extensive logging in this method and functions it calls.
+        Convert detail data to arrays (once per dataframe) and index the detail candles
+        of every main candle, so _process_candle() doesn't need to search them.
+        """
+        candle_length = self.timeframe_min * 60 * 10 ** 9
+        for pair, rows in data.items():
+            if pair not in self.detail_data:
+                continue
+            detail_df = self.detail_data[pair]
+            if pair not in self._detail_candles or self._detail_candles[pair][0] is not detail_df:
+                self._detail_candles[pair] = (detail_df, BTDetailData.from_dataframe(detail_df))
+            if isinstance(rows, BTPairData):
+                candle_dates = rows.dates
+            else:
+                candle_dates = np.array([row[DATE_IDX].value for row in rows], dtype=np.int64)
+            self._detail_candles[pair][1].index_candles(candle_dates, candle_length)
 
-        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
-        optimize memory usage!
-        :param start_date: backtesting timerange start datetime
-        :param end_date: backtesting timerange end datetime
-        :return: DataFrame with trades (results of backtesting)
+    def _process_candle(self, pair: str, row: Tuple, row_index: int, current_time: datetime,
+                        end_date: datetime, open_trade_count_start: int) -> int:
         """
-        self.prepare_backtest(self.enable_protections)
-        # Ensure wallets are uptodate (important for --strategy-list)
-        self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: Dict = self._get_ohlcv_as_lists(processed)
+        Process one candle of one pair - spreading out into the detail timeframe if necessary.
+        :param row_index: Number of candles of this pair processed so far (including this one)
+        :return: Updated open trade count
+        """
+        self.dataprovider._set_dataframe_max_index(row_index)
+        trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
 
+        if (
+            (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
+            and self.timeframe_detail and pair in self.detail_data
+        ):
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            detail_rows = self._detail_candles[pair][1].candle_rows(
+                row_index - 1, row[LONG_IDX:])
+            if not detail_rows:
+                # Fall back to "regular" data if no detail data was found for this candle
+                return self.backtest_loop(
+                    row, pair, current_time, end_date,
+                    open_trade_count_start, trade_dir)
+            is_first = True
+            current_time_det = current_time
+            for det_row in detail_rows:
+                open_trade_count_start = self.backtest_loop(
+                    det_row, pair, current_time_det, end_date,
+                    open_trade_count_start, trade_dir, is_first)
+                current_time_det += timedelta(minutes=self.timeframe_detail_min)
+                is_first = False
+            return open_trade_count_start
+        else:
+            return self.backtest_loop(
+                row, pair, current_time, end_date,
+                open_trade_count_start, trade_dir)
+
+    def _backtest_lists(self, data: Dict, start_date: datetime,
+                        end_date: datetime) -> None:
+        """
+        Backtest loop of the list based engine.
+        Visits every candle of every pair.
+        """
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: Dict = defaultdict(int)
         current_time = start_date + timedelta(minutes=self.timeframe_min)
@@ -1186,7 +1282,7 @@ class Backtesting:
             self.check_abort()
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
                 current_time=current_time)
-            for i, pair in enumerate(data):
+            for pair in data:
                 row_index = indexes[pair]
                 row = self.validate_row(data, pair, row_index, current_time)
                 if not row:
@@ -1194,53 +1290,244 @@ class Backtesting:
 
                 row_index += 1
                 indexes[pair] = row_index
-                self.dataprovider._set_dataframe_max_index(row_index)
-                current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-                trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
-
-                if (
-                    (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                    and self.timeframe_detail and pair in self.detail_data
-                ):
-                    # Spread out into detail timeframe.
-                    # Should only happen when we are either in a trade for this pair
-                    # or when we got the signal for a new trade.
-                    exit_candle_end = current_detail_time + timedelta(minutes=self.timeframe_min)
-
-                    detail_data = self.detail_data[pair]
-                    detail_data = detail_data.loc[
-                        (detail_data['date'] >= current_detail_time) &
-                        (detail_data['date'] < exit_candle_end)
-                    ].copy()
-                    if len(detail_data) == 0:
-                        # Fall back to "regular" data if no detail data was found for this candle
-                        open_trade_count_start = self.backtest_loop(
-                            row, pair, current_time, end_date,
-                            open_trade_count_start, trade_dir)
-                        continue
-                    detail_data.loc[:, 'enter_long'] = row[LONG_IDX]
-                    detail_data.loc[:, 'exit_long'] = row[ELONG_IDX]
-                    detail_data.loc[:, 'enter_short'] = row[SHORT_IDX]
-                    detail_data.loc[:, 'exit_short'] = row[ESHORT_IDX]
-                    detail_data.loc[:, 'enter_tag'] = row[ENTER_TAG_IDX]
-                    detail_data.loc[:, 'exit_tag'] = row[EXIT_TAG_IDX]
-                    is_first = True
-                    current_time_det = current_time
-                    for det_row in detail_data[HEADERS].values.tolist():
-                        open_trade_count_start = self.backtest_loop(
-                            det_row, pair, current_time_det, end_date,
-                            open_trade_count_start, trade_dir, is_first)
-                        current_time_det += timedelta(minutes=self.timeframe_detail_min)
-                        is_first = False
-                else:
-                    open_trade_count_start = self.backtest_loop(
-                        row, pair, current_time, end_date,
-                        open_trade_count_start, trade_dir)
+                open_trade_count_start = self._process_candle(
+                    pair, row, row_index, current_time, end_date, open_trade_count_start)
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
             current_time += timedelta(minutes=self.timeframe_min)
 
+    def _fast_exits_possible(self) -> bool:
+        """
+        Can exits be precomputed from the candle arrays?
+        Only true if no callback can influence exits on candles without a price event.
+        """
+        return (
+            self.trading_mode != TradingMode.FUTURES
+            and not self.timeframe_detail
+            and not self.strategy.use_custom_stoploss
+            and not self.strategy.position_adjustment_enable
+            and not (self.strategy.use_exit_signal
+                     and check_override(self.strategy, IStrategy, 'custom_exit'))
+            and not check_override(self.strategy, IStrategy, 'bot_loop_start')
+        )
+
+    def _next_exit_candidate(self, trade: LocalTrade, pair_data: BTPairData,
+                             start: int) -> int:
+        """
+        Find the first candle (at or after `start`) which may exit the trade or move its
+        (trailing) stoploss. Candles before it can't change the trade besides min/max rates.
+        The checks are a superset of should_exit() - the candle found is evaluated
+        by the regular backtesting logic.
+        :return: Row index of the candle - len(pair_data) if no candle qualifies
+        """
+        nr_rows = len(pair_data)
+        if (
+            trade.open_order_id is not None or not trade.has_no_leverage
+            or not trade.stop_loss or trade.initial_stop_loss_pct is None
+        ):
+            return start
+        high = pair_data.column(HIGH_IDX - OPEN_IDX)
+        low = pair_data.column(LOW_IDX - OPEN_IDX)
+        exit_long = pair_data.column(ELONG_IDX - OPEN_IDX)
+        open_date = Timestamp(trade.open_date_utc).value
+        # Highest stoploss the trailing stop could move to for a given high.
+        trailing_pct = abs(self.strategy.stoploss)
+        if self.strategy.trailing_stop_positive is not None:
+            trailing_pct = min(trailing_pct, abs(self.strategy.trailing_stop_positive))
+        # Profit ratio at a given rate, without interest (long, no leverage).
+        profit_factor = trade.amount * (1 - (trade.fee_close or 0.0)) / trade.open_trade_value
+
+        window = 64
+        while start < nr_rows:
+            end = min(start + window, nr_rows)
+            candidates = low[start:end] <= trade.stop_loss * (1 + 1e-9)
+            if trade.liquidation_price:
+                candidates |= low[start:end] <= trade.liquidation_price
+            if self.strategy.use_exit_signal:
+                candidates |= exit_long[start:end] != 0
+            if self.strategy.trailing_stop:
+                candidates |= (high[start:end] * (1 - trailing_pct)
+                               > trade.stop_loss * (1 - 1e-9))
+            if len(self._roi_durations):
+                trade_dur = (pair_data.dates[start:end] - open_date) // (60 * 10 ** 9)
+                roi_idx = self._roi_durations.searchsorted(trade_dur, side='right') - 1
+                # Profits are rounded to 8 digits - tolerance keeps this a superset.
+                candidates |= (roi_idx >= 0) & (
+                    high[start:end] * profit_factor - 1 > self._roi_ratios[roi_idx] - 1e-7)
+            hits = np.flatnonzero(candidates)
+            if len(hits):
+                return start + int(hits[0])
+            start = end
+            window *= 4
+        return nr_rows
+
+    def _next_candle_to_process(self, pair: str, pair_data: BTPairData, start: int) -> int:
+        """
+        Row index of the next candle which needs processing for the open trades of this pair.
+        """
+        if not self._fast_exits:
+            return start
+        return min(self._next_exit_candidate(trade, pair_data, start)
+                   for trade in LocalTrade.bt_trades_open_pp[pair])
+
+    @staticmethod
+    def _catch_up_trades(pair: str, pair_data: BTPairData, start: int, end: int) -> None:
+        """
+        Apply min/max rates of skipped candles (rows start to end) to the open trades of a pair.
+        """
+        if end <= start:
+            return
+        high = float(pair_data.column(HIGH_IDX - OPEN_IDX)[start:end].max())
+        low = float(pair_data.column(LOW_IDX - OPEN_IDX)[start:end].min())
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            trade.adjust_min_max_rates(high, low)
+
+    def _entry_events(self, data: Dict[str, BTPairData], pair_steps: List[np.ndarray],
+                      nr_steps: int) -> Tuple[List[int], List[int]]:
+        """
+        Candles with entry signals, sorted by loop iteration and pair order.
+        :return: Tuple of loop iterations and pair indexes
+        """
+        entry_steps: List[np.ndarray] = [np.empty(0, np.int64)]
+        entry_pairs: List[np.ndarray] = [np.empty(0, np.int64)]
+        for idx, (pair_data, steps) in enumerate(zip(data.values(), pair_steps)):
+            entries = steps[pair_data.entry_mask(self._can_short) & (steps < nr_steps)]
+            entry_steps.append(entries)
+            entry_pairs.append(np.full(len(entries), idx, dtype=np.int64))
+
+        ev_steps = np.concatenate(entry_steps)
+        ev_pairs = np.concatenate(entry_pairs)
+        order = np.lexsort((ev_pairs, ev_steps))
+        return ev_steps[order].tolist(), ev_pairs[order].tolist()
+
+    @staticmethod
+    def _register_pairs(pairs: List[str], pair_steps: List[np.ndarray]) -> None:
+        """
+        Register pairs in the order the list based loop first sees them,
+        so trades left open are closed in the same order.
+        """
+        first_steps = [(int(steps[0]), idx) for idx, steps in enumerate(pair_steps) if len(steps)]
+        for _, idx in sorted(first_steps):
+            LocalTrade.bt_trades_open_pp.setdefault(pairs[idx], {})
+
+    def _backtest_columnar(self, data: Dict[str, BTPairData], start_date: datetime,
+                           end_date: datetime) -> None:
+        """
+        Backtest loop of the columnar engine.
+        Only visits candles which can change the backtest state - candles with an entry signal
+        and candles of pairs with open trades. Iterations without any of these are skipped
+        in bulk (unless the strategy implements `bot_loop_start()`, which must see every
+        iteration). Without exit-related callbacks, candles of open trades are only visited
+        if they may trigger an exit or move the stoploss (see _next_exit_candidate()).
+        Produces the same results as _backtest_lists().
+        """
+        timeframe_td = timedelta(minutes=self.timeframe_min)
+        nr_steps = int((end_date - start_date) / timeframe_td)
+        first_step = Timestamp(start_date + timeframe_td).value
+        step_size = int(timeframe_td.total_seconds()) * 10 ** 9
+        skip_idle = not check_override(self.strategy, IStrategy, 'bot_loop_start')
+        self._fast_exits = self._fast_exits_possible()
+        roi = sorted(self.strategy.minimal_roi.items())
+        self._roi_durations = np.array([k for k, _ in roi], dtype=np.int64)
+        self._roi_ratios = np.array([v for _, v in roi], dtype=np.float64)
+
+        pairs = list(data.keys())
+        pair_steps = [data[pair].candle_steps(first_step, step_size) for pair in pairs]
+        ev_steps, ev_pairs = self._entry_events(data, pair_steps, nr_steps)
+        nr_events = len(ev_steps)
+        self._register_pairs(pairs, pair_steps)
+        ev_idx = 0
+
+        # Pairs with open trades, and the iteration they need to be processed next.
+        active: Dict[int, int] = {}
+        # First skipped candle of pairs whose open trades skipped candles.
+        skipped_from: Dict[int, int] = {}
+        self.progress.init_step(BacktestState.BACKTEST, nr_steps)
+        step = 0
+        while step < nr_steps:
+            if skip_idle:
+                next_step = min(active.values(), default=nr_steps)
+                if ev_idx < nr_events:
+                    next_step = min(next_step, ev_steps[ev_idx])
+                if next_step >= nr_steps:
+                    # Nothing left to do for open trades and no further entry signals.
+                    break
+                step = next_step
+
+            current_time = start_date + timeframe_td * (step + 1)
+            open_trade_count_start = LocalTrade.bt_open_open_trade_count
+            self.check_abort()
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=current_time)
+
+            pair_ids = {idx for idx, next_step in active.items() if next_step == step}
+            while ev_idx < nr_events and ev_steps[ev_idx] == step:
+                pair_ids.add(ev_pairs[ev_idx])
+                ev_idx += 1
+
+            for idx in sorted(pair_ids):
+                pair = pairs[idx]
+                steps = pair_steps[idx]
+                row_index = int(steps.searchsorted(step))
+                if row_index >= len(steps) or steps[row_index] != step:
+                    # No candle for this pair in this iteration.
+                    continue
+                if idx in skipped_from:
+                    self._catch_up_trades(pair, data[pair], skipped_from.pop(idx), row_index)
+                open_trade_count_start = self._process_candle(
+                    pair, data[pair][row_index], row_index + 1, current_time, end_date,
+                    open_trade_count_start)
+                if LocalTrade.bt_trades_open_pp[pair]:
+                    next_row = self._next_candle_to_process(pair, data[pair], row_index + 1)
+                    if next_row > row_index + 1:
+                        skipped_from[idx] = row_index + 1
+                    active[idx] = int(steps[next_row]) if next_row < len(steps) else nr_steps
+                else:
+                    active.pop(idx, None)
+
+            step += 1
+            self.progress.set_new_value(step)
+
+        for idx, start in skipped_from.items():
+            # Candles up to the end of the backtest
+            self._catch_up_trades(pairs[idx], data[pairs[idx]], start,
+                                  int(pair_steps[idx].searchsorted(nr_steps)))
+        self.progress.set_new_value(nr_steps)
+
+    def backtest(self, processed: Dict,
+                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """
+        Implement backtesting functionality
+
+        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
+        Of course try to not have ugly code. By some accessor are sometime slower than functions.
+        Avoid extensive logging in this method and functions it calls.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: DataFrame with trades (results of backtesting)
+        """
+        self.prepare_backtest(self.enable_protections)
+        # Ensure wallets are uptodate (important for --strategy-list)
+        self.wallets.update()
+        data: Dict
+        if self.backtest_engine == 'columnar':
+            data = self._get_ohlcv_as_arrays(processed)
+        else:
+            # Use dict of lists with data for performance
+            # (looping lists is a lot faster than pandas DataFrames)
+            data = self._get_ohlcv_as_lists(processed)
+        if self.timeframe_detail:
+            self._index_detail_data(data)
+
+        if self.backtest_engine == 'columnar':
+            self._backtest_columnar(data, start_date, end_date)
+        else:
+            self._backtest_lists(data, start_date, end_date)
+
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
 
@@ -1258,6 +1545,15 @@ class Backtesting:
             'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
         }
 
+    def advise_all_indicators(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Populate indicators of the current strategy for all pairs.
+        Uses indicators cached by earlier runs if `indicator_cache` is enabled.
+        """
+        if self.config.get('indicator_cache', False):
+            return IndicatorCache(self.config, self.strategy).advise_all_indicators(data)
+        return self.strategy.advise_all_indicators(data)
+
     def backtest_one_strategy(self, strat: IStrategy, data: Dict[str, DataFrame],
                               timerange: TimeRange):
         self.progress.init_step(BacktestState.ANALYZE, 0)
@@ -1274,7 +1570,7 @@ class Backtesting:
             self.config.update({'max_open_trades': self.strategy.max_open_trades})
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
@@ -1312,6 +1608,46 @@ class Backtesting:
 
         return min_date, max_date
 
+    def _backtest_one_strategy_worker(self, strategy_index: int, data: Dict[str, DataFrame],
+                                      timerange: TimeRange) -> Tuple:
+        """
+        Run backtest_one_strategy() in a worker process, and return all its results.
+        """
+        strat = self.strategylist[strategy_index]
+        min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+        strategy_name = strat.get_strategy_name()
+        return (strategy_name, self.all_results[strategy_name],
+                self.processed_dfs.get(strategy_name), self.rejected_df.get(strategy_name),
+                min_date, max_date)
+
+    def backtest_strategies_parallel(self, strategies: List[IStrategy],
+                                     data: Dict[str, DataFrame], timerange: TimeRange,
+                                     jobs: int) -> Tuple[datetime, datetime]:
+        """
+        Backtest multiple strategies in parallel worker processes.
+        Loaded data is passed to the workers as copy-on-write memory maps - it's shared by
+        all workers, while each worker analyzes and backtests one strategy at a time.
+        :return: Combined timerange of all strategies
+        """
+        logger.info(f'Backtesting {len(strategies)} strategies using {jobs} parallel workers.')
+        # The exchange is not used by backtesting anymore. Workers receive it without
+        # connections (see Exchange.__getstate__()).
+        self.exchange.close()
+
+        worker = wrap_non_picklable_objects(self._backtest_one_strategy_worker)
+        with Parallel(n_jobs=jobs, mmap_mode='c') as parallel:
+            results = parallel(delayed(worker)(self.strategylist.index(strat), data, timerange)
+                               for strat in strategies)
+
+        timeranges = []
+        for strategy_name, result, processed_df, rejected_df, min_date, max_date in results:
+            self.all_results[strategy_name] = result
+            if processed_df is not None:
+                self.processed_dfs[strategy_name] = processed_df
+                self.rejected_df[strategy_name] = rejected_df
+            timeranges.append((min_date, max_date))
+        return min(start for start, _ in timeranges), max(end for _, end in timeranges)
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get('backtest_cache', constants.BACKTEST_CACHE_DEFAULT)
@@ -1351,12 +1687,24 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results['strategy']:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f'Reusing result of previous backtest for {strat.get_strategy_name()}')
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        jobs = min(effective_n_jobs(self.config.get('backtest_jobs', 1)), len(strategies))
+        if jobs > 1:
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, timerange, jobs)
+        else:
+            timeranges = [self.backtest_one_strategy(strat, data, timerange)
+                          for strat in strategies]
+            if timeranges:
+                min_date = min(start for start, _ in timeranges)
+                max_date = max(end for _, end in timeranges)
 
         # Update old results with new ones.
         if len(self.all_results) > 0:
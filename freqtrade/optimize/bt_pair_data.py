@@ -0,0 +1,121 @@
+"""
+Columnar storage of backtesting candles.
+"""
+from collections.abc import Sequence
+from typing import Any, List
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+
+class BTPairData(Sequence):
+    """
+    Signal candles of one pair, stored as contiguous NumPy arrays.
+
+    Indexing returns the same row-lists the list based engine works with
+    (see `HEADERS` in backtesting.py), so rows can be passed to the regular
+    backtesting logic unchanged. Rows are only materialized when accessed.
+    """
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray,
+                 enter_tags: np.ndarray, exit_tags: np.ndarray) -> None:
+        """
+        :param dates: Candle open times as int64 (nanoseconds since epoch, UTC)
+        :param values: open, high, low, close, enter_long, exit_long, enter_short, exit_short
+            as float64 array with one row per candle
+        :param enter_tags: Entry tags (object array)
+        :param exit_tags: Exit tags (object array)
+        """
+        self.dates = dates
+        # Fortran order keeps every column contiguous for vectorized operations.
+        self.values = np.asfortranarray(values, dtype=np.float64)
+        self.enter_tags = enter_tags
+        self.exit_tags = exit_tags
+        self._date_index = to_datetime(dates, utc=True)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, index) -> Any:
+        return [self._date_index[index], *self.values[index].tolist(),
+                self.enter_tags[index], self.exit_tags[index]]
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        Return one column of `values` (open=0 ... exit_short=7) as contiguous view.
+        """
+        return self.values[:, index]
+
+    def entry_mask(self, can_short: bool) -> np.ndarray:
+        """
+        Candles which may open a new trade.
+        """
+        mask = self.column(4) == 1
+        if can_short:
+            mask |= self.column(6) == 1
+        return mask
+
+    def candle_steps(self, first_step: int, step_size: int) -> np.ndarray:
+        """
+        Backtest loop iteration in which each candle is processed.
+        Mirrors the list based loop - a candle is used in the first iteration at or after
+        its date, but never in the same iteration as the previous candle of this pair.
+        :param first_step: Time of the first loop iteration (ns since epoch)
+        :param step_size: Time between two loop iterations (ns)
+        :return: int64 array with one iteration index per candle
+        """
+        earliest = np.maximum(-((first_step - self.dates) // step_size), 0)
+        offsets = np.arange(len(self.dates), dtype=np.int64)
+        if len(offsets) == 0:
+            return offsets
+        return offsets + np.maximum.accumulate(earliest - offsets)
+
+
+class BTDetailData:
+    """
+    Detail timeframe candles of one pair, stored as one NumPy array per column.
+
+    Columns are views on the dataframe's arrays where possible - so memory-mapped
+    detail data is not copied into memory.
+    After index_candles(), the detail candles belonging to each main candle are
+    available as slice - without scanning the detail data.
+    """
+
+    def __init__(self, dates: np.ndarray, columns: List[np.ndarray]) -> None:
+        """
+        :param dates: Candle open times as int64 (nanoseconds since epoch, UTC), sorted
+        :param columns: open, high, low, close - one float64 array each
+        """
+        self.dates = dates
+        self.columns = columns
+        self._date_index = to_datetime(dates, utc=True)
+        self._starts = np.empty(0, dtype=np.int64)
+        self._ends = np.empty(0, dtype=np.int64)
+
+    @classmethod
+    def from_dataframe(cls, dataframe: DataFrame) -> 'BTDetailData':
+        return cls(to_datetime(dataframe['date'], utc=True).values.view(np.int64),
+                   [dataframe[col].to_numpy(dtype=np.float64)
+                    for col in ('open', 'high', 'low', 'close')])
+
+    def index_candles(self, candle_dates: np.ndarray, candle_length: int) -> None:
+        """
+        Precompute the detail candle range of each main candle.
+        :param candle_dates: Open times of the main candles (ns since epoch)
+        :param candle_length: Length of one main candle (ns)
+        """
+        self._starts = self.dates.searchsorted(candle_dates, side='left')
+        self._ends = self.dates.searchsorted(candle_dates + candle_length, side='left')
+
+    def candle_rows(self, candle_index: int, signals: Sequence) -> List[Any]:
+        """
+        Detail rows of one main candle, in the row format of the backtesting engines.
+        :param candle_index: Index of the main candle, as passed to index_candles()
+        :param signals: Signal columns of the main candle (enter_long ... exit_tag)
+        :return: List of rows - empty if no detail data exists for this candle
+        """
+        start = self._starts[candle_index]
+        end = self._ends[candle_index]
+        return [[date, *values, *signals] for date, *values
+                in zip(self._date_index[start:end],
+                       *(column[start:end].tolist() for column in self.columns))]
@@ -8,26 +8,31 @@ import logging
 import random
 import sys
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
 
 import rapidjson
 from colorama import init as colorama_init
 from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
-from rich.progress import (BarColumn, MofNCompleteColumn, Progress, TaskProgressColumn, TextColumn,
-                           TimeElapsedColumn, TimeRemainingColumn)
+from rich.progress import (BarColumn, MofNCompleteColumn, Progress, TaskID, TaskProgressColumn,
+                           TextColumn, TimeElapsedColumn, TimeRemainingColumn)
 
-from freqtrade.constants import DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
+from freqtrade.constants import (DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION,
+                                 HYPEROPT_SCHEDULER_DEFAULT, LAST_BT_RESULT_FN, Config)
 from freqtrade.data.converter import trim_dataframes
 from freqtrade.data.history import get_timerange
 from freqtrade.data.metrics import calculate_market_change
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, file_dump_json, plural
+from freqtrade.optimize.backtest_caching import get_epoch_params_hash, get_hyperopt_run_id
 from freqtrade.optimize.backtesting import Backtesting
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
@@ -65,6 +70,12 @@ class Hyperopt:
     hyperopt.start()
     """
 
+    # Preprocessed data attached by this process, keyed by data token.
+    # Kept across epochs, so workers only open the data file once.
+    _attached_data: Tuple[str, Dict[str, DataFrame]] = ('', {})
+    # Columns of the attached data the strategy modifies in place - copied for every epoch.
+    _written_columns: Set[str] = set()
+
     def __init__(self, config: Config) -> None:
         self.buy_space: List[Dimension] = []
         self.sell_space: List[Dimension] = []
@@ -105,7 +116,16 @@ class Hyperopt:
                                    f'strategy_{strategy}_{time_now}.fthypt')
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
+        # Identifies the current content of data_pickle_file
+        self.data_token = uuid4().hex
         self.total_epochs = config.get('epochs', 0)
+        self.epoch_cache_enabled = self.config.get('epoch_cache', False)
+        self.scheduler = self.config.get('hyperopt_scheduler', HYPEROPT_SCHEDULER_DEFAULT)
+        # Results file and offset of evaluated epochs, by hash of their parameters
+        self.epoch_cache: Dict[str, Tuple[Path, int]] = {}
+        # Epochs of all runs with the same run_id are indexed in <run_id>.jsonl
+        self.epoch_cache_dir = self.results_file.parent / 'epoch_cache'
+        self.run_id = ''
 
         self.current_best_loss = 100
 
@@ -139,6 +159,8 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
+        Hyperopt._attached_data = ('', {})
+        Hyperopt._written_columns = set()
         for f in [self.data_pickle_file, self.results_file]:
             p = Path(f)
             if p.is_file():
@@ -175,10 +197,13 @@ class Hyperopt:
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
+        offset = self.results_file.stat().st_size if self.results_file.is_file() else 0
         with self.results_file.open('a') as f:
             rapidjson.dump(epoch, f, default=hyperopt_serializer,
                            number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN)
             f.write("\n")
+        if 'params_hash' in epoch and epoch['params_hash'] not in self.epoch_cache:
+            self._add_to_epoch_cache(epoch['params_hash'], self.results_file, offset)
 
         self.num_epochs_saved += 1
         logger.debug(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
@@ -351,17 +376,7 @@ class Hyperopt:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
-
-        bt_results = self.backtesting.backtest(
-            processed=processed,
-            start_date=self.min_date,
-            end_date=self.max_date
-        )
+        bt_results, processed = self.backtest_epoch()
         backtest_end_time = datetime.now(timezone.utc)
         bt_results.update({
             'backtest_start_time': int(backtest_start_time.timestamp()),
@@ -372,6 +387,45 @@ class Hyperopt:
                                       params_dict,
                                       processed=processed)
 
+    def _run_backtest(self, processed: Dict[str, DataFrame]
+                      ) -> Tuple[Dict[str, Any], Dict[str, DataFrame]]:
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
+
+        bt_results = self.backtesting.backtest(
+            processed=processed,
+            start_date=self.min_date,
+            end_date=self.max_date
+        )
+        return bt_results, processed
+
+    def backtest_epoch(self) -> Tuple[Dict[str, Any], Dict[str, DataFrame]]:
+        """
+        Backtest the published data with the parameters of this epoch.
+        If the strategy modifies columns of the (read-only) published data in place,
+        the epoch is repeated on private copies, and the modified columns are copied
+        for all following epochs.
+        :return: Backtest results and the processed data.
+        """
+        try:
+            return self._run_backtest(self.load_hyperopt_data())
+        except ValueError as e:
+            if 'read-only' not in str(e):
+                raise
+        data = self.load_hyperopt_data(copy_all=True)
+        bt_results, processed = self._run_backtest(dict(data))
+
+        attached = Hyperopt._attached_data[1]
+        written = {col for pair, df in data.items() for col in attached[pair].columns
+                   if not df[col].equals(attached[pair][col])}
+        # Values written in place may be unchanged - copy all columns in this case.
+        Hyperopt._written_columns |= written or {
+            col for df in attached.values() for col in df.columns}
+        logger.info(f"Strategy modifies columns {sorted(Hyperopt._written_columns)} in place. "
+                    "Copying them for every epoch.")
+        return bt_results, processed
+
     def _get_results_dict(self, backtesting_results, min_date, max_date,
                           params_dict, processed: Dict[str, DataFrame]
                           ) -> Dict[str, Any]:
@@ -439,11 +493,195 @@ class Hyperopt:
         return parallel(delayed(
                         wrap_non_picklable_objects(self.generate_optimizer))(v) for v in asked)
 
+    def init_epoch_cache(self) -> None:
+        """
+        Identify this run and load the index of epochs of earlier runs with identical strategy,
+        configuration, loss function and data - their results can be reused.
+        """
+        # The resolver stores the source file of the loss function class.
+        loss_file = Path(getattr(self.custom_hyperoptloss, '__file__', ''))
+        self.run_id = get_hyperopt_run_id(self.backtesting.strategy,
+                                          [loss_file, self.data_pickle_file])
+        index_file = self.epoch_cache_dir / f'{self.run_id}.jsonl'
+        if index_file.is_file():
+            with index_file.open('r') as f:
+                for line in f:
+                    params_hash, file_name, offset = rapidjson.loads(line)
+                    results_file = self.results_file.parent / file_name
+                    if results_file.is_file():
+                        self.epoch_cache.setdefault(params_hash, (results_file, offset))
+        if self.epoch_cache:
+            logger.info(f"Found {len(self.epoch_cache)} evaluated "
+                        f"{plural(len(self.epoch_cache), 'epoch')} of earlier hyperopt runs.")
+
+    def _add_to_epoch_cache(self, params_hash: str, results_file: Path, offset: int) -> None:
+        self.epoch_cache[params_hash] = (results_file, offset)
+        if self.epoch_cache_enabled and self.run_id:
+            self.epoch_cache_dir.mkdir(parents=True, exist_ok=True)
+            with (self.epoch_cache_dir / f'{self.run_id}.jsonl').open('a') as f:
+                f.write(rapidjson.dumps([params_hash, results_file.name, offset]) + '\n')
+
+    def _load_cached_epoch(self, params_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Load results of an evaluated epoch with these parameters.
+        :return: Epoch results - None if the epoch isn't cached (anymore), e.g. because its
+            results file has been modified.
+        """
+        if params_hash not in self.epoch_cache:
+            return None
+        results_file, offset = self.epoch_cache[params_hash]
+        try:
+            with results_file.open('rb') as f:
+                f.seek(offset)
+                epoch = rapidjson.loads(f.readline())
+        except (OSError, ValueError):
+            epoch = None
+        if (not isinstance(epoch, dict) or epoch.get('params_hash') != params_hash
+                or epoch.get('run_id') != self.run_id):
+            del self.epoch_cache[params_hash]
+            return None
+        return epoch
+
+    def _get_params_hash(self, params_dict: Dict[str, Any]) -> str:
+        return get_epoch_params_hash(self._get_params_details(params_dict))
+
+    def run_epochs(self, parallel: Parallel, asked: List[List]) -> List[Dict[str, Any]]:
+        """
+        Evaluate the asked points.
+        Points with the same effective parameters as an already evaluated epoch reuse
+        its results instead of running a backtest.
+        """
+        if not self.epoch_cache_enabled:
+            return self.run_optimizer_parallel(parallel, asked)
+
+        params = [self._get_params_dict(self.dimensions, raw_params) for raw_params in asked]
+        hashes = [self._get_params_hash(p) for p in params]
+        results: Dict[str, Dict[str, Any]] = {}
+        to_run: Dict[str, List] = {}
+        for params_hash, raw_params in zip(hashes, asked):
+            if params_hash in results or params_hash in to_run:
+                continue
+            cached = self._load_cached_epoch(params_hash)
+            if cached is not None:
+                results[params_hash] = cached
+            else:
+                to_run[params_hash] = raw_params
+        if to_run:
+            results.update(zip(to_run, self.run_optimizer_parallel(parallel,
+                                                                   list(to_run.values()))))
+        epochs = []
+        for params_hash, params_dict in zip(hashes, params):
+            epoch = {**results[params_hash], 'run_id': self.run_id, 'params_hash': params_hash}
+            if to_run.pop(params_hash, None) is None:
+                # Reused results of another point
+                epoch['params_dict'] = params_dict
+            epochs.append(epoch)
+        return epochs
+
+    def _get_reusable_epoch(self, raw_params: List[Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Results of an evaluated epoch with the same parameters, if available.
+        :return: Tuple of epoch results (None if not available) and params hash
+        """
+        if not self.epoch_cache_enabled:
+            return None, ''
+        params_dict = self._get_params_dict(self.dimensions, raw_params)
+        params_hash = self._get_params_hash(params_dict)
+        cached = self._load_cached_epoch(params_hash)
+        if cached is None:
+            return None, params_hash
+        return {**cached, 'params_dict': params_dict,
+                'run_id': self.run_id, 'params_hash': params_hash}, params_hash
+
+    def run_epochs_batched(self, parallel: Parallel, jobs: int, start: int,
+                           pbar: Progress, task: TaskID) -> None:
+        """
+        Evaluate epochs in batches of `jobs` points.
+        """
+        evals = ceil((self.total_epochs - start) / jobs)
+        for i in range(evals):
+            # Correct the number of epochs to be processed for the last
+            # iteration (should not exceed self.total_epochs in total)
+            n_rest = (i + 1) * jobs - (self.total_epochs - start)
+            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+            asked, is_random = self.get_asked_points(n_points=current_jobs)
+            f_val = self.run_epochs(parallel, asked)
+            self.opt.tell(asked, [v['loss'] for v in f_val])
+
+            for j, val in enumerate(f_val):
+                # Use human-friendly indexes here (starting from 1)
+                current = i * jobs + j + 1 + start
+
+                self.evaluate_result(val, current, is_random[j])
+                pbar.update(task, advance=1)
+
+    def run_epochs_async(self, executor: Executor, jobs: int, start: int,
+                         pbar: Progress, task: TaskID) -> None:
+        """
+        Evaluate epochs without waiting for whole batches.
+        Every finished epoch is told to the optimizer right away, and a new point is
+        asked to replace it - so no worker waits for slow epochs of other workers.
+        """
+        # Running epochs - with their point, "is_random" flag and params hash
+        running: Dict[Future, Tuple[List[Any], bool, str]] = {}
+        # Points waiting for a running epoch with the same params hash
+        duplicates: Dict[Future, List[Tuple[List[Any], bool]]] = {}
+        current = start
+        submitted = start
+        while current < self.total_epochs:
+            finished: List[Tuple[List[Any], Dict[str, Any], bool]] = []
+            free_jobs = min(jobs - len(running), self.total_epochs - submitted)
+            if free_jobs > 0:
+                asked, is_random = self.get_asked_points(
+                    n_points=free_jobs,
+                    exclude=[v[0] for v in running.values()]
+                    + [d[0] for dups in duplicates.values() for d in dups])
+                submitted += len(asked)
+                running_hashes = {v[2]: f for f, v in running.items() if v[2]}
+                for raw_params, rand in zip(asked, is_random):
+                    val, params_hash = self._get_reusable_epoch(raw_params)
+                    if val is not None:
+                        finished.append((raw_params, val, rand))
+                    elif params_hash in running_hashes:
+                        # Reuse the results of the running epoch once it's finished
+                        duplicates.setdefault(running_hashes[params_hash], []).append(
+                            (raw_params, rand))
+                    else:
+                        future = executor.submit(
+                            wrap_non_picklable_objects(self.generate_optimizer), raw_params)
+                        running[future] = (raw_params, rand, params_hash)
+                        if params_hash:
+                            running_hashes[params_hash] = future
+
+            if not finished:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    raw_params, rand, params_hash = running.pop(future)
+                    result = future.result()
+                    if params_hash:
+                        result.update({'run_id': self.run_id, 'params_hash': params_hash})
+                    finished.append((raw_params, result, rand))
+                    for dup_params, dup_rand in duplicates.pop(future, []):
+                        finished.append((dup_params, {
+                            **result,
+                            'params_dict': self._get_params_dict(self.dimensions, dup_params)
+                        }, dup_rand))
+
+            self.opt.tell([v[0] for v in finished], [v[1]['loss'] for v in finished])
+            for _, val, rand in finished:
+                current += 1
+                self.evaluate_result(val, current, rand)
+                pbar.update(task, advance=1)
+
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
     def advise_and_trim(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        if self.analyze_per_epoch:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        else:
+            preprocessed = self.backtesting.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         trimmed = trim_dataframes(preprocessed, self.timerange, self.backtesting.required_startup)
@@ -470,13 +708,48 @@ class Hyperopt:
                         f'up to {self.max_date.strftime(DATETIME_PRINT_FORMAT)} '
                         f'({(self.max_date - self.min_date).days} days)..')
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self.dump_hyperopt_data(preprocessed)
         else:
-            dump(data, self.data_pickle_file)
+            self.dump_hyperopt_data(data)
+
+    def dump_hyperopt_data(self, data: Dict[str, DataFrame]) -> None:
+        """
+        Publish data for all workers.
+        """
+        dump(data, self.data_pickle_file)
+        self.data_token = uuid4().hex
 
-    def get_asked_points(self, n_points: int) -> Tuple[List[List[Any]], List[bool]]:
+    def load_hyperopt_data(self, copy_all: bool = False) -> Dict[str, DataFrame]:
+        """
+        Attach to the published data.
+        Arrays are memory-mapped read-only from data_pickle_file, so all workers share one
+        copy through the page cache. The attachment is kept for all following epochs
+        in this process - only the first epoch of each worker opens the file.
+        :param copy_all: Copy all columns instead of only columns the strategy modifies.
+        :return: Shallow copies of the dataframes - columns added during an epoch
+            don't leak into the attached data. Columns the strategy modifies in place
+            are copied.
+        """
+        if Hyperopt._attached_data[0] != self.data_token:
+            # Memory-mapping requires the filename - file objects are loaded into memory.
+            Hyperopt._attached_data = (self.data_token,
+                                       load(self.data_pickle_file, mmap_mode='r'))
+            Hyperopt._written_columns = set()
+        data = {}
+        for pair, attached in Hyperopt._attached_data[1].items():
+            if copy_all:
+                data[pair] = attached.copy()
+                continue
+            data[pair] = df = attached.copy(deep=False)
+            for col in Hyperopt._written_columns.intersection(df.columns):
+                df[col] = attached[col].to_numpy(copy=True)
+        return data
+
+    def get_asked_points(self, n_points: int, exclude: Optional[List[List[Any]]] = None
+                         ) -> Tuple[List[List[Any]], List[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
+        (nor are part of `exclude`, e.g. points currently being evaluated)
 
         Steps:
         1. Try to get points using `self.opt.ask` first
@@ -493,6 +766,7 @@ class Hyperopt:
                     new_list.append(item)
             return new_list
         i = 0
+        exclude = exclude or []
         asked_non_tried: List[List[Any]] = []
         is_random_non_tried: List[bool] = []
         while i < 5 and len(asked_non_tried) < n_points:
@@ -505,9 +779,11 @@ class Hyperopt:
                 is_random = [True for _ in range(len(asked))]
             is_random_non_tried += [rand for x, rand in zip(asked, is_random)
                                     if x not in self.opt.Xi
+                                    and x not in exclude
                                     and x not in asked_non_tried]
             asked_non_tried += [x for x in asked
                                 if x not in self.opt.Xi
+                                and x not in exclude
                                 and x not in asked_non_tried]
             i += 1
 
@@ -551,15 +827,12 @@ class Hyperopt:
         self.init_spaces()
 
         self.prepare_hyperopt_data()
+        if self.epoch_cache_enabled:
+            self.init_epoch_cache()
 
-        # We don't need exchange instance anymore while running hyperopt
+        # We don't need exchange instance anymore while running hyperopt.
+        # Workers receive it without connections (see Exchange.__getstate__()).
         self.backtesting.exchange.close()
-        self.backtesting.exchange._api = None
-        self.backtesting.exchange._api_async = None
-        self.backtesting.exchange.loop = None  # type: ignore
-        self.backtesting.exchange._loop_lock = None  # type: ignore
-        self.backtesting.exchange._cache_lock = None  # type: ignore
-        # self.backtesting.exchange = None  # type: ignore
         self.backtesting.pairlists = None  # type: ignore
 
         cpus = cpu_count()
@@ -603,23 +876,15 @@ class Hyperopt:
                         pbar.update(task, advance=1)
                         start += 1
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
+                    if self.scheduler == 'async':
+                        executor = get_reusable_executor(max_workers=jobs)
+                        try:
+                            self.run_epochs_async(executor, jobs, start, pbar, task)
+                        finally:
+                            # Don't keep workers (and their copy of the data) alive
+                            executor.shutdown(wait=True)
+                    else:
+                        self.run_epochs_batched(parallel, jobs, start, pbar, task)
 
         except KeyboardInterrupt:
             print('User interrupted..')
@@ -0,0 +1,121 @@
+"""
+On-disk cache of dataframes analyzed by populate_indicators(), used by backtesting and hyperopt.
+"""
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from pandas import DataFrame, read_feather
+
+from freqtrade.constants import Config
+from freqtrade.data.history.idatahandler import get_datahandler
+from freqtrade.enums import CandleType
+from freqtrade.misc import pair_to_filename
+from freqtrade.optimize.backtest_caching import get_indicator_run_id
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorCache:
+    """
+    Stores the analyzed dataframe of every pair as feather file in
+    `user_data/indicator_cache/<strategy>/`.
+    Cached dataframes are only reused if populate_indicators() (including informative
+    functions and helpers they call), parameters used by it, freqtrade / TA-Lib versions,
+    informative pairs and the data are unchanged.
+    """
+
+    def __init__(self, config: Config, strategy: IStrategy) -> None:
+        self._strategy = strategy
+        self._timeframe = strategy.timeframe
+        self._candle_type = CandleType.from_string(
+            config.get('candle_type_def', CandleType.SPOT))
+        self._cache_dir: Path = (config['user_data_dir'] / 'indicator_cache' /
+                                 strategy.get_strategy_name())
+        self._datadir: Path = config['datadir']
+        self._datahandler = get_datahandler(self._datadir, config.get('dataformat_ohlcv'))
+
+        informative_files = sorted(
+            self._data_file(pair, timeframe, CandleType.from_string(candle_type))
+            for pair, timeframe, candle_type in strategy.gather_informative_pairs()
+        )
+        self._run_id = get_indicator_run_id(strategy, informative_files)
+
+    def _data_file(self, pair: str, timeframe: str, candle_type: CandleType) -> Path:
+        return self._datahandler._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+
+    def _cache_file(self, pair: str, dataframe: DataFrame) -> Path:
+        """
+        Cache file of one pair - identifying strategy and the candles passed to the strategy.
+        """
+        digest = hashlib.sha1(self._run_id.encode('utf-8'))
+        if not dataframe.empty:
+            digest.update(f"{dataframe['date'].iloc[0]}{dataframe['date'].iloc[-1]}"
+                          f"{len(dataframe)}".encode())
+        data_file = self._data_file(pair, self._timeframe, self._candle_type)
+        if data_file.is_file():
+            digest.update(str(data_file.stat().st_mtime_ns).encode('utf-8'))
+        return self._cache_dir / (f'{self._file_prefix(pair)}_{digest.hexdigest().lower()}'
+                                  '.feather')
+
+    def _file_prefix(self, pair: str) -> str:
+        return f'{pair_to_filename(pair)}-{self._timeframe}'
+
+    def load(self, pair: str, dataframe: DataFrame) -> Optional[DataFrame]:
+        """
+        Load the analyzed dataframe of this pair.
+        :param pair: Pair of the dataframe
+        :param dataframe: Dataframe, as it would be passed to populate_indicators()
+        :return: Analyzed dataframe, or None if it's not cached.
+        """
+        cache_file = self._cache_file(pair, dataframe)
+        if not cache_file.is_file():
+            return None
+        analyzed = read_feather(cache_file)
+        if len(analyzed) == len(dataframe):
+            # Feather files don't store the index
+            analyzed.index = dataframe.index
+        return analyzed
+
+    def store(self, pair: str, dataframe: DataFrame, analyzed: DataFrame) -> None:
+        """
+        Store the analyzed dataframe of this pair, replacing outdated cache files.
+        :param pair: Pair of the dataframe
+        :param dataframe: Dataframe, as it has been passed to populate_indicators()
+        :param analyzed: Dataframe returned from populate_indicators()
+        """
+        cache_file = self._cache_file(pair, dataframe)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        for outdated in self._cache_dir.glob(f'{self._file_prefix(pair)}_*.feather'):
+            outdated.unlink()
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            analyzed.reset_index(drop=True).to_feather(tmp_file)
+        except (ValueError, TypeError) as e:
+            # Feather requires string column names and columns of consistent types.
+            logger.warning(f'Could not cache indicators of {pair}: {e}')
+            tmp_file.unlink(missing_ok=True)
+            return
+        tmp_file.replace(cache_file)
+
+    def advise_all_indicators(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Drop-in replacement for IStrategy.advise_all_indicators(), only analyzing
+        pairs which are not cached.
+        """
+        processed: Dict[str, Optional[DataFrame]] = {
+            pair: self.load(pair, pair_data) for pair, pair_data in data.items()}
+        missing = {pair: data[pair] for pair, analyzed in processed.items() if analyzed is None}
+        if len(missing) < len(data):
+            logger.info(f'Using cached indicators for {len(data) - len(missing)} of '
+                        f'{len(data)} pairs.')
+        if missing:
+            analyzed_missing = self._strategy.advise_all_indicators(missing)
+            for pair, analyzed in analyzed_missing.items():
+                self.store(pair, missing[pair], analyzed)
+            processed.update(analyzed_missing)
+        return {pair: analyzed for pair, analyzed in processed.items()
+                if analyzed is not None}
@@ -1,6 +1,7 @@
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
-from typing import List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from sqlalchemy import select
 
@@ -20,6 +21,12 @@ class PairLocks:
 
     use_db = True
     locks: List[PairLock] = []
+    # Backtesting only - locks by pair ('*' for global locks), sorted by lock_end_time,
+    # and the matching lock end times. Locks still active at a given time are found by
+    # bisecting the end times - without visiting expired locks.
+    # Expired locks are dropped when locking the pair again (see _prune_expired_locks()).
+    _locks_by_pair: Dict[str, List[PairLock]] = {}
+    _lock_ends_by_pair: Dict[str, List[datetime]] = {}
 
     timeframe: str = ''
 
@@ -30,6 +37,8 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._locks_by_pair = {}
+            PairLocks._lock_ends_by_pair = {}
 
     @staticmethod
     def lock_pair(pair: str, until: datetime, reason: Optional[str] = None, *,
@@ -57,8 +66,27 @@ class PairLocks:
             PairLock.session.commit()
         else:
             PairLocks.locks.append(lock)
+            if now:
+                PairLocks._prune_expired_locks(pair, now)
+            ends = PairLocks._lock_ends_by_pair.setdefault(pair, [])
+            idx = bisect_right(ends, lock.lock_end_time)
+            ends.insert(idx, lock.lock_end_time)
+            PairLocks._locks_by_pair.setdefault(pair, []).insert(idx, lock)
         return lock
 
+    @staticmethod
+    def _prune_expired_locks(pair: str, now: datetime) -> None:
+        """
+        Backtesting only - drop locks of this pair which ended before now from the index.
+        Backtesting passes the (monotonic) backtest time as now - locks ending before are
+        not looked up anymore. get_all_locks() still returns them.
+        """
+        ends = PairLocks._lock_ends_by_pair.get(pair)
+        if ends:
+            expired = bisect_left(ends, now)
+            del ends[:expired]
+            del PairLocks._locks_by_pair[pair][:expired]
+
     @staticmethod
     def get_pair_locks(pair: Optional[str], now: Optional[datetime] = None,
                        side: str = '*') -> Sequence[PairLock]:
@@ -74,12 +102,18 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
-            locks = [lock for lock in PairLocks.locks if (
-                lock.lock_end_time >= now
-                and lock.active is True
-                and (pair is None or lock.pair == pair)
-                and (lock.side == '*' or lock.side == side)
-            )]
+            pairs: Iterable[str] = PairLocks._locks_by_pair.keys() if pair is None else [pair]
+            locks: List[PairLock] = []
+            for lock_pair in pairs:
+                ends = PairLocks._lock_ends_by_pair.get(lock_pair)
+                if not ends or ends[-1] < now:
+                    continue
+                # Locks ending before now are expired - skip them
+                start = bisect_left(ends, now)
+                locks.extend(lock for lock in PairLocks._locks_by_pair[lock_pair][start:] if (
+                    lock.active is True
+                    and (lock.side == '*' or lock.side == side)
+                ))
             return locks
 
     @staticmethod
@@ -5,7 +5,8 @@ import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from math import isclose
-from typing import Any, ClassVar, Dict, List, Optional, Sequence, cast
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, cast
 
 from sqlalchemy import (Enum, Float, ForeignKey, Integer, ScalarResult, Select, String,
                         UniqueConstraint, desc, func, select)
@@ -295,6 +296,32 @@ class Order(ModelBase):
         return Order.session.scalars(select(Order).filter(Order.order_id == order_id)).first()
 
 
+class _OpenTradesList:
+    """
+    Open backtest trades, in the order they were opened - as list copy of the
+    LocalTrade._trades_open index.
+    """
+
+    def __get__(self, obj: Any, owner: Any) -> List['LocalTrade']:
+        return list(owner._trades_open)
+
+
+def _open_trade_total(name: str) -> Any:
+    """
+    Trade attribute summed up for all open backtest trades (bt_open_stake_amount /
+    bt_open_realized_profit) - updating the totals whenever it's set.
+    The value itself is stored as `_<name>`.
+    """
+    private_name = f'_{name}'
+
+    def setter(trade: 'LocalTrade', value: float) -> None:
+        trade.__dict__[private_name] = value
+        if trade in LocalTrade._trades_open:
+            LocalTrade.bt_update_open_totals(trade)
+
+    return property(attrgetter(private_name), setter)
+
+
 class LocalTrade:
     """
     Trade database model.
@@ -303,13 +330,26 @@ class LocalTrade:
     """
     use_db: bool = False
     # Trades container for backtesting
+    # Closed trades, in the order they were closed
     trades: List['LocalTrade'] = []
-    trades_open: List['LocalTrade'] = []
+    # Open trades (in the order they were opened)
+    trades_open = _OpenTradesList()
+    # Index of open trades, mapped to the stake amount and realized profit
+    # accounted for in bt_open_stake_amount / bt_open_realized_profit.
+    _trades_open: Dict['LocalTrade', Tuple[float, float]] = {}
     # Copy of trades_open - but indexed by pair
-    bt_trades_open_pp: Dict[str, List['LocalTrade']] = defaultdict(list)
+    bt_trades_open_pp: Dict[str, Dict['LocalTrade', None]] = defaultdict(dict)
+    # Copy of trades - but indexed by pair
+    bt_trades_closed_pp: Dict[str, List['LocalTrade']] = defaultdict(list)
     bt_open_open_trade_count: int = 0
+    bt_open_stake_amount: float = 0
+    bt_open_realized_profit: float = 0
     total_profit: float = 0
-    realized_profit: float = 0
+    _realized_profit: float = 0
+    realized_profit: float = _open_trade_total('realized_profit')
+    # Use float math instead of FtPrecise (string math) for trade values and profits.
+    # Considerably faster - but subject to float rounding. Only enabled in backtesting.
+    float_math: bool = False
 
     id: int = 0
 
@@ -334,7 +374,8 @@ class LocalTrade:
     close_rate_requested: Optional[float] = None
     close_profit: Optional[float] = None
     close_profit_abs: Optional[float] = None
-    stake_amount: float = 0.0
+    _stake_amount: float = 0.0
+    stake_amount: float = _open_trade_total('stake_amount')
     max_stake_amount: Optional[float] = 0.0
     amount: float = 0.0
     amount_requested: Optional[float] = None
@@ -589,9 +630,12 @@ class LocalTrade:
         Resets all trades. Only active for backtesting mode.
         """
         LocalTrade.trades = []
-        LocalTrade.trades_open = []
-        LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade._trades_open = {}
+        LocalTrade.bt_trades_open_pp = defaultdict(dict)
+        LocalTrade.bt_trades_closed_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
+        LocalTrade.bt_open_stake_amount = 0
+        LocalTrade.bt_open_realized_profit = 0
         LocalTrade.total_profit = 0
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
@@ -795,8 +839,9 @@ class LocalTrade:
         Calculate the open_rate including open_fee.
         :return: Price in of the open trade incl. Fees
         """
-        open_trade = FtPrecise(amount) * FtPrecise(open_rate)
-        fees = open_trade * FtPrecise(self.fee_open)
+        num = float if self.float_math else FtPrecise
+        open_trade = num(amount) * num(open_rate)
+        fees = open_trade * num(self.fee_open)
         if self.is_short:
             return float(open_trade - fees)
         else:
@@ -830,9 +875,9 @@ class LocalTrade:
         return interest(exchange_name=self.exchange, borrowed=borrowed, rate=rate, hours=hours)
 
     def _calc_base_close(self, amount: FtPrecise, rate: float, fee: Optional[float]) -> FtPrecise:
-
-        close_trade = amount * FtPrecise(rate)
-        fees = close_trade * FtPrecise(fee or 0.0)
+        num = float if self.float_math else FtPrecise
+        close_trade = amount * num(rate)
+        fees = close_trade * num(fee or 0.0)
 
         if self.is_short:
             return close_trade + fees
@@ -848,7 +893,8 @@ class LocalTrade:
         if rate is None and not self.close_rate:
             return 0.0
 
-        amount1 = FtPrecise(amount or self.amount)
+        num = float if self.float_math else FtPrecise
+        amount1 = num(amount or self.amount)
         trading_mode = self.trading_mode or TradingMode.SPOT
 
         if trading_mode == TradingMode.SPOT:
@@ -856,7 +902,7 @@ class LocalTrade:
 
         elif (trading_mode == TradingMode.MARGIN):
 
-            total_interest = self.calculate_interest()
+            total_interest = num(self.calculate_interest())
 
             if self.is_short:
                 amount1 = amount1 + total_interest
@@ -930,12 +976,13 @@ class LocalTrade:
         return float(f"{profit_ratio:.8f}")
 
     def recalc_trade_from_orders(self, *, is_closing: bool = False):
-        ZERO = FtPrecise(0.0)
-        current_amount = FtPrecise(0.0)
-        current_stake = FtPrecise(0.0)
-        max_stake_amount = FtPrecise(0.0)
+        num = float if self.float_math else FtPrecise
+        ZERO = num(0.0)
+        current_amount = num(0.0)
+        current_stake = num(0.0)
+        max_stake_amount = num(0.0)
         total_stake = 0.0  # Total stake after all buy orders (does not subtract!)
-        avg_price = FtPrecise(0.0)
+        avg_price = num(0.0)
         close_profit = 0.0
         close_profit_abs = 0.0
         profit = None
@@ -947,11 +994,11 @@ class LocalTrade:
             if o.ft_is_open or not o.filled:
                 continue
             funding_fees += (o.funding_fee or 0.0)
-            tmp_amount = FtPrecise(o.safe_amount_after_fee)
-            tmp_price = FtPrecise(o.safe_price)
+            tmp_amount = num(o.safe_amount_after_fee)
+            tmp_price = num(o.safe_price)
 
             is_exit = o.ft_order_side != self.entry_side
-            side = FtPrecise(-1 if is_exit else 1)
+            side = num(-1 if is_exit else 1)
             if tmp_amount > ZERO and tmp_price is not None:
                 current_amount += tmp_amount * side
                 price = avg_price if is_exit else tmp_price
@@ -1124,18 +1171,16 @@ class LocalTrade:
         """
 
         # Offline mode - without database
-        if is_open is not None:
-            if is_open:
-                sel_trades = LocalTrade.trades_open
-            else:
-                sel_trades = LocalTrade.trades
+        # Uses the per-pair indexes, to avoid scanning all trades.
+        sel_trades: List[LocalTrade] = []
+        if not is_open:
+            # is_open=None is not used during backtesting, but might be used by a strategy
+            sel_trades.extend(LocalTrade.bt_trades_closed_pp.get(pair, []) if pair
+                              else LocalTrade.trades)
+        if is_open is None or is_open:
+            sel_trades.extend(LocalTrade.bt_trades_open_pp.get(pair, {}) if pair
+                              else LocalTrade._trades_open)
 
-        else:
-            # Not used during backtesting, but might be used by a strategy
-            sel_trades = list(LocalTrade.trades + LocalTrade.trades_open)
-
-        if pair:
-            sel_trades = [trade for trade in sel_trades if trade.pair == pair]
         if open_date:
             sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
         if close_date:
@@ -1146,26 +1191,48 @@ class LocalTrade:
 
     @staticmethod
     def close_bt_trade(trade):
-        LocalTrade.trades_open.remove(trade)
-        LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
-        LocalTrade.bt_open_open_trade_count -= 1
+        LocalTrade.remove_bt_trade(trade)
         LocalTrade.trades.append(trade)
+        LocalTrade.bt_trades_closed_pp[trade.pair].append(trade)
         LocalTrade.total_profit += trade.close_profit_abs
 
     @staticmethod
     def add_bt_trade(trade):
         if trade.is_open:
-            LocalTrade.trades_open.append(trade)
-            LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
+            LocalTrade._trades_open[trade] = (0.0, 0.0)
+            LocalTrade.bt_trades_open_pp[trade.pair][trade] = None
             LocalTrade.bt_open_open_trade_count += 1
+            LocalTrade.bt_update_open_totals(trade)
         else:
             LocalTrade.trades.append(trade)
+            LocalTrade.bt_trades_closed_pp[trade.pair].append(trade)
+            LocalTrade.total_profit += trade.close_profit_abs or 0.0
 
     @staticmethod
     def remove_bt_trade(trade):
-        LocalTrade.trades_open.remove(trade)
-        LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
+        stake_amount, realized_profit = LocalTrade._trades_open.pop(trade)
+        del LocalTrade.bt_trades_open_pp[trade.pair][trade]
         LocalTrade.bt_open_open_trade_count -= 1
+        if LocalTrade._trades_open:
+            LocalTrade.bt_open_stake_amount -= stake_amount
+            LocalTrade.bt_open_realized_profit -= realized_profit
+        else:
+            # Reset to avoid accumulating float rounding errors
+            LocalTrade.bt_open_stake_amount = 0
+            LocalTrade.bt_open_realized_profit = 0
+
+    @staticmethod
+    def bt_update_open_totals(trade):
+        """
+        Update the open stake amount / realized profit totals after the stake amount
+        or realized profit of an open backtest trade changed.
+        """
+        stake_amount, realized_profit = LocalTrade._trades_open[trade]
+        new_stake_amount = trade.stake_amount or 0.0
+        new_realized_profit = trade.realized_profit or 0.0
+        LocalTrade.bt_open_stake_amount += new_stake_amount - stake_amount
+        LocalTrade.bt_open_realized_profit += new_realized_profit - realized_profit
+        LocalTrade._trades_open[trade] = (new_stake_amount, new_realized_profit)
 
     @staticmethod
     def get_open_trades() -> List[Any]:
@@ -1452,8 +1519,7 @@ class Trade(ModelBase, LocalTrade):
                 select(func.sum(Trade.close_profit_abs)).filter(Trade.is_open.is_(False))
             ).scalar_one()
         else:
-            total_profit = sum(t.close_profit_abs  # type: ignore
-                               for t in LocalTrade.get_trades_proxy(is_open=False))
+            total_profit = LocalTrade.total_profit
         return total_profit or 0
 
     @staticmethod
@@ -1467,8 +1533,7 @@ class Trade(ModelBase, LocalTrade):
                 select(func.sum(Trade.stake_amount)).filter(Trade.is_open.is_(True))
             )
         else:
-            total_open_stake_amount = sum(
-                t.stake_amount for t in LocalTrade.get_trades_proxy(is_open=True))
+            total_open_stake_amount = LocalTrade.bt_open_stake_amount
         return total_open_stake_amount or 0
 
     @staticmethod
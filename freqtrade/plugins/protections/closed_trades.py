@@ -0,0 +1,158 @@
+"""
+Index of closed backtest trades, used to evaluate protections without rescanning all trades.
+"""
+from bisect import bisect_right
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from freqtrade.constants import LongShort
+from freqtrade.persistence import LocalTrade
+
+
+# (pair, trade direction) - None matches all pairs / both directions
+IndexKey = Tuple[Optional[str], Optional[LongShort]]
+# Summary of consecutive trades (ordered by close date): Sum of close_profit,
+# highest and lowest cumulative close_profit, and max drawdown of the cumulative close_profit
+DrawdownSummary = Tuple[float, float, float, float]
+
+
+def _combine_drawdown(first: DrawdownSummary, second: DrawdownSummary) -> DrawdownSummary:
+    """
+    Summary of the trades of first, followed by the trades of second.
+    """
+    total, high, low, drawdown = first
+    return (total + second[0], max(high, total + second[1]), min(low, total + second[2]),
+            max(drawdown, second[3], high - total - second[2]))
+
+
+class DrawdownWindow:
+    """
+    Max drawdown of the cumulative close_profit of a sliding window of trades.
+    Trades enter the window at the end, and leave it at the start. They're kept in two stacks
+    with running summaries - so moving the window costs amortized O(1) per trade, instead of
+    rescanning all trades of the window.
+    """
+
+    def __init__(self, start: int = 0) -> None:
+        # Position of the window in the list of trades
+        self.start = start
+        self.end = start
+        # Summaries from each trade to the last trade of the front stack - oldest trade last
+        self._front: List[DrawdownSummary] = []
+        self._back: List[float] = []
+        self._back_summary: Optional[DrawdownSummary] = None
+
+    def push(self, profit: float) -> None:
+        summary = (profit, profit, profit, 0.0)
+        self._back.append(profit)
+        self._back_summary = (summary if self._back_summary is None
+                              else _combine_drawdown(self._back_summary, summary))
+        self.end += 1
+
+    def pop(self) -> None:
+        if not self._front:
+            front_summary: Optional[DrawdownSummary] = None
+            for profit in reversed(self._back):
+                summary = (profit, profit, profit, 0.0)
+                front_summary = (summary if front_summary is None
+                                 else _combine_drawdown(summary, front_summary))
+                self._front.append(front_summary)
+            self._back = []
+            self._back_summary = None
+        self._front.pop()
+        self.start += 1
+
+    @property
+    def drawdown(self) -> float:
+        if self._front and self._back_summary:
+            return _combine_drawdown(self._front[-1], self._back_summary)[3]
+        summary = self._front[-1] if self._front else self._back_summary
+        return summary[3] if summary else 0.0
+
+
+class ClosedTradesIndex:
+    """
+    Closed backtest trades accepted by `trade_filter`, sorted by close date - for all pairs,
+    per pair, and per pair and trade direction.
+    Trades closed since the previous lookup are picked up from LocalTrade.trades, which is only
+    appended to while backtesting. Each trade is therefore indexed once, and selecting the
+    trades of a lookback period is a binary search.
+    """
+
+    def __init__(self, trade_filter: Callable[[LocalTrade], bool]) -> None:
+        self._trade_filter = trade_filter
+        self._source: List[LocalTrade] = []
+        self._indexed = 0
+        self._close_dates: Dict[IndexKey, List[datetime]] = {}
+        self._trades: Dict[IndexKey, List[LocalTrade]] = {}
+        self._drawdown = DrawdownWindow()
+
+    def _reset(self) -> None:
+        self._source = LocalTrade.trades
+        self._indexed = 0
+        self._close_dates = {}
+        self._trades = {}
+        self._drawdown = DrawdownWindow()
+
+    def _update(self) -> None:
+        if LocalTrade.trades is not self._source or len(self._source) < self._indexed:
+            # Trades have been reset - e.g. for the next hyperopt epoch.
+            self._reset()
+        for trade in self._source[self._indexed:]:
+            if not trade.close_date or not self._trade_filter(trade):
+                continue
+            side = trade.trade_direction
+            for key in ((None, None), (None, side), (trade.pair, None), (trade.pair, side)):
+                close_dates = self._close_dates.setdefault(key, [])
+                # Trades are closed in (almost) chronological order - so this is usually an append.
+                idx = bisect_right(close_dates, trade.close_date)
+                close_dates.insert(idx, trade.close_date)
+                self._trades.setdefault(key, []).insert(idx, trade)
+                if key == (None, None) and idx < self._drawdown.end:
+                    self._shift_drawdown_window(idx)
+        self._indexed = len(self._source)
+
+    def _shift_drawdown_window(self, idx: int) -> None:
+        """
+        A trade closed before the end of the drawdown window has been inserted at idx.
+        """
+        if idx < self._drawdown.start:
+            self._drawdown.start += 1
+            self._drawdown.end += 1
+        else:
+            # Trade closed within the window - it's rebuilt on the next call
+            self._drawdown = DrawdownWindow(self._drawdown.start)
+
+    def get_trades(self, close_date: datetime, pair: Optional[str] = None,
+                   side: Optional[LongShort] = None) -> List[LocalTrade]:
+        """
+        Get trades closed after close_date, sorted by close date.
+        :param close_date: Only return trades closed after this date
+        :param pair: Only return trades for this pair (all pairs if None)
+        :param side: Only return trades in this direction (both directions if None)
+        """
+        self._update()
+        close_dates = self._close_dates.get((pair, side))
+        if not close_dates:
+            return []
+        return self._trades[(pair, side)][bisect_right(close_dates, close_date):]
+
+    def get_drawdown(self, close_date: datetime) -> Tuple[int, float]:
+        """
+        Max drawdown of the cumulative close_profit of trades (of all pairs) closed after
+        close_date - like MaxDrawdown._calculate_drawdown(get_trades(close_date)).
+        The window of trades is moved from the previous call, so close_date is expected to
+        increase between calls (as the backtest time does).
+        :param close_date: Only include trades closed after this date
+        :return: Number of trades closed after close_date, and their max drawdown
+        """
+        self._update()
+        trades = self._trades.get((None, None), [])
+        start = bisect_right(self._close_dates.get((None, None), []), close_date)
+        if start < self._drawdown.start:
+            self._drawdown = DrawdownWindow(start)
+        while self._drawdown.end < len(trades):
+            self._drawdown.push(trades[self._drawdown.end].close_profit or 0.0)
+        while self._drawdown.start < start:
+            self._drawdown.pop()
+        return len(trades) - start, self._drawdown.drawdown
@@ -4,7 +4,6 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from freqtrade.constants import LongShort
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -33,13 +32,7 @@ class CooldownPeriod(IProtection):
         Get last trade for this pair
         """
         look_back_until = date_now - timedelta(minutes=self._stop_duration)
-        # filters = [
-        #     Trade.is_open.is_(False),
-        #     Trade.close_date > look_back_until,
-        #     Trade.pair == pair,
-        # ]
-        # trade = Trade.get_trades(filters).first()
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+        trades = self.get_closed_trades(look_back_until, pair)
         if trades:
             # Get latest trade
             # Ignore type error as we know we only get closed trades.
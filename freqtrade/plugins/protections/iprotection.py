@@ -9,7 +9,8 @@ from freqtrade.constants import Config, LongShort
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import plural
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import LocalTrade
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.plugins.protections.closed_trades import ClosedTradesIndex
 
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,8 @@ class IProtection(LoggingMixin, ABC):
         else:
             self._lookback_period_candles = None
             self._lookback_period = int(protection_config.get('lookback_period', 60))
+        # Closed trades relevant for this protection - only used while backtesting.
+        self._bt_closed_trades = ClosedTradesIndex(self._is_relevant_trade)
 
         LoggingMixin.__init__(self, logger)
 
@@ -104,6 +107,30 @@ class IProtection(LoggingMixin, ABC):
             If true, this pair will be locked with <reason> until <until>
         """
 
+    def _is_relevant_trade(self, trade: LocalTrade) -> bool:
+        """
+        Filter closed trades considered by this protection.
+        -> Overwrite in subclasses evaluating only some of the trades.
+        """
+        return True
+
+    def get_closed_trades(self, look_back_until: datetime, pair: Optional[str] = None,
+                          side: Optional[LongShort] = None) -> List[LocalTrade]:
+        """
+        Get relevant trades closed after look_back_until.
+        While backtesting, trades are taken from an index which is updated incrementally,
+        instead of filtering all closed trades on every call.
+        :param look_back_until: Only return trades closed after this date
+        :param pair: Only return trades for this pair (all pairs if None)
+        :param side: Only return trades in this direction (both directions if None)
+        :return: List of trades - sorted by close date while backtesting
+        """
+        if not Trade.use_db:
+            return self._bt_closed_trades.get_trades(look_back_until, pair, side)
+        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+        return [trade for trade in trades if self._is_relevant_trade(trade)
+                and (side is None or trade.trade_direction == side)]
+
     @staticmethod
     def calculate_lock_end(trades: List[LocalTrade], stop_minutes: int) -> datetime:
         """
@@ -4,7 +4,6 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from freqtrade.constants import Config, LongShort
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -43,15 +42,7 @@ class LowProfitPairs(IProtection):
         Evaluate recent trades for pair
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
-        # filters = [
-        #     Trade.is_open.is_(False),
-        #     Trade.close_date > look_back_until,
-        # ]
-        # if pair:
-        #     filters.append(Trade.pair == pair)
-
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        # trades = Trade.get_trades(filters).all()
+        trades = self.get_closed_trades(look_back_until, pair)
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return None
@@ -1,13 +1,11 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-
-import pandas as pd
+from math import inf
+from typing import Any, Dict, List, Optional
 
 from freqtrade.constants import Config, LongShort
-from freqtrade.data.metrics import calculate_max_drawdown
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -40,32 +38,47 @@ class MaxDrawdown(IProtection):
         return (f'{drawdown} passed {self._max_allowed_drawdown} in {self.lookback_period_str}, '
                 f'locking for {self.stop_duration_str}.')
 
+    @staticmethod
+    def _calculate_drawdown(trades: List[LocalTrade]) -> float:
+        """
+        Max drawdown of the cumulative close_profit of trades, ordered by close date.
+        Same result as calculate_max_drawdown(value_col='close_profit') - without building
+        a dataframe for every evaluation.
+        """
+        cumulative = 0.0
+        high_value = -inf
+        drawdown = 0.0
+        for trade in sorted(trades, key=lambda t: t.close_date):  # type: ignore
+            cumulative += trade.close_profit or 0.0
+            high_value = max(high_value, cumulative)
+            drawdown = max(drawdown, high_value - cumulative)
+        return drawdown
+
     def _max_drawdown(self, date_now: datetime) -> Optional[ProtectionReturn]:
         """
         Evaluate recent trades for drawdown ...
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
+        if not Trade.use_db:
+            # Backtesting - drawdown of the lookback window is updated incrementally
+            trade_count, drawdown = self._bt_closed_trades.get_drawdown(look_back_until)
+        else:
+            trades = self.get_closed_trades(look_back_until)
+            trade_count, drawdown = len(trades), self._calculate_drawdown(trades)
 
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
-
-        if len(trades) < self._trade_limit:
+        if trade_count < self._trade_limit:
             # Not enough trades in the relevant period
             return None
 
         # Drawdown is always positive
-        try:
-            # TODO: This should use absolute profit calculation, considering account balance.
-            drawdown, _, _, _, _, _ = calculate_max_drawdown(trades_df, value_col='close_profit')
-        except ValueError:
-            return None
-
-        if drawdown > self._max_allowed_drawdown:
+        # TODO: This should use absolute profit calculation, considering account balance.
+        if drawdown and drawdown > self._max_allowed_drawdown:
             self.log_once(
                 f"Trading stopped due to Max Drawdown {drawdown:.2f} > {self._max_allowed_drawdown}"
                 f" within {self.lookback_period_str}.", logger.info)
-            until = self.calculate_lock_end(trades, self._stop_duration)
+            until = self.calculate_lock_end(self.get_closed_trades(look_back_until),
+                                            self._stop_duration)
 
             return ProtectionReturn(
                 lock=True,
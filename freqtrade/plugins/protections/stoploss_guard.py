@@ -5,7 +5,7 @@ from typing import Any, Dict, Optional
 
 from freqtrade.constants import Config, LongShort
 from freqtrade.enums import ExitType
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -39,6 +39,15 @@ class StoplossGuard(IProtection):
         return (f'{self._trade_limit} stoplosses in {self._lookback_period} min, '
                 f'locking for {self._stop_duration} min.')
 
+    def _is_relevant_trade(self, trade: LocalTrade) -> bool:
+        """
+        Only stoploss trades with a profit below the profit limit count
+        """
+        return bool(str(trade.exit_reason) in (
+            ExitType.TRAILING_STOP_LOSS.value, ExitType.STOP_LOSS.value,
+            ExitType.STOPLOSS_ON_EXCHANGE.value, ExitType.LIQUIDATION.value)
+            and trade.close_profit and trade.close_profit < self._profit_limit)
+
     def _stoploss_guard(self, date_now: datetime, pair: Optional[str],
                         side: LongShort) -> Optional[ProtectionReturn]:
         """
@@ -46,15 +55,9 @@ class StoplossGuard(IProtection):
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades1 = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        trades = [trade for trade in trades1 if (str(trade.exit_reason) in (
-            ExitType.TRAILING_STOP_LOSS.value, ExitType.STOP_LOSS.value,
-            ExitType.STOPLOSS_ON_EXCHANGE.value, ExitType.LIQUIDATION.value)
-            and trade.close_profit and trade.close_profit < self._profit_limit)]
-
-        if self._only_per_side:
-            # Long or short trades only
-            trades = [trade for trade in trades if trade.trade_direction == side]
+        # Long or short trades only, if only_per_side is set
+        trades = self.get_closed_trades(look_back_until, pair,
+                                        side if self._only_per_side else None)
 
         if len(trades) < self._trade_limit:
             return None
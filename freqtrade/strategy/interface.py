@@ -4,10 +4,14 @@ This module defines the interface to apply for strategies
 """
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from pandas import DataFrame
+from joblib import effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
+from pandas import DataFrame, concat
 
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
@@ -28,6 +32,10 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Signal columns - populated by advise_entry() / advise_exit()
+SIGNAL_COLUMNS = ([s.value for s in SignalType] + [s.value for s in SignalTagType]
+                  + ['buy', 'sell', 'buy_tag'])
+
 
 class IStrategy(ABC, HyperStrategyMixin):
     """
@@ -87,6 +95,11 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
 
+    # run "populate_indicators" only on the last candles when new candles arrive (dry / live)
+    incremental_analysis: bool = False
+    # Number of new candles after which the full dataframe is analyzed again
+    incremental_analysis_full_interval: int = 100
+
     use_exit_signal: bool
     exit_profit_only: bool
     exit_profit_offset: float
@@ -128,6 +141,11 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: Dict[str, datetime] = {}
+        # Last analyzed dataframe, its indicator columns
+        # and candles analyzed incrementally since - per pair
+        self._ft_incremental_state: Dict[str, Tuple[DataFrame, List[str], int]] = {}
+        # Analyzed dataframes held back while pairs are analyzed concurrently - per pair
+        self._ft_deferred_dfs: Optional[Dict[str, Tuple[DataFrame, bool]]] = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -206,6 +224,20 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return dataframe
 
+    def populate_indicators_incremental(self, dataframe: DataFrame, previous: DataFrame,
+                                        metadata: dict) -> DataFrame:
+        """
+        Only called with `incremental_analysis`.
+        Continue indicators for new candles from the previous analysis - e.g. recursive
+        indicators (EMA, ...) which differ when calculated on `startup_candle_count` candles.
+        :param dataframe: New candles, with indicators populated by populate_indicators()
+            on the last `startup_candle_count` candles
+        :param previous: Indicators of all candles before the new candles
+        :param metadata: Additional information, like the currently traded pair
+        :return: New candles with indicators
+        """
+        return dataframe
+
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         DEPRECATED - please migrate to populate_entry_trend
@@ -835,6 +867,76 @@ class IStrategy(ABC, HyperStrategyMixin):
         dataframe = self.advise_exit(dataframe, metadata)
         return dataframe
 
+    def _get_new_candle_count(self, previous: DataFrame, dataframe: DataFrame) -> int:
+        """
+        Number of candles added to dataframe since previous has been analyzed.
+        :return: Number of new candles, 0 if the dataframes don't line up.
+        """
+        if len(previous) != len(dataframe) or previous.empty:
+            return 0
+        last_date = previous['date'].iloc[-1]
+        position = int(dataframe['date'].searchsorted(last_date))
+        if position >= len(dataframe) or dataframe['date'].iloc[position] != last_date:
+            return 0
+        new_candles = len(dataframe) - 1 - position
+        if dataframe['date'].iloc[0] != previous['date'].iloc[new_candles]:
+            return 0
+        return new_candles
+
+    def _analyze_ticker_full(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze the full dataframe, and keep it as base for the next incremental analysis.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        logger.debug("TA Analysis Launched")
+        dataframe = self.advise_indicators(dataframe, metadata)
+        indicator_columns = list(dataframe.columns)
+        dataframe = self.advise_entry(dataframe, metadata)
+        dataframe = self.advise_exit(dataframe, metadata)
+        self._ft_incremental_state[str(metadata.get('pair'))] = (dataframe, indicator_columns, 0)
+        return dataframe
+
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze only the new candles of the dataframe, reusing indicators of all other candles
+        from the previous analysis of this pair.
+        Indicators of new candles are populated on the last `startup_candle_count` candles,
+        and passed to populate_indicators_incremental() together with the previous analysis.
+        The full dataframe is analyzed every `incremental_analysis_full_interval` candles,
+        and whenever the candles don't line up with the previous analysis.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        pair = str(metadata.get('pair'))
+        previous, indicator_columns, incremental_candles = self._ft_incremental_state.get(
+            pair, (DataFrame(), [], 0))
+        new_candles = self._get_new_candle_count(previous, dataframe)
+
+        if (self.startup_candle_count <= 0 or new_candles <= 0
+                or new_candles + self.startup_candle_count > len(dataframe)
+                or incremental_candles + new_candles >= self.incremental_analysis_full_interval):
+            return self._analyze_ticker_full(dataframe, metadata)
+
+        logger.debug(f"Incremental TA Analysis of {new_candles} candles for {pair}")
+        tail = dataframe.iloc[-(self.startup_candle_count + new_candles):].copy()
+        analyzed = self.advise_indicators(tail, metadata).iloc[-new_candles:]
+        # Columns added while populating signals are populated on the full dataframe again
+        kept = previous.iloc[new_candles:][indicator_columns]
+        if list(analyzed.columns) != indicator_columns:
+            # Indicators changed - e.g. conditionally added columns
+            return self._analyze_ticker_full(dataframe, metadata)
+        analyzed = self.populate_indicators_incremental(analyzed.copy(), kept, metadata)
+
+        indicators = concat([kept, analyzed[indicator_columns]])
+        indicators.index = dataframe.index
+        dataframe = self.advise_exit(self.advise_entry(indicators, metadata), metadata)
+        self._ft_incremental_state[pair] = (
+            dataframe, indicator_columns, incremental_candles + new_candles)
+        return dataframe
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -852,13 +954,17 @@ class IStrategy(ABC, HyperStrategyMixin):
         if not self.process_only_new_candles or new_candle:
 
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            if self.incremental_analysis and self.process_only_new_candles:
+                dataframe = self._analyze_ticker_incremental(dataframe, metadata)
+            else:
+                dataframe = self.analyze_ticker(dataframe, metadata)
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
 
-            candle_type = self.config.get('candle_type_def', CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            if self._ft_deferred_dfs is not None:
+                self._ft_deferred_dfs[pair] = (dataframe, new_candle)
+            else:
+                self._publish_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -868,6 +974,14 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _publish_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and send it to subscribed consumers.
+        """
+        candle_type = self.config.get('candle_type_def', CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -901,10 +1015,63 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: List[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analysis_jobs`, pairs are analyzed concurrently in a thread pool.
+        Analyzed dataframes are then stored in the dataprovider (and emitted) from the
+        calling thread, in the order of `pairs`, once all pairs have been analyzed.
+        An exception while analyzing one pair does not affect the other pairs.
+        FreqAI models are not thread-safe - pairs are always analyzed one after the other
+        if FreqAI is enabled.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        deferred_dfs: Dict[str, Tuple[DataFrame, bool]] = {}
+        with self._pair_executor('analysis_jobs', len(pairs)) as executor:
+            if executor is None:
+                for pair in pairs:
+                    self.analyze_pair(pair)
+                return
+
+            self._ft_deferred_dfs = deferred_dfs
+            try:
+                futures = [executor.submit(self.analyze_pair, pair) for pair in pairs]
+                # Wait for all pairs before results are published
+                for future in futures:
+                    future.exception()
+            finally:
+                self._ft_deferred_dfs = None
+
+        for pair, future in zip(pairs, futures):
+            try:
+                future.result()
+            except Exception:
+                logger.exception(f"Unable to analyze candle (OHLCV) data for pair {pair}")
+            if pair in deferred_dfs:
+                self._publish_analyzed_df(pair, *deferred_dfs[pair])
+
+    @contextmanager
+    def _pair_executor(self, jobs_key: str, pair_count: int,
+                       processes: bool = False) -> Iterator[Optional[Executor]]:
+        """
+        Executor to run a task per pair concurrently, using the number of jobs configured
+        in `jobs_key`.
+        Yields None if pairs should be processed one after the other - for a single job or
+        pair, and if FreqAI is enabled (FreqAI models are not thread-safe).
+        :param jobs_key: Config key holding the number of jobs
+        :param pair_count: Number of pairs (tasks) to run
+        :param processes: Use a pool of worker processes instead of threads. Tasks and
+            results must be picklable, and changes tasks make to objects are not kept.
+        """
+        jobs = 1
+        if not self.config.get('freqai', {}).get('enabled', False):
+            jobs = min(effective_n_jobs(self.config.get(jobs_key, 1)), pair_count)
+        if jobs <= 1:
+            yield None
+        elif processes:
+            # Workers are reused by following calls (e.g. every hyperopt epoch), and
+            # stopped by loky once idle.
+            yield get_reusable_executor(max_workers=jobs)
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                yield executor
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
@@ -1317,9 +1484,22 @@ class IStrategy(ABC, HyperStrategyMixin):
         Also copy on output to avoid PerformanceWarnings pandas 1.3.0 started to show.
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
-        """
-        return {pair: self.advise_indicators(pair_data.copy(), {'pair': pair}).copy()
-                for pair, pair_data in data.items()}
+        With `indicator_jobs`, pairs are analyzed concurrently. In a thread pool (default),
+        pairs share this strategy and its dataprovider (informative pairs), while
+        TA-Lib / NumPy calculations run in parallel. With `indicator_pool: processes`,
+        each worker process analyzes pairs with its own copy of this strategy - avoiding
+        contention on the GIL for indicators calculated in Python / pandas code.
+        FreqAI models are not thread-safe - pairs are always analyzed one after the other
+        if FreqAI is enabled.
+        """
+        def analyze(pair: str, dataframe: DataFrame) -> DataFrame:
+            return self.advise_indicators(dataframe.copy(), {'pair': pair}).copy()
+
+        processes = self.config.get('indicator_pool', 'threads') == 'processes'
+        with self._pair_executor('indicator_jobs', len(data), processes) as executor:
+            if executor is None:
+                return {pair: analyze(pair, dataframe) for pair, dataframe in data.items()}
+            return dict(zip(data, executor.map(analyze, data, data.values())))
 
     def advise_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
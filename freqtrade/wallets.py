@@ -4,11 +4,12 @@
 import logging
 from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Dict, NamedTuple, Optional
+from math import isclose
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT, Config
 from freqtrade.enums import RunMode, TradingMode
-from freqtrade.exceptions import DependencyException
+from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import Exchange
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence import LocalTrade, Trade
@@ -34,6 +35,19 @@ class PositionWallet(NamedTuple):
     side: str = 'long'
 
 
+def _wallets_match(wallets: Dict[str, Any], expected: Dict[str, Any]) -> bool:
+    """
+    Compare wallets / positions, allowing for float rounding differences.
+    """
+    if wallets.keys() != expected.keys():
+        return False
+    return all(
+        isclose(value, expected_value, rel_tol=1e-9, abs_tol=1e-12)
+        if isinstance(value, float) else value == expected_value
+        for key in wallets for value, expected_value in zip(wallets[key], expected[key])
+    )
+
+
 class Wallets:
 
     def __init__(self, config: Config, exchange: Exchange, log: bool = True) -> None:
@@ -44,6 +58,8 @@ class Wallets:
         self._positions: Dict[str, PositionWallet] = {}
         self.start_cap = config['dry_run_wallet']
         self._last_wallet_refresh: Optional[datetime] = None
+        # Backtesting only - pairs with open trades, by base currency
+        self._currency_pairs: Dict[str, Set[str]] = {}
         self.update()
 
     def get_free(self, currency: str) -> float:
@@ -75,6 +91,25 @@ class Wallets:
         - update balances for currencies currently in trades
         """
         # Recreate _wallets to reset closed trade balances
+        self._wallets, self._positions = self._calculate_dry()
+        if not self._log:
+            for trade in LocalTrade.trades_open:
+                self._register_pair(trade.pair)
+
+    def _register_pair(self, pair: str) -> str:
+        """
+        Remember the base currency of a pair traded in backtesting
+        :return: Base currency of the pair
+        """
+        curr = self._exchange.get_pair_base_currency(pair)
+        self._currency_pairs.setdefault(curr, set()).add(pair)
+        return curr
+
+    def _calculate_dry(self) -> Tuple[Dict[str, Wallet], Dict[str, PositionWallet]]:
+        """
+        Calculate all wallets and positions from the open trades.
+        :return: Tuple of wallets and positions
+        """
         _wallets = {}
         _positions = {}
         open_trades = Trade.get_trades_proxy(is_open=True)
@@ -82,15 +117,14 @@ class Wallets:
         # TODO: potentially remove the ._log workaround to determine backtest mode.
         if self._log:
             tot_profit = Trade.get_total_closed_profit()
+            tot_profit += sum(trade.realized_profit for trade in open_trades)
+            tot_in_trades = sum(trade.stake_amount for trade in open_trades)
         else:
-            tot_profit = LocalTrade.total_profit
-        tot_profit += sum(trade.realized_profit for trade in open_trades)
-        tot_in_trades = sum(trade.stake_amount for trade in open_trades)
-        used_stake = 0.0
+            # Backtesting keeps running totals of open trades
+            tot_profit = LocalTrade.total_profit + LocalTrade.bt_open_realized_profit
+            tot_in_trades = LocalTrade.bt_open_stake_amount
 
         if self._config.get('trading_mode', 'spot') != TradingMode.FUTURES:
-            current_stake = self.start_cap + tot_profit - tot_in_trades
-            total_stake = current_stake
             for trade in open_trades:
                 curr = self._exchange.get_pair_base_currency(trade.pair)
                 _wallets[curr] = Wallet(
@@ -102,29 +136,88 @@ class Wallets:
         else:
             tot_in_trades = 0
             for position in open_trades:
-                # size = self._exchange._contracts_to_amount(position.pair, position['contracts'])
-                size = position.amount
-                collateral = position.stake_amount
-                leverage = position.leverage
-                tot_in_trades += collateral
-                _positions[position.pair] = PositionWallet(
-                    position.pair, position=size,
-                    leverage=leverage,
-                    collateral=collateral,
-                    side=position.trade_direction
-                )
-            current_stake = self.start_cap + tot_profit - tot_in_trades
-            used_stake = tot_in_trades
-            total_stake = current_stake + tot_in_trades
+                tot_in_trades += position.stake_amount
+                _positions[position.pair] = self._position_wallet(position)
+
+        stake_currency = self._config['stake_currency']
+        _wallets[stake_currency] = self._stake_wallet(tot_profit, tot_in_trades)
+        return _wallets, _positions
+
+    @staticmethod
+    def _position_wallet(trade: LocalTrade) -> PositionWallet:
+        # size = self._exchange._contracts_to_amount(position.pair, position['contracts'])
+        return PositionWallet(
+            trade.pair, position=trade.amount,
+            leverage=trade.leverage,
+            collateral=trade.stake_amount,
+            side=trade.trade_direction
+        )
 
-        _wallets[self._config['stake_currency']] = Wallet(
+    def _stake_wallet(self, tot_profit: float, tot_in_trades: float) -> Wallet:
+        """
+        Stake currency wallet in dry-run mode
+        :param tot_profit: Realized profit of closed and open trades
+        :param tot_in_trades: Stake amount tied up in open trades
+        """
+        current_stake = self.start_cap + tot_profit - tot_in_trades
+        if self._config.get('trading_mode', 'spot') != TradingMode.FUTURES:
+            return Wallet(self._config['stake_currency'], current_stake, 0.0, current_stake)
+        return Wallet(
             currency=self._config['stake_currency'],
             free=current_stake,
-            used=used_stake,
-            total=total_stake
+            used=tot_in_trades,
+            total=current_stake + tot_in_trades
         )
-        self._wallets = _wallets
-        self._positions = _positions
+
+    def update_pair(self, pair: str) -> None:
+        """
+        Update wallets after the trades of one pair changed (trade opened, order filled,
+        partial exit or trade closed).
+        In backtesting, only the wallet (or position) of this pair and the stake currency wallet
+        are updated - based on the running totals of open trades.
+        Outside of backtesting, this is the same as update().
+        :param pair: Pair whose trades changed
+        """
+        if self._log:
+            self.update()
+            return
+        # Like in _calculate_dry(), the most recent open trade determines the wallet
+        last_trade = next(reversed(LocalTrade.bt_trades_open_pp.get(pair, {})), None)
+        if self._config.get('trading_mode', 'spot') != TradingMode.FUTURES:
+            curr = self._register_pair(pair)
+            pairs = self._currency_pairs[curr]
+            if len(pairs) > 1:
+                # Multiple pairs with the same base currency - use the most recent open trade
+                # of all of these pairs.
+                last_trade = next(
+                    (t for t in reversed(LocalTrade.trades_open) if t.pair in pairs), None)
+            if last_trade:
+                self._wallets[curr] = Wallet(curr, last_trade.amount, 0, last_trade.amount)
+            else:
+                self._wallets.pop(curr, None)
+        elif last_trade:
+            self._positions[pair] = self._position_wallet(last_trade)
+        else:
+            self._positions.pop(pair, None)
+
+        self._wallets[self._config['stake_currency']] = self._stake_wallet(
+            LocalTrade.total_profit + LocalTrade.bt_open_realized_profit,
+            LocalTrade.bt_open_stake_amount)
+
+        if self._config.get('backtest_wallet_check', False):
+            self._check_wallets()
+
+    def _check_wallets(self) -> None:
+        """
+        Compare incrementally updated wallets against wallets calculated from all open trades.
+        :raise: OperationalException if wallets don't match
+        """
+        wallets, positions = self._calculate_dry()
+        if not (_wallets_match(self._wallets, wallets)
+                and _wallets_match(self._positions, positions)):
+            raise OperationalException(
+                f"Wallets out of sync. Expected {wallets} and {positions}, "
+                f"got {self._wallets} and {self._positions}.")
 
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
@@ -1,19 +1,25 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
+from datetime import timedelta
 from pathlib import Path
 from shutil import copyfile
 
 import numpy as np
 import pytest
+from pandas import concat
 
 from freqtrade.configuration.timerange import TimeRange
-from freqtrade.data.converter import (convert_ohlcv_format, convert_trades_format,
-                                      ohlcv_fill_up_missing_data, ohlcv_to_dataframe,
-                                      reduce_dataframe_footprint, trades_dict_to_list,
-                                      trades_remove_duplicates, trades_to_ohlcv, trim_dataframe)
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.data.converter import (clean_ohlcv_dataframe, convert_ohlcv_format,
+                                      convert_trades_format, ohlcv_fill_up_missing_data,
+                                      ohlcv_resample, ohlcv_to_dataframe,
+                                      reduce_dataframe_footprint, trades_chunks_to_ohlcv,
+                                      trades_dict_to_list, trades_remove_duplicates,
+                                      trades_to_ohlcv, trim_dataframe)
 from freqtrade.data.history import (get_timerange, load_data, load_pair_history,
                                     validate_backtest_data)
 from freqtrade.data.history.idatahandler import IDataHandler
+from freqtrade.data.history.jsondatahandler import JsonGzDataHandler
 from freqtrade.enums import CandleType
 from tests.conftest import generate_test_data, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -56,6 +62,31 @@ def test_trades_to_ohlcv(ohlcv_history_list, caplog):
     assert df.loc[:, 'low'][0] == 0.00141266
 
 
+def test_ohlcv_resample(testdatadir):
+    data = load_pair_history(datadir=testdatadir, timeframe='5m', pair='UNITTEST/BTC')
+    data_1h = ohlcv_resample(data, '1h')
+    assert list(data_1h.columns) == DEFAULT_DATAFRAME_COLUMNS
+    # First candle is incomplete
+    assert data['date'].iloc[0] == data_1h['date'].iloc[0] + timedelta(minutes=55)
+
+    candles = data.iloc[1:13]
+    assert candles['date'].iloc[0] == data_1h['date'].iloc[1]
+    assert data_1h['open'].iloc[1] == candles['open'].iloc[0]
+    assert data_1h['high'].iloc[1] == candles['high'].max()
+    assert data_1h['low'].iloc[1] == candles['low'].min()
+    assert data_1h['close'].iloc[1] == candles['close'].iloc[-1]
+    assert data_1h['volume'].iloc[1] == pytest.approx(candles['volume'].sum())
+
+    data_1d = ohlcv_resample(data, '1d')
+    assert data_1d['date'].dt.hour.eq(0).all()
+
+    # Weekly candles would be aligned to the epoch (a thursday), not to monday.
+    with pytest.raises(ValueError, match=r'Cannot resample to timeframe 1w\.'):
+        ohlcv_resample(data, '1w')
+    with pytest.raises(ValueError, match=r'Cannot resample to timeframe 5h\.'):
+        ohlcv_resample(data, '5h')
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(datadir=testdatadir,
                              timeframe='1m',
@@ -185,6 +216,63 @@ def test_ohlcv_drop_incomplete(caplog):
     assert log_has("Dropping last candle", caplog)
 
 
+def test_clean_ohlcv_dataframe_unchanged(caplog):
+    data = generate_test_data('5m', 100, '2023-01-01 00:05:00')
+    data.index = range(10, 110)
+
+    # Clean candles are not copied
+    cleaned = clean_ohlcv_dataframe(data, '5m', 'UNITTEST/BTC',
+                                    fill_missing=True, drop_incomplete=False)
+    assert cleaned.equals(data.reset_index(drop=True))
+    assert np.shares_memory(cleaned['close'].values, data['close'].values)
+
+    caplog.set_level(logging.DEBUG)
+    cleaned = clean_ohlcv_dataframe(data, '5m', 'UNITTEST/BTC',
+                                    fill_missing=True, drop_incomplete=True)
+    assert cleaned.equals(data.iloc[:-1].reset_index(drop=True))
+    assert np.shares_memory(cleaned['close'].values, data['close'].values)
+    assert log_has('Dropping last candle', caplog)
+
+    # Gaps, duplicates and missing values are cleaned - returning the same result as before
+    gaps = data.drop(index=[20, 21])
+    duplicates = concat([data, data.iloc[-10:]])
+    missing = data.copy()
+    missing.loc[50, 'close'] = np.nan
+    unaligned = data.copy()
+    unaligned['date'] = unaligned['date'] + timedelta(minutes=2)
+    for df, fill_missing in [(gaps, True), (duplicates, False), (missing, True),
+                             (unaligned, True)]:
+        cleaned = clean_ohlcv_dataframe(df, '5m', 'UNITTEST/BTC',
+                                        fill_missing=fill_missing, drop_incomplete=False)
+        assert not np.shares_memory(cleaned['close'].values, data['close'].values)
+
+    assert len(clean_ohlcv_dataframe(gaps, '5m', 'UNITTEST/BTC',
+                                     fill_missing=True, drop_incomplete=False)) == 100
+    assert clean_ohlcv_dataframe(gaps, '5m', 'UNITTEST/BTC', fill_missing=False,
+                                 drop_incomplete=False).equals(gaps.reset_index(drop=True))
+    assert clean_ohlcv_dataframe(duplicates, '5m', 'UNITTEST/BTC', fill_missing=False,
+                                 drop_incomplete=False).equals(data.reset_index(drop=True))
+    assert clean_ohlcv_dataframe(missing, '5m', 'UNITTEST/BTC', fill_missing=True,
+                                 drop_incomplete=False).loc[40, 'close'] == data.loc[49, 'close']
+    assert clean_ohlcv_dataframe(unaligned, '5m', 'UNITTEST/BTC', fill_missing=True,
+                                 drop_incomplete=False).iloc[0]['date'] == data.iloc[0]['date']
+
+
+def test_trades_chunks_to_ohlcv(testdatadir):
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_chunks_to_ohlcv([[]], ['1m'])
+
+    trades = JsonGzDataHandler(testdatadir).trades_load('XRP/ETH')
+    timeframes = ['1m', '5m', '1h']
+    # Chunk boundaries within candles
+    result = trades_chunks_to_ohlcv((trades[i:i + 777] for i in range(0, len(trades), 777)),
+                                    timeframes)
+    assert list(result) == timeframes
+    for timeframe in timeframes:
+        expected = trades_to_ohlcv(trades, timeframe).reset_index(drop=True)
+        assert result[timeframe].equals(expected)
+
+
 def test_trim_dataframe(testdatadir) -> None:
     data = load_data(
         datadir=testdatadir,
@@ -224,15 +312,23 @@ def test_trim_dataframe(testdatadir) -> None:
     assert all(data_modify.iloc[0] == data.iloc[0])
     assert all(data_modify.iloc[-1] == data.iloc[-31])
 
-    data_modify = data.copy()
+    data_source = data.copy()
     # Remove first 25 and last 30 minutes (1800 s)
     tr = TimeRange('date', 'date', min_date + 1500, max_date - 1800)
-    data_modify = trim_dataframe(data_modify, tr)
+    data_modify = trim_dataframe(data_source, tr)
     assert not data_modify.equals(data)
     assert len(data_modify) < len(data)
     assert len(data_modify) == len(data) - 55
     # first row matches 25th original row
     assert all(data_modify.iloc[0] == data.iloc[25])
+    # Sorted data is sliced, not copied
+    assert np.shares_memory(data_modify['close'].values, data_source['close'].values)
+
+    # Unsorted data
+    data_modify = data.iloc[::-1]
+    data_modify = trim_dataframe(data_modify, tr)
+    assert len(data_modify) == len(data) - 55
+    assert all(data_modify.iloc[-1] == data.iloc[25])
 
 
 def test_trades_remove_duplicates(trades_history):
@@ -3,20 +3,22 @@
 import re
 from datetime import datetime, timezone
 from pathlib import Path
+from shutil import copyfile
 from unittest.mock import MagicMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, read_parquet
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
-from freqtrade.data.history.featherdatahandler import FeatherDataHandler
+from freqtrade.data.history.featherdatahandler import ArrowDataHandler, FeatherDataHandler
 from freqtrade.data.history.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler, get_datahandlerclass
 from freqtrade.data.history.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.parquetdatahandler import ParquetDataHandler
+from freqtrade.data.history.partitioneddatahandler import PartitionedDataHandler
 from freqtrade.enums import CandleType, TradingMode
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -252,7 +254,7 @@ def test_datahandler__check_empty_df(testdatadir, caplog):
     assert log_has_re(expected_text, caplog)
 
 
-@pytest.mark.parametrize('datahandler', ['parquet'])
+@pytest.mark.parametrize('datahandler', ['parquet', 'partitioned'])
 def test_datahandler_trades_not_supported(datahandler, testdatadir, ):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -284,7 +286,8 @@ def test_jsondatahandler_trades_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 1
 
 
-@pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize('datahandler', [
+    dh for dh in AVAILABLE_DATAHANDLERS if dh != 'partitioned'])
 def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -331,6 +334,45 @@ def test_hdf5datahandler_trades_load(testdatadir):
     assert len([t for t in trades2 if t[0] > timerange.stopts * 1000]) == 0
 
 
+@pytest.mark.parametrize('datahandler', ['json', 'jsongz', 'hdf5', 'feather'])
+def test_datahandler_trades_iter(mocker, testdatadir, tmpdir, datahandler, caplog):
+    # Parse json files in parts of 100 characters - so trades span multiple parts
+    mocker.patch('freqtrade.data.history.jsondatahandler.TRADES_READ_SIZE', 100)
+    trades = get_datahandler(testdatadir, 'jsongz').trades_load('XRP/ETH')
+    dh = get_datahandler(Path(tmpdir), datahandler)
+    dh.trades_store('XRP/ETH', trades)
+    trades = dh.trades_load('XRP/ETH')
+
+    chunks = list(dh.trades_iter('XRP/ETH', chunk_size=1000))
+    assert len(chunks) == len(trades) // 1000 + 1
+    assert all(len(chunk) == 1000 for chunk in chunks[:-1])
+    assert [t for chunk in chunks for t in chunk] == trades
+
+    timerange = TimeRange.parse_timerange('20191011-20191012')
+    filtered = [t for chunk in dh.trades_iter('XRP/ETH', timerange, chunk_size=1000)
+                for t in chunk]
+    assert 0 < len(filtered) < len(trades)
+    assert filtered == [t for t in trades
+                        if timerange.startts * 1000 <= t[0] < timerange.stopts * 1000]
+
+    assert list(dh.trades_iter('UNITTEST/NONEXIST')) == []
+    assert not log_has_re(r'.*does not support reading trades in chunks.*', caplog)
+
+    # Duplicates spanning two chunks are removed
+    dh.trades_store('XRP/ETH', trades[:1000] + trades[999:])
+    chunks = list(dh.trades_iter('XRP/ETH', chunk_size=1000))
+    assert [t for chunk in chunks for t in chunk] == trades
+
+
+def test_datahandler_trades_iter_not_chunked(testdatadir, caplog):
+    dh = get_datahandler(testdatadir, 'jsongz')
+    trades = dh.trades_load('XRP/ETH')
+    chunks = list(IDataHandler._trades_iter(dh, 'XRP/ETH', None, 1000))
+    assert [t for chunk in chunks for t in chunk] == trades
+    assert log_has('The json.gz data format does not support reading trades in chunks. '
+                   'Loading all trades of XRP/ETH at once.', caplog)
+
+
 def test_hdf5datahandler_trades_store(testdatadir, tmpdir):
     tmpdir1 = Path(tmpdir)
     dh = get_datahandler(testdatadir, 'hdf5')
@@ -427,7 +469,7 @@ def test_hdf5datahandler_ohlcv_load_and_resave(
     # Mark data goes from to 2021-11-15 2021-11-19
     ('UNITTEST/USDT:USDT', '1h', 'mark', '-mark', '2021-11-16', '2021-11-18'),
 ])
-@pytest.mark.parametrize('datahandler', ['hdf5', 'feather', 'parquet'])
+@pytest.mark.parametrize('datahandler', ['hdf5', 'feather', 'parquet', 'arrow'])
 def test_generic_datahandler_ohlcv_load_and_resave(
     datahandler,
     testdatadir,
@@ -496,6 +538,101 @@ def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 2
 
 
+def test_partitioneddatahandler_ohlcv(mocker, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    dh = get_datahandler(tmpdir1, 'partitioned')
+    # 2023-01-01 - 2023-03-31
+    data = generate_test_data('1h', 24 * 90, '2023-01-01')
+    dh.ohlcv_store('UNITTEST/NEW', '1h', data, CandleType.SPOT)
+
+    dirname = tmpdir1 / 'UNITTEST_NEW-1h.partitioned'
+    assert dirname.is_dir()
+    assert sorted(p.name for p in dirname.glob('*.parquet')) == [
+        '2023-01.parquet', '2023-02.parquet', '2023-03.parquet']
+    assert dh.ohlcv_get_pairs(tmpdir1, '1h', CandleType.SPOT) == ['UNITTEST/NEW']
+    assert dh.ohlcv_get_available_data(tmpdir1, TradingMode.SPOT) == [
+        ('UNITTEST/NEW', '1h', CandleType.SPOT)]
+
+    # Min / max come from the index
+    load_mock = mocker.spy(PartitionedDataHandler, '_ohlcv_load')
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '1h', CandleType.SPOT) == (
+        data.iloc[0]['date'].to_pydatetime(), data.iloc[-1]['date'].to_pydatetime())
+    assert load_mock.call_count == 0
+    assert dh.ohlcv_data_min_max('UNITTEST/NONEXIST', '1h', CandleType.SPOT) == (
+        datetime.fromtimestamp(0, tz=timezone.utc), datetime.fromtimestamp(0, tz=timezone.utc))
+
+    ohlcv = dh.ohlcv_load('UNITTEST/NEW', '1h', CandleType.SPOT)
+    assert ohlcv.equals(data)
+
+    # Only the partition overlapping the timerange is read
+    read_mock = mocker.patch('freqtrade.data.history.partitioneddatahandler.read_parquet',
+                             wraps=read_parquet)
+    timerange = TimeRange.parse_timerange('20230205-20230210')
+    ohlcv = dh.ohlcv_load('UNITTEST/NEW', '1h', CandleType.SPOT, timerange=timerange)
+    assert read_mock.call_count == 1
+    assert read_mock.call_args[0][0] == dirname / '2023-02.parquet'
+    assert ohlcv.iloc[0]['date'] == datetime(2023, 2, 5, tzinfo=timezone.utc)
+    assert ohlcv.iloc[-1]['date'] == datetime(2023, 2, 10, tzinfo=timezone.utc)
+    assert len(ohlcv) == 24 * 5 + 1
+
+    # Append only rewrites the partitions of the new candles
+    written = mocker.spy(DataFrame, 'to_parquet')
+    appended = generate_test_data('1h', 24 * 10, '2023-03-31')
+    dh.ohlcv_append('UNITTEST/NEW', '1h', appended, CandleType.SPOT)
+    assert written.call_count == 2
+    assert sorted(p.name for p in dirname.glob('*.parquet')) == [
+        '2023-01.parquet', '2023-02.parquet', '2023-03.parquet', '2023-04.parquet']
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '1h', CandleType.SPOT) == (
+        data.iloc[0]['date'].to_pydatetime(), appended.iloc[-1]['date'].to_pydatetime())
+
+    ohlcv = dh.ohlcv_load('UNITTEST/NEW', '1h', CandleType.SPOT)
+    assert len(ohlcv) == 24 * 89 + 24 * 10
+    assert ohlcv['date'].is_monotonic_increasing
+    assert ohlcv.iloc[-24 * 10:].reset_index(drop=True).equals(appended)
+
+    # Storing replaces all partitions
+    dh.ohlcv_store('UNITTEST/NEW', '1h', data.iloc[:24], CandleType.SPOT)
+    assert [p.name for p in dirname.glob('*.parquet')] == ['2023-01.parquet']
+    assert dh.ohlcv_load('UNITTEST/NEW', '1h', CandleType.SPOT).equals(data.iloc[:24])
+
+    assert dh.ohlcv_purge('UNITTEST/NEW', '1h', CandleType.SPOT)
+    assert not dirname.exists()
+    assert not dh.ohlcv_purge('UNITTEST/NEW', '1h', CandleType.SPOT)
+
+
+def test_arrowdatahandler_ohlcv_memory_mapped(tmpdir):
+    tmpdir1 = Path(tmpdir)
+    dh = get_datahandler(tmpdir1, 'arrow')
+    data = generate_test_data('1m', 24 * 60 * 3, '2023-01-01')
+    dh.ohlcv_store('UNITTEST/NEW', '1m', data, CandleType.SPOT)
+    filename = tmpdir1 / 'UNITTEST_NEW-1m.arrow'
+    assert filename.is_file()
+    assert not (tmpdir1 / 'UNITTEST_NEW-1m.arrow.tmp').exists()
+
+    ohlcv = dh._ohlcv_load('UNITTEST/NEW', '1m', None, CandleType.SPOT)
+    assert ohlcv.equals(data)
+    # Columns are read-only views on the mapped file
+    assert not ohlcv['close'].values.flags.writeable
+    assert ohlcv['close'].values.base is not None
+
+    # Trimming and cleaning doesn't copy the candles
+    timerange = TimeRange.parse_timerange('20230102-20230103')
+    ohlcv1 = dh.ohlcv_load('UNITTEST/NEW', '1m', CandleType.SPOT, timerange=timerange)
+    assert len(ohlcv1) == 24 * 60 + 1
+    assert ohlcv1.iloc[0]['date'] == datetime(2023, 1, 2, tzinfo=timezone.utc)
+    assert not ohlcv1['close'].values.flags.writeable
+
+    # Storing again replaces the file, dataframes of the prior file remain valid
+    dh.ohlcv_store('UNITTEST/NEW', '1m', data.iloc[:10], CandleType.SPOT)
+    assert ohlcv.equals(data)
+    assert len(dh._ohlcv_load('UNITTEST/NEW', '1m', None, CandleType.SPOT)) == 10
+
+    # Compressed files of the feather datahandler can be loaded as well
+    get_datahandler(tmpdir1, 'feather').ohlcv_store('UNITTEST/BTC', '1m', data, CandleType.SPOT)
+    copyfile(tmpdir1 / 'UNITTEST_BTC-1m.feather', tmpdir1 / 'UNITTEST_BTC-1m.arrow')
+    assert dh._ohlcv_load('UNITTEST/BTC', '1m', None, CandleType.SPOT).equals(data)
+
+
 def test_featherdatahandler_trades_load(testdatadir):
     dh = get_datahandler(testdatadir, 'feather')
     trades = dh.trades_load('XRP/ETH')
@@ -570,6 +707,14 @@ def test_gethandlerclass():
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass('arrow')
+    assert cl == ArrowDataHandler
+    assert issubclass(cl, FeatherDataHandler)
+
+    cl = get_datahandlerclass('partitioned')
+    assert cl == PartitionedDataHandler
+    assert issubclass(cl, IDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass('DeadBeef')
 
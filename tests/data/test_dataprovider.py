@@ -247,6 +247,60 @@ def test_refresh(mocker, default_conf):
     assert refresh_mock.call_args[0][0] == pairs + pairs_non_trad
 
 
+def test_refresh_resample_higher_timeframes(mocker, default_conf):
+    refresh_mock = mocker.patch(f"{EXMS}.refresh_latest_ohlcv")
+    resample_mock = mocker.patch(f"{EXMS}.resample_latest_ohlcv",
+                                 side_effect=lambda pair_key, base_key: pair_key[0] != 'ETH/BTC')
+    budget_mock = mocker.patch(f"{EXMS}.ohlcv_request_budget", return_value=1)
+    default_conf['exchange']['resample_higher_timeframes'] = True
+    exchange = get_patched_exchange(mocker, default_conf, id="binance")
+    spot = CandleType.SPOT
+    pairs = [("XRP/BTC", '5m', spot), ("ETH/BTC", '5m', spot)]
+    helping_pairs = [("XRP/BTC", '1h', spot), ("XRP/BTC", '4h', spot), ("XRP/BTC", '1w', spot),
+                     ("XRP/BTC", '1h', CandleType.MARK), ("ETH/BTC", '15m', spot),
+                     ("ETH/BTC", '1h', spot), ("LTC/BTC", '1h', spot)]
+
+    dp = DataProvider(default_conf, exchange)
+    assert dp._get_resampled_pairs(pairs + helping_pairs) == {
+        ("XRP/BTC", '1h', spot): ("XRP/BTC", '5m', spot),
+        ("XRP/BTC", '4h', spot): ("XRP/BTC", '5m', spot),
+        ("ETH/BTC", '15m', spot): ("ETH/BTC", '5m', spot),
+        ("ETH/BTC", '1h', spot): ("ETH/BTC", '5m', spot),
+    }
+
+    dp.refresh(pairs, helping_pairs)
+    assert refresh_mock.call_count == 2
+    assert refresh_mock.call_args_list[0][0][0] == [
+        ("XRP/BTC", '5m', spot), ("ETH/BTC", '5m', spot), ("XRP/BTC", '1w', spot),
+        ("XRP/BTC", '1h', CandleType.MARK), ("LTC/BTC", '1h', spot)]
+    assert resample_mock.call_count == 4
+    # Candles which couldn't be resampled are fetched
+    assert sorted(refresh_mock.call_args_list[1][0][0]) == [
+        ("ETH/BTC", '15m', spot), ("ETH/BTC", '1h', spot)]
+
+    refresh_mock.reset_mock()
+    resample_mock.side_effect = None
+    resample_mock.return_value = True
+    dp.refresh(pairs, helping_pairs)
+    assert refresh_mock.call_count == 1
+
+    # Only as many timeframes as necessary are resampled - with the fewest base candles first
+    budget_mock.return_value = len(pairs + helping_pairs) - 2
+    assert dp._plan_resampling(pairs + helping_pairs) == {
+        ("ETH/BTC", '15m', spot): ("ETH/BTC", '5m', spot),
+        ("ETH/BTC", '1h', spot): ("ETH/BTC", '5m', spot),
+    }
+
+    # Candles are fetched while the request budget allows
+    budget_mock.return_value = len(pairs + helping_pairs)
+    refresh_mock.reset_mock()
+    resample_mock.reset_mock()
+    dp.refresh(pairs, helping_pairs)
+    assert refresh_mock.call_count == 1
+    assert refresh_mock.call_args[0][0] == pairs + helping_pairs
+    assert resample_mock.call_count == 0
+
+
 def test_orderbook(mocker, default_conf, order_book_l2):
     api_mock = MagicMock()
     api_mock.fetch_l2_order_book = order_book_l2
@@ -1,8 +1,10 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
 import uuid
+from datetime import timedelta
 from pathlib import Path
 from shutil import copyfile
 from unittest.mock import MagicMock, PropertyMock
@@ -14,7 +16,8 @@ from pandas.testing import assert_frame_equal
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
-from freqtrade.data.history.history_utils import (_download_pair_history, _download_trades_history,
+from freqtrade.data.history.history_utils import (_download_journal, _download_pair_history,
+                                                  _download_trades_history,
                                                   _load_cached_data_for_updating,
                                                   convert_trades_to_ohlcv, get_timerange, load_data,
                                                   load_pair_history, refresh_backtest_ohlcv_data,
@@ -23,10 +26,10 @@ from freqtrade.data.history.history_utils import (_download_pair_history, _downl
 from freqtrade.data.history.idatahandler import get_datahandler
 from freqtrade.data.history.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.enums import CandleType
-from freqtrade.exchange import timeframe_to_minutes
+from freqtrade.exchange import timeframe_to_minutes, timeframe_to_msecs
 from freqtrade.misc import file_dump_json
 from freqtrade.resolvers import StrategyResolver
-from freqtrade.util import dt_utc
+from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, get_patched_exchange, log_has, log_has_re,
                             patch_exchange)
 
@@ -103,6 +106,30 @@ def test_load_data_startup_candles(mocker, testdatadir) -> None:
     assert ltfmock.call_args_list[0][1]['timerange'].startts == timerange.startts - 20 * 60
 
 
+@pytest.mark.parametrize('data_format', ['json', 'hdf5'])
+def test_load_data_concurrent(testdatadir, caplog, data_format) -> None:
+    pairs = ['UNITTEST/BTC', 'NONEXIST/BTC', 'ETH/BTC', 'XRP/ETH', 'LTC/BTC']
+    if data_format == 'hdf5':
+        pairs = ['UNITTEST/BTC', 'NONEXIST/BTC']
+    expected = load_data(testdatadir, '5m', pairs, data_format=data_format)
+
+    progress = MagicMock()
+    caplog.clear()
+    data = load_data(testdatadir, '5m', pairs, data_format=data_format, load_jobs=2,
+                     progress_callback=progress)
+    # Same result, in the same order
+    assert list(data) == list(expected)
+    for pair, df in expected.items():
+        assert data[pair].equals(df)
+    assert progress.call_count == len(pairs)
+    if data_format == 'json':
+        assert log_has('Loading data for 5 pairs using 2 worker processes.', caplog)
+    else:
+        assert log_has('Loading data for 2 pairs using 2 threads.', caplog)
+    # Log messages of workers are emitted
+    assert log_has_re(r'No history for NONEXIST/BTC, spot, 5m found\..*', caplog)
+
+
 @pytest.mark.parametrize('candle_type', ['mark', ''])
 def test_load_data_with_new_pair_1min(ohlcv_history_list, mocker, caplog,
                                       default_conf, tmpdir, candle_type) -> None:
@@ -525,6 +552,106 @@ def test_refresh_backtest_ohlcv_data(
     assert log_has_re(r"Downloading pair ETH/BTC, .* interval 1m\.", caplog)
 
 
+@pytest.mark.parametrize('trademode,jobcount', [('spot', 4), ('futures', 8)])
+def test_refresh_backtest_ohlcv_data_concurrent(mocker, default_conf, markets, tmpdir, caplog,
+                                                trademode, jobcount):
+    tmpdir1 = Path(tmpdir)
+    store_mock = mocker.spy(type(get_datahandler(tmpdir1)), 'ohlcv_store')
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=markets))
+    mocker.patch(f'{EXMS}.ohlcv_candle_limit', return_value=100)
+    mocker.patch('freqtrade.data.history.history_utils.DOWNLOAD_CHUNK_CALLS', 2)
+    ex = get_patched_exchange(mocker, default_conf)
+    calls = []
+    running = [0, 0]
+    failures = [('XRP/BTC', '5m')]
+
+    async def get_historic_ohlcv(pair, timeframe, since_ms, candle_type, is_new_pair=False,
+                                 raise_=False, until_ms=None):
+        calls.append((pair, timeframe, candle_type, since_ms, until_ms))
+        running[0] += 1
+        running[1] = max(running)
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        if (pair, timeframe) in failures and len([c for c in calls if c[:2] == (pair, '5m')]) == 3:
+            failures.clear()
+            raise ValueError('Connection lost')
+        tf_ms = timeframe_to_msecs(timeframe)
+        start = since_ms - since_ms % tf_ms
+        # Exchanges return full pages - also beyond until_ms
+        return (pair, timeframe, candle_type,
+                [[date, 1, 2, 0.5, 1.5, 10] for date in range(start, start + 300 * tf_ms, tf_ms)
+                 if date < dt_ts()], True)
+
+    ex._async_get_historic_ohlcv = get_historic_ohlcv
+    timerange = TimeRange.parse_timerange("20230101-20230110")
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=["ETH/BTC", "XRP/BTC"],
+                                timeframes=["5m", "1h"], datadir=tmpdir1, timerange=timerange,
+                                trading_mode=trademode, download_jobs=3)
+    assert running[1] == 3
+    assert len({c[:3] for c in calls}) == jobcount
+    # Data is stored once per pair / timeframe - not after every chunk
+    assert store_mock.call_count == jobcount
+    assert log_has_re(r"Failed to download 1 of \d+ pairs / timeframes: XRP/BTC 5m .*", caplog)
+    assert not list(tmpdir1.rglob('*.download'))
+    data_handler = get_datahandler(tmpdir1)
+    candle_type = CandleType.get_default(trademode)
+    eth = data_handler.ohlcv_load('ETH/BTC', '5m', candle_type=candle_type)
+    assert eth['date'].iloc[0] == dt_utc(2023, 1, 1)
+    assert eth['date'].diff().iloc[1:].eq(timedelta(minutes=5)).all()
+    assert eth['date'].iloc[-1] >= dt_utc(2023, 1, 10)
+
+    # Chunks downloaded before the failure have been stored
+    xrp = data_handler.ohlcv_load('XRP/BTC', '5m', candle_type=candle_type)
+    assert len(xrp) == 2 * 100 * 2
+    calls.clear()
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=["XRP/BTC"], timeframes=["5m"],
+                                datadir=tmpdir1, timerange=timerange,
+                                trading_mode=trademode, download_jobs=2)
+    # Download resumes from the stored data (the last stored candle is loaded as incomplete)
+    assert calls[0][3] == dt_ts(xrp['date'].iloc[-2])
+    xrp = data_handler.ohlcv_load('XRP/BTC', '5m', candle_type=candle_type)
+    assert xrp['date'].iloc[0] == dt_utc(2023, 1, 1)
+    assert xrp['date'].diff().iloc[1:].eq(timedelta(minutes=5)).all()
+    assert xrp['date'].iloc[-1] >= dt_utc(2023, 1, 10)
+
+    # Prepending downloads the newest chunk first
+    calls.clear()
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=["ETH/BTC"], timeframes=["5m"],
+                                datadir=tmpdir1, prepend=True, download_jobs=2,
+                                timerange=TimeRange.parse_timerange("20221225-20230110"),
+                                trading_mode=trademode)
+    since = [c[3] for c in calls if c[:2] == ('ETH/BTC', '5m')]
+    assert since == sorted(since, reverse=True)
+    assert since[-1] == dt_ts(dt_utc(2022, 12, 25))
+    eth = data_handler.ohlcv_load('ETH/BTC', '5m', candle_type=candle_type)
+    assert eth['date'].iloc[0] == dt_utc(2022, 12, 25)
+    assert eth['date'].diff().iloc[1:].eq(timedelta(minutes=5)).all()
+    assert eth['date'].iloc[-1] >= dt_utc(2023, 1, 10)
+
+
+def test_refresh_backtest_ohlcv_data_interrupted(mocker, default_conf, markets, tmpdir, caplog):
+    tmpdir1 = Path(tmpdir)
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    ex._async_get_historic_ohlcv = MagicMock(side_effect=KeyboardInterrupt)
+    data_handler = get_datahandler(tmpdir1)
+    journal = _download_journal(data_handler, 'ETH/BTC', '1h', CandleType.SPOT)
+    start = dt_ts(dt_utc(2023, 1, 1))
+    candles = [[start + i * 3600_000, 1, 2, 0.5, 1.5, 10] for i in range(30)]
+    # Interrupted while appending the third chunk
+    journal.write_text(json.dumps(candles[10:20]) + '\n' + json.dumps(candles[:10]) + '\n'
+                       + json.dumps(candles[20:])[:-10])
+
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(exchange=ex, pairs=["ETH/BTC"], timeframes=["1h"],
+                                    datadir=tmpdir1, trading_mode='spot', download_jobs=2)
+    assert log_has('Stored candles of an interrupted download of "ETH/BTC", 1h, spot.', caplog)
+    assert not journal.is_file()
+    eth = data_handler.ohlcv_load('ETH/BTC', '1h', candle_type=CandleType.SPOT)
+    assert eth['date'].iloc[0] == dt_utc(2023, 1, 1)
+    assert len(eth) == 20
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch('freqtrade.data.history.history_utils._download_pair_history',
                            MagicMock())
@@ -656,3 +783,59 @@ def test_convert_trades_to_ohlcv(testdatadir, tmpdir, caplog):
     convert_trades_to_ohlcv(['NoDatapair'], timeframes=['1m', '5m'],
                             datadir=tmpdir1, timerange=tr, erase=True)
     assert log_has('Could not convert NoDatapair to OHLCV.', caplog)
+
+
+def test_convert_trades_to_ohlcv_incremental(testdatadir, tmpdir, caplog):
+    tmpdir1 = Path(tmpdir)
+    tmpdir2 = tmpdir1 / 'full'
+    tmpdir2.mkdir()
+    tr = TimeRange.parse_timerange('20191011-20191012')
+    timeframes = ['1m', '5m', '1h']
+    trades = JsonGzDataHandler(testdatadir).trades_load('XRP/ETH')
+    dh = JsonGzDataHandler(tmpdir1)
+    dh.trades_store('XRP/ETH', trades[:len(trades) // 2])
+    dh.trades_store('ETH/BTC', trades[:len(trades) // 3])
+    for pair in ('XRP/ETH', 'ETH/BTC'):
+        JsonGzDataHandler(tmpdir2).trades_store(pair, trades)
+
+    convert_trades_to_ohlcv(['XRP/ETH', 'ETH/BTC'], timeframes=timeframes,
+                            datadir=tmpdir1, timerange=tr)
+    assert not log_has_re(r'Converting trades of .* since .*', caplog)
+
+    # Newly appended trades are converted, in worker processes
+    dh.trades_store('XRP/ETH', trades)
+    dh.trades_store('ETH/BTC', trades)
+    convert_trades_to_ohlcv(['XRP/ETH', 'ETH/BTC'], timeframes=timeframes,
+                            datadir=tmpdir1, timerange=tr, convert_jobs=2)
+    assert log_has('Converting trades of 2 pairs using 2 worker processes.', caplog)
+    assert log_has_re(r'Converting trades of XRP/ETH since 2019-10-1.*\.', caplog)
+    assert log_has_re(r'Converting trades of ETH/BTC since 2019-10-1.*\.', caplog)
+
+    # Same result as converting all trades at once
+    convert_trades_to_ohlcv(['XRP/ETH', 'ETH/BTC'], timeframes=timeframes,
+                            datadir=tmpdir2, timerange=tr)
+    for pair in ('XRP/ETH', 'ETH/BTC'):
+        for timeframe in timeframes:
+            df = load_pair_history(datadir=tmpdir1, timeframe=timeframe, pair=pair,
+                                   fill_up_missing=False)
+            expected = load_pair_history(datadir=tmpdir2, timeframe=timeframe, pair=pair,
+                                         fill_up_missing=False)
+            assert len(df) > 1
+            assert df.equals(expected)
+
+    # Trades downloaded further back are converted completely
+    dh.trades_store('XRP/ETH', trades[len(trades) // 2:])
+    convert_trades_to_ohlcv(['XRP/ETH'], timeframes=timeframes, datadir=tmpdir1, timerange=tr,
+                            erase=True)
+    dh.trades_store('XRP/ETH', trades)
+    caplog.clear()
+    convert_trades_to_ohlcv(['XRP/ETH'], timeframes=timeframes, datadir=tmpdir1, timerange=tr)
+    assert log_has('Trades of XRP/ETH start before the stored candles, converting all trades.',
+                   caplog)
+    assert not log_has_re(r'Converting trades of XRP/ETH since .*', caplog)
+    for timeframe in timeframes:
+        df = load_pair_history(datadir=tmpdir1, timeframe=timeframe, pair='XRP/ETH',
+                               fill_up_missing=False)
+        expected = load_pair_history(datadir=tmpdir2, timeframe=timeframe, pair='XRP/ETH',
+                                     fill_up_missing=False)
+        assert df.equals(expected)
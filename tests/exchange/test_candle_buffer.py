@@ -0,0 +1,72 @@
+import numpy as np
+from pandas.testing import assert_frame_equal
+
+from freqtrade.exchange.candle_buffer import CandleBuffer
+from tests.conftest import generate_test_data
+
+
+def test_candle_buffer():
+    data = generate_test_data('5m', 60, '2023-01-01')
+    buffer = CandleBuffer('5m', 20)
+    assert len(buffer) == 0
+    assert buffer.dataframe().empty
+    assert buffer.update(data.iloc[:0])
+
+    assert buffer.update(data.iloc[:10])
+    assert len(buffer) == 10
+    df = buffer.dataframe()
+    assert_frame_equal(df, data.iloc[:10])
+    # Dataframe is a view on the buffer
+    assert np.shares_memory(df['close'].values, buffer._values)
+
+    # Overlapping, unchanged candles are kept in place
+    assert buffer.update(data.iloc[8:12])
+    assert len(buffer) == 12
+    assert np.shares_memory(df['close'].values, buffer._values)
+
+    # Overlapping candles are merged into new arrays
+    update = data.iloc[5:15].copy()
+    update.loc[5, ['open', 'high', 'low', 'close', 'volume']] = (5, 1234.5, 0.5, 3, 1)
+    update.loc[11, 'close'] = 1234.5
+    assert buffer.update(update)
+    assert len(buffer) == 15
+    merged = buffer.dataframe()
+    assert merged.loc[5, 'open'] == data.loc[5, 'open']
+    assert merged.loc[5, 'high'] == 1234.5
+    assert merged.loc[5, 'low'] == 0.5
+    assert merged.loc[5, 'close'] == 3
+    assert merged.loc[5, 'volume'] == data.loc[5, 'volume']
+    assert merged.loc[11, 'close'] == 1234.5
+    assert_frame_equal(merged.drop(index=[5, 11]), data.iloc[:15].drop(index=[5, 11]))
+    # Dataframes returned before remain unchanged
+    assert not np.shares_memory(df['close'].values, buffer._values)
+    assert_frame_equal(df, data.iloc[:10])
+
+    # Candles starting before the buffered candles
+    buffer_start = CandleBuffer('5m', 20)
+    assert buffer_start.update(data.iloc[5:10])
+    assert not buffer_start.update(data.iloc[4:12])
+    assert len(buffer_start) == 5
+
+    # Gap between buffered and new candles
+    assert not buffer.update(data.iloc[16:20])
+    assert len(buffer) == 15
+
+    # Candles beyond the capacity are aged out
+    assert buffer.update(data.iloc[15:45])
+    assert len(buffer) == 20
+    assert_frame_equal(buffer.dataframe(), data.iloc[25:45].reset_index(drop=True))
+
+    df = buffer.dataframe()
+    for idx in range(45, 60):
+        assert buffer.update(data.iloc[idx:idx + 1])
+    assert_frame_equal(buffer.dataframe(), data.iloc[40:60].reset_index(drop=True))
+    # Arrays have been reallocated - earlier dataframes remain unchanged
+    assert not np.shares_memory(df['close'].values, buffer._values)
+    assert_frame_equal(df, data.iloc[25:45].reset_index(drop=True))
+
+    # More candles than the capacity at once
+    buffer = CandleBuffer('5m', 20)
+    assert buffer.update(data)
+    assert len(buffer) == 20
+    assert_frame_equal(buffer.dataframe(), data.iloc[40:].reset_index(drop=True))
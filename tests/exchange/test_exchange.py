@@ -1,16 +1,19 @@
 import copy
 import logging
+import pickle
+import sys
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from random import randint
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import ccxt
+import ccxt.pro as ccxt_pro
 import pytest
 from ccxt import DECIMAL_PLACES, ROUND, ROUND_UP, TICK_SIZE, TRUNCATE
 from pandas import DataFrame
 
-from freqtrade.enums import CandleType, MarginMode, TradingMode
+from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.exceptions import (DDosProtection, DependencyException, ExchangeError,
                                   InsufficientFundsError, InvalidOrderException,
                                   OperationalException, PricingError, TemporaryError)
@@ -21,6 +24,7 @@ from freqtrade.exchange import (Binance, Bittrex, Exchange, Kraken, amount_to_pr
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, API_RETRY_COUNT,
                                        calculate_backoff, remove_exchange_credentials)
 from freqtrade.exchange.exchange import amount_to_contract_precision
+from freqtrade.exchange.exchange_ws import OHLCVStream
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (EXMS, generate_test_data_raw, get_mock_coro, get_patched_exchange,
@@ -137,6 +141,21 @@ def test_init(default_conf, mocker, caplog):
     assert log_has('Instance is running with dry_run enabled', caplog)
 
 
+def test_exchange_pickle(default_conf, mocker):
+    exchange = Exchange(default_conf, validate=False)
+    exchange._klines[('ETH/BTC', '5m', CandleType.SPOT)] = DataFrame({'close': [1.0]})
+    unpickled = pickle.loads(pickle.dumps(exchange))
+    assert unpickled._api is None
+    assert unpickled._api_async is None
+    assert unpickled.loop is None
+    assert unpickled.klines(('ETH/BTC', '5m', CandleType.SPOT))['close'].iloc[0] == 1.0
+    # The exchange itself keeps its connections
+    assert exchange._api is not None
+    assert not exchange.loop.is_closed()
+    unpickled.close()
+    exchange.close()
+
+
 def test_remove_exchange_credentials(default_conf) -> None:
     conf = deepcopy(default_conf)
     remove_exchange_credentials(conf['exchange'], False)
@@ -2368,6 +2387,188 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     assert res[pair2].at[0, 'open']
 
 
+class FakeOHLCVStream(OHLCVStream):
+    def __init__(self):
+        self.subscribed = set()
+        self.candles = {}
+
+    def subscribe(self, pair_key):
+        self.subscribed.add(pair_key)
+
+    def ohlcv(self, pair_key):
+        return self.candles.get(pair_key, [])
+
+
+def test__init_ohlcv_stream(mocker, default_conf, caplog) -> None:
+    stream_mock = mocker.patch('freqtrade.exchange.exchange.CCXTOHLCVStream')
+    default_conf['exchange']['enable_ws'] = True
+    exchange = get_patched_exchange(mocker, default_conf)
+    # Only in dry / live runs
+    assert exchange._ohlcv_stream is None
+
+    default_conf['runmode'] = RunMode.DRY_RUN
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange._ohlcv_stream is stream_mock.return_value
+    assert log_has('Streaming candles via websockets.', caplog)
+    exchange.close()
+    assert stream_mock.return_value.close.call_count == 1
+    assert exchange._ohlcv_stream is None
+
+    api_mock = MagicMock(has={'watchOHLCV': False})
+    exchange = get_patched_exchange(mocker, default_conf, api_mock=api_mock)
+    assert exchange._ohlcv_stream is None
+    assert log_has('Binance does not support streaming candles, using REST calls.', caplog)
+
+    mocker.patch('freqtrade.exchange.exchange.is_exchange_known_ccxt',
+                 side_effect=lambda name, module=None: module is not ccxt_pro)
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange._ohlcv_stream is None
+    assert log_has('Binance does not support websockets, using REST calls.', caplog)
+
+
+def test_refresh_latest_ohlcv_stream(mocker, default_conf, time_machine) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw('1h', 100, start.strftime('%Y-%m-%d'))
+    time_machine.move_to(start + timedelta(hours=99, minutes=30))
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv)
+    exchange._ohlcv_stream = stream = FakeOHLCVStream()
+    pair = ('IOTA/ETH', '1h', CandleType.SPOT)
+    mark_pair = ('IOTA/ETH', '1h', CandleType.MARK)
+
+    # Initial candles via REST
+    res = exchange.refresh_latest_ohlcv([pair, mark_pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 2
+    assert len(res[pair]) == 99
+    assert stream.subscribed == {pair}
+    exchange._api_async.fetch_ohlcv.reset_mock()
+
+    # Streamed candles, including the incomplete candle, are appended
+    time_machine.move_to(start + timedelta(hours=101, minutes=10))
+    streamed = generate_test_data_raw('1h', 4, (start + timedelta(hours=98)).strftime(
+        '%Y-%m-%d %H:%M'))
+    stream.candles[pair] = streamed
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 0
+    assert len(res[pair]) == 100
+    assert res[pair].index[-1] == 99
+    assert res[pair]['date'].iloc[-1] == start + timedelta(hours=100)
+    assert res[pair]['close'].iloc[-1] == streamed[2][4]
+    assert exchange._pairs_last_refresh_time[pair] == streamed[2][0] // 1000
+
+    # Missing candles in the stream are backfilled via REST
+    time_machine.move_to(start + timedelta(hours=103, minutes=10))
+    stream.candles[pair] = streamed[3:]
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+
+
+def test_refresh_latest_ohlcv_stream_incomplete(mocker, default_conf, time_machine) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw('1h', 100, start.strftime('%Y-%m-%d'))
+    time_machine.move_to(start + timedelta(hours=99, minutes=30))
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv)
+    exchange._ohlcv_stream = stream = FakeOHLCVStream()
+    pair = ('IOTA/ETH', '1h', CandleType.SPOT)
+
+    # Initial candles via REST - including the incomplete candle
+    res = exchange.refresh_latest_ohlcv([pair], drop_incomplete=False)
+    assert len(res[pair]) == 100
+    assert res[pair]['date'].iloc[-1] == start + timedelta(hours=99)
+    exchange._api_async.fetch_ohlcv.reset_mock()
+
+    # The cached incomplete candle is replaced, the new incomplete candle is appended
+    time_machine.move_to(start + timedelta(hours=101, minutes=10))
+    streamed = generate_test_data_raw('1h', 3, (start + timedelta(hours=99)).strftime(
+        '%Y-%m-%d %H:%M'))
+    stream.candles[pair] = streamed
+    res = exchange.refresh_latest_ohlcv([pair], drop_incomplete=False)
+    assert exchange._api_async.fetch_ohlcv.call_count == 0
+    assert len(res[pair]) == 100
+    assert res[pair]['date'].iloc[-1] == start + timedelta(hours=101)
+    assert res[pair]['close'].iloc[-1] == streamed[2][4]
+    assert res[pair]['close'].iloc[-3] == streamed[0][4]
+    assert exchange._pairs_last_refresh_time[pair] == streamed[2][0] // 1000
+
+    # The current candle is missing in the stream
+    time_machine.move_to(start + timedelta(hours=103, minutes=10))
+    res = exchange.refresh_latest_ohlcv([pair], drop_incomplete=False)
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+
+
+def test_resample_latest_ohlcv(mocker, default_conf, time_machine) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    time_machine.move_to(start + timedelta(hours=10, minutes=2))
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=500)
+    base_key = ('IOTA/ETH', '5m', CandleType.SPOT)
+    pair_key = ('IOTA/ETH', '1h', CandleType.SPOT)
+    exchange._api_async.fetch_ohlcv = get_mock_coro(generate_test_data_raw('5m', 121, start))
+    exchange.refresh_latest_ohlcv([base_key])
+    assert not exchange.resample_latest_ohlcv(pair_key, base_key)
+
+    exchange._api_async.fetch_ohlcv = get_mock_coro(generate_test_data_raw('1h', 8, start))
+    exchange.refresh_latest_ohlcv([pair_key])
+    assert exchange.klines(pair_key)['date'].iloc[-1] == start + timedelta(hours=6)
+    # Missing candles are resampled from the 5m candles
+    assert exchange.resample_latest_ohlcv(pair_key, base_key)
+    candles = exchange.klines(pair_key)
+    assert len(candles) == 10
+    assert candles['date'].iloc[-1] == start + timedelta(hours=9)
+    base_candles = exchange.klines(base_key).iloc[108:120]
+    assert candles['open'].iloc[-1] == base_candles['open'].iloc[0]
+    assert candles['high'].iloc[-1] == base_candles['high'].max()
+    assert candles['low'].iloc[-1] == base_candles['low'].min()
+    assert candles['close'].iloc[-1] == base_candles['close'].iloc[-1]
+    assert candles['volume'].iloc[-1] == pytest.approx(base_candles['volume'].sum())
+    assert exchange._pairs_last_refresh_time[pair_key] == dt_ts(start + timedelta(hours=9)) // 1000
+    # Up to date
+    assert exchange.resample_latest_ohlcv(pair_key, base_key)
+
+    # Base candles didn't arrive yet
+    time_machine.move_to(start + timedelta(hours=11, minutes=2))
+    assert not exchange.resample_latest_ohlcv(pair_key, base_key)
+    assert len(exchange.klines(pair_key)) == 10
+
+
+def test_ohlcv_request_budget(mocker, default_conf) -> None:
+    default_conf['internals'] = {'process_throttle_secs': 5}
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._api_async.enableRateLimit = True
+    exchange._api_async.rateLimit = 50
+    assert exchange.ohlcv_request_budget() == 100
+    exchange._api_async.rateLimit = 10000
+    assert exchange.ohlcv_request_budget() == 1
+    exchange._api_async.enableRateLimit = False
+    assert exchange.ohlcv_request_budget() == sys.maxsize
+
+
+def test_ohlcv_requests_due(mocker, default_conf, time_machine) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    time_machine.move_to(start + timedelta(hours=10, minutes=2))
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=500)
+    pair_5m = ('IOTA/ETH', '5m', CandleType.SPOT)
+    pair_1h = ('IOTA/ETH', '1h', CandleType.SPOT)
+    assert sorted(exchange.ohlcv_requests_due([pair_5m, pair_1h, pair_1h])) == [pair_1h, pair_5m]
+
+    exchange._api_async.fetch_ohlcv = get_mock_coro(generate_test_data_raw('5m', 121, start))
+    exchange.refresh_latest_ohlcv([pair_5m])
+    assert exchange.ohlcv_requests_due([pair_5m, pair_1h]) == [pair_1h]
+
+    time_machine.move_to(start + timedelta(hours=10, minutes=7))
+    assert exchange.ohlcv_requests_due([pair_5m]) == [pair_5m]
+    # Refreshed from the candle stream
+    exchange._ohlcv_stream = MagicMock()
+    assert exchange.ohlcv_requests_due([pair_5m]) == []
+    exchange._ohlcv_stream = None
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test__async_get_candle_history(default_conf, mocker, caplog, exchange_name):
     ohlcv = [
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import ccxt
+
+from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_ws import CCXTOHLCVStream
+from tests.conftest import log_has_re
+
+
+class FakeWebsocketApi:
+    """
+    Mimics ccxt.pro - every watch_ohlcv() call receives one pushed candle.
+    """
+
+    def __init__(self):
+        self.ohlcvs = {}
+        self.calls = 0
+        self.close = MagicMock(side_effect=self._close)
+
+    async def _close(self):
+        pass
+
+    async def watch_ohlcv(self, pair, timeframe):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.calls == 2:
+            raise ccxt.NetworkError('Connection closed')
+        candles = self.ohlcvs.setdefault(pair, {}).setdefault(timeframe, [])
+        candles.append([self.calls * 60_000, 1, 2, 0.5, 1.5, 10])
+        return candles
+
+
+def test_ccxt_ohlcv_stream(caplog):
+    api = FakeWebsocketApi()
+    stream = CCXTOHLCVStream(api)
+    stream.reconnect_delay = 0
+    pair_key = ('ETH/BTC', '1m', CandleType.SPOT)
+    assert stream.ohlcv(pair_key) == []
+
+    stream.subscribe(pair_key)
+    watcher = stream._watchers[pair_key]
+    # Subscribing again doesn't start another watcher
+    stream.subscribe(pair_key)
+    assert stream._watchers[pair_key] is watcher
+
+    for _ in range(500):
+        if len(stream.ohlcv(pair_key)) >= 3:
+            break
+        time.sleep(0.01)
+    candles = stream.ohlcv(pair_key)
+    assert len(candles) >= 3
+    assert candles[0] == [60_000, 1, 2, 0.5, 1.5, 10]
+    # Reconnects after errors
+    assert log_has_re(r'Candle stream for .* failed: Connection closed\. Reconnecting \.\.\.',
+                      caplog)
+
+    # Subscriptions expire if the pair is no longer requested
+    stream._last_requested[pair_key] = 0
+    watcher.result(timeout=5)
+    assert log_has_re(r'Candle stream for .* expired\.', caplog)
+
+    stream.close()
+    assert api.close.call_count == 1
+    assert not stream._thread.is_alive()
+    # Closing twice is a no-op
+    stream.close()
+    assert api.close.call_count == 1
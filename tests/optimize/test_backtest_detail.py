@@ -899,11 +899,13 @@ TESTS = [
 ]
 
 
+@pytest.mark.parametrize("engine", ['lists', 'columnar'])
 @pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer) -> None:
+def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer, engine) -> None:
     """
     run functional tests
     """
+    default_conf["backtest_engine"] = engine
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["timeframe"] = tests_timeframe
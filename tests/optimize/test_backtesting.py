@@ -21,12 +21,12 @@ from freqtrade.data.history import get_timerange
 from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange.exchange import timeframe_to_next_date
-from freqtrade.optimize.backtest_caching import get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtest_caching import get_indicator_run_id, get_strategy_run_id
+from freqtrade.optimize.backtesting import HEADERS, Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
-from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, get_args, log_has, log_has_re,
+from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, get_args, get_markets, log_has, log_has_re,
                             patch_exchange, patched_configuration_load_config_file)
 
 
@@ -500,12 +500,13 @@ def test_backtest__enter_trade(default_conf, fee, mocker) -> None:
     assert trade.stake_amount == 495
 
     # Fake 2 trades, so there's not enough amount for the next trade left.
-    LocalTrade.trades_open.append(trade)
-    LocalTrade.trades_open.append(trade)
+    trade_2 = deepcopy(trade)
+    LocalTrade.add_bt_trade(trade)
+    LocalTrade.add_bt_trade(trade_2)
     backtesting.wallets.update()
     trade = backtesting._enter_trade(pair, row=row, direction='long')
     assert trade is None
-    LocalTrade.trades_open.pop()
+    LocalTrade.remove_bt_trade(trade_2)
     trade = backtesting._enter_trade(pair, row=row, direction='long')
     assert trade is not None
 
@@ -768,6 +769,34 @@ def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
                 t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6))
 
 
+def test_backtest_float_math(default_conf, fee, mocker, testdatadir) -> None:
+    default_conf['max_open_trades'] = 10
+    default_conf['minimal_roi'] = {"0": 0.01}
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    patch_exchange(mocker)
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+
+    results = {}
+    for float_math in (False, True):
+        default_conf['backtest_float_math'] = float_math
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[float_math] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+        assert LocalTrade.float_math is float_math
+        backtesting.cleanup()
+        assert LocalTrade.float_math is False
+
+    assert len(results[False]['results']) > 10
+    pd.testing.assert_frame_equal(results[False]['results'], results[True]['results'],
+                                  check_exact=False, rtol=1e-9)
+    assert pytest.approx(results[False]['final_balance']) == results[True]['final_balance']
+
+
 @pytest.mark.parametrize('use_detail', [True, False])
 def test_backtest_one_detail(default_conf_usdt, fee, mocker, testdatadir, use_detail) -> None:
     default_conf_usdt['use_exit_signal'] = False
@@ -1330,6 +1359,7 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
         data[pair] = data[pair][tres:].reset_index()
     default_conf['timeframe'] = '5m'
     default_conf['max_open_trades'] = 3
+    default_conf['backtest_wallet_check'] = True
 
     backtesting = Backtesting(default_conf)
     backtesting._set_strategy(backtesting.strategylist[0])
@@ -1371,6 +1401,345 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results['results'], '5m', 1)) == 0
 
 
+@pytest.mark.parametrize("use_detail", [False, True])
+@pytest.mark.parametrize("stacking", [False, True])
+def test_backtest_columnar_engine(default_conf, fee, mocker, testdatadir, stacking, use_detail):
+
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata['pair'] in ('ETH/BTC', 'LTC/BTC') else 18
+        dataframe['enter_long'] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe['exit_long'] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe['enter_short'] = 0
+        dataframe['exit_short'] = 0
+        return dataframe
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -500)
+    # Late start for one pair, missing candles for another one.
+    data['ADA/BTC'] = data['ADA/BTC'][30:].reset_index(drop=True)
+    data['LTC/BTC'] = data['LTC/BTC'].drop(range(100, 140)).reset_index(drop=True)
+    default_conf['timeframe'] = '5m'
+    default_conf['max_open_trades'] = 3
+    default_conf['position_stacking'] = stacking
+    default_conf['minimal_roi'] = {"0": 0.01}
+
+    results = {}
+    loop_calls = {}
+    for engine in ('lists', 'columnar'):
+        default_conf['backtest_engine'] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        if use_detail:
+            # Use the 5m candles themselves as "detail" data to run the detail code path.
+            backtesting.timeframe_detail = '5m'
+            backtesting.timeframe_detail_min = 5
+            backtesting.detail_data = {p: df.copy() for p, df in data.items()}
+
+        loop_mock = mocker.spy(backtesting, 'backtest_loop')
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+        loop_calls[engine] = loop_mock.call_count
+        backtesting.cleanup()
+
+    res_lists = results['lists']['results']
+    res_col = results['columnar']['results']
+    assert len(res_lists) > 20
+    pd.testing.assert_frame_equal(res_lists, res_col)
+    assert results['lists']['rejected_signals'] == results['columnar']['rejected_signals']
+    assert results['lists']['final_balance'] == results['columnar']['final_balance']
+    # Idle candles are skipped
+    assert loop_calls['columnar'] < loop_calls['lists']
+
+
+@pytest.mark.parametrize("exit_conf", [
+    {'minimal_roi': {"0": 0.03, "60": 0.01, "200": 0}, 'stoploss': -0.02},
+    {'minimal_roi': {"0": 10}, 'stoploss': -0.01, 'trailing_stop': True},
+    {'minimal_roi': {"0": 10}, 'stoploss': -0.05, 'trailing_stop': True,
+     'trailing_stop_positive': 0.01, 'trailing_stop_positive_offset': 0.02,
+     'trailing_only_offset_is_reached': True},
+    {'minimal_roi': {"30": 0.02}, 'stoploss': -0.03, 'use_exit_signal': False},
+])
+def test_backtest_columnar_fast_exits(default_conf, fee, mocker, testdatadir, exit_conf):
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -1000)
+    default_conf['timeframe'] = '5m'
+    default_conf['max_open_trades'] = 3
+    default_conf.update(exit_conf)
+
+    results = {}
+    loop_calls = {}
+    for engine in ('lists', 'columnar'):
+        default_conf['backtest_engine'] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        loop_mock = mocker.spy(backtesting, 'backtest_loop')
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+        loop_calls[engine] = loop_mock.call_count
+        backtesting.cleanup()
+
+    assert backtesting._fast_exits is True
+    res_lists = results['lists']['results']
+    assert len(res_lists) > 5
+    # min_rate / max_rate of skipped candles are part of the results.
+    pd.testing.assert_frame_equal(res_lists, results['columnar']['results'])
+    assert results['lists']['final_balance'] == results['columnar']['final_balance']
+    assert loop_calls['columnar'] < loop_calls['lists'] / 2
+
+
+def test_backtest_columnar_fast_exits_possible(default_conf, mocker):
+    patch_exchange(mocker)
+    default_conf['backtest_engine'] = 'columnar'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._fast_exits_possible()
+
+    mocker.patch.object(type(backtesting.strategy), 'custom_exit',
+                        MagicMock(return_value=False))
+    assert not backtesting._fast_exits_possible()
+    backtesting.strategy.use_exit_signal = False
+    assert backtesting._fast_exits_possible()
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting._fast_exits_possible()
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.timeframe_detail = '1m'
+    assert not backtesting._fast_exits_possible()
+
+
+def test_backtest_pair_signals(default_conf, mocker, testdatadir):
+    patch_exchange(mocker)
+    default_conf['timeframe'] = '5m'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+    data = trim_dictlist(data, -300)
+    processed = backtesting.strategy.advise_all_indicators(data)
+    rsi = processed['UNITTEST/BTC']['rsi']
+
+    signals = backtesting._get_pair_signals(processed, 'UNITTEST/BTC')
+    assert list(signals.columns) == HEADERS
+    assert len(signals) == 300 - backtesting.required_startup - 1
+    # Indicators are not copied
+    analyzed = processed['UNITTEST/BTC']
+    assert np.shares_memory(analyzed['rsi'].values, rsi.values)
+    # Signals are shifted by one candle, the analyzed dataframe is left unshifted
+    assert signals['enter_long'].tolist() == analyzed['enter_long'].fillna(0).iloc[:-1].tolist()
+    assert signals['enter_long'].sum() > 0
+    assert signals['date'].tolist() == analyzed['date'].iloc[1:].tolist()
+
+
+def test_backtest_indicator_cache(default_conf, mocker, testdatadir, tmpdir, caplog):
+    patch_exchange(mocker)
+    default_conf.update({
+        'timeframe': '5m',
+        'indicator_cache': True,
+        'user_data_dir': Path(tmpdir),
+    })
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(datadir=testdatadir, timeframe='5m',
+                             pairs=['UNITTEST/BTC', 'ETH/BTC'])
+    data['ETH/BTC'] = data['ETH/BTC'].iloc[100:]
+    analyze = mocker.spy(backtesting.strategy, 'advise_all_indicators')
+
+    processed = backtesting.advise_all_indicators(data)
+    assert analyze.call_count == 1
+    cache_dir = Path(tmpdir) / 'indicator_cache' / CURRENT_TEST_STRATEGY
+    assert len(list(cache_dir.glob('*.feather'))) == 2
+
+    cached = backtesting.advise_all_indicators(data)
+    assert analyze.call_count == 1
+    assert log_has('Using cached indicators for 2 of 2 pairs.', caplog)
+    assert list(cached) == list(processed)
+    for pair, df in processed.items():
+        pd.testing.assert_frame_equal(cached[pair], df)
+
+    # Different candles of one pair
+    data['UNITTEST/BTC'] = data['UNITTEST/BTC'].iloc[1:]
+    backtesting.advise_all_indicators(data)
+    assert analyze.call_count == 2
+    assert list(analyze.call_args[0][0]) == ['UNITTEST/BTC']
+    assert len(list(cache_dir.glob('*.feather'))) == 2
+
+    # Parameters not used by populate_indicators()
+    backtesting.strategy.buy_rsi.value = 40
+    backtesting.advise_all_indicators(data)
+    assert analyze.call_count == 2
+
+    backtesting.config['indicator_cache'] = False
+    backtesting.advise_all_indicators(data)
+    assert analyze.call_count == 3
+
+
+INDICATOR_CACHE_STRATEGY = """
+import talib.abstract as ta
+
+from freqtrade.strategy import IntParameter, IStrategy
+
+
+SMA_PERIOD = {sma_period}
+
+
+def add_sma(dataframe):
+    dataframe['sma'] = ta.SMA(dataframe, timeperiod=SMA_PERIOD)
+    return dataframe
+
+
+class IndicatorCacheStrategy(IStrategy):
+    timeframe = '5m'
+    stoploss = -0.10
+    rsi_period = IntParameter([5, 20], default=14, space='buy')
+    buy_rsi = IntParameter([0, 50], default=30, space='buy')
+
+    def _add_rsi(self, dataframe):
+        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=self.rsi_period.value{rsi_offset})
+        return dataframe
+
+    def populate_indicators(self, dataframe, metadata):
+        return add_sma(self._add_rsi(dataframe))
+
+    def populate_entry_trend(self, dataframe, metadata):
+        dataframe.loc[dataframe['rsi'] < self.buy_rsi.value{entry_offset}, 'enter_long'] = 1
+        return dataframe
+
+    def populate_exit_trend(self, dataframe, metadata):
+        return dataframe
+"""
+
+
+def test_get_indicator_run_id(default_conf, mocker, tmpdir):
+    patch_exchange(mocker)
+
+    def run_id(name, sma_period=10, rsi_offset='', entry_offset='', **params):
+        # Each variant in a separate directory, as source code is cached per file
+        strategy_path = Path(tmpdir) / name
+        strategy_path.mkdir()
+        (strategy_path / 'strategy.py').write_text(INDICATOR_CACHE_STRATEGY.format(
+            sma_period=sma_period, rsi_offset=rsi_offset, entry_offset=entry_offset))
+        strategy = StrategyResolver.load_strategy({
+            **default_conf, 'strategy': 'IndicatorCacheStrategy',
+            'strategy_path': str(strategy_path)})
+        for param, value in params.items():
+            getattr(strategy, param).value = value
+        return get_indicator_run_id(strategy, [])
+
+    default_id = run_id('default')
+    assert run_id('unchanged') == default_id
+    # Entry logic and parameters only used for entries
+    assert run_id('entry', entry_offset=' + 1') == default_id
+    assert run_id('entry_param', buy_rsi=20) == default_id
+
+    # Parameters, helper methods and functions, and constants used by indicators
+    assert run_id('indicator_param', rsi_period=10) != default_id
+    assert run_id('helper_method', rsi_offset=' + 1') != default_id
+    assert run_id('constant', sma_period=20) != default_id
+
+    mocker.patch('freqtrade.optimize.backtest_caching.__version__', '2099.1')
+    assert run_id('version') != default_id
+
+
+def test_backtest_columnar_rows(default_conf, mocker, testdatadir):
+    patch_exchange(mocker)
+    default_conf['timeframe'] = '5m'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+    data = trim_dictlist(data, -300)
+    processed = backtesting.strategy.advise_all_indicators(data)
+
+    lists = backtesting._get_ohlcv_as_lists(deepcopy(processed))
+    arrays = backtesting._get_ohlcv_as_arrays(deepcopy(processed))
+    assert len(lists['UNITTEST/BTC']) == len(arrays['UNITTEST/BTC'])
+    assert [arrays['UNITTEST/BTC'][i] for i in range(len(arrays['UNITTEST/BTC']))] == \
+        lists['UNITTEST/BTC']
+    assert arrays['UNITTEST/BTC'][-1] == lists['UNITTEST/BTC'][-1]
+
+    pair_data = arrays['UNITTEST/BTC']
+    step_size = 5 * 60 * 10 ** 9
+    first_step = int(pair_data.dates[0])
+    steps = pair_data.candle_steps(first_step, step_size)
+    assert steps.tolist() == list(range(len(pair_data)))
+    # Pair starting late waits for its first candle
+    assert pair_data.candle_steps(first_step - 3 * step_size, step_size)[0] == 3
+    # Pair with a gap is processed one candle per iteration
+    pair_data.dates[5:] += 2 * step_size
+    steps = pair_data.candle_steps(first_step, step_size)
+    assert steps[:7].tolist() == [0, 1, 2, 3, 4, 7, 8]
+
+
+@pytest.mark.parametrize("engine", ['lists', 'columnar'])
+def test_backtest_detail_candle_rows(default_conf, mocker, testdatadir, engine):
+    patch_exchange(mocker)
+    default_conf['timeframe'] = '5m'
+    default_conf['timeframe_detail'] = '1m'
+    default_conf['backtest_engine'] = engine
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    pair = 'UNITTEST/BTC'
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=[pair])
+    # 1m candles derived from the 5m candles
+    detail_df = pd.concat(
+        [data[pair].assign(date=data[pair]['date'] + timedelta(minutes=m)) for m in range(5)]
+    ).sort_values('date').reset_index(drop=True)
+    # Missing detail candles for one 5m candle
+    backtesting.detail_data = {pair: detail_df[~detail_df['date'].between(
+        '2018-01-10 07:35:00+00:00', '2018-01-10 07:39:00+00:00')]}
+    processed = backtesting.strategy.advise_all_indicators(data)
+    if engine == 'columnar':
+        rows = backtesting._get_ohlcv_as_arrays(processed)
+    else:
+        rows = backtesting._get_ohlcv_as_lists(processed)
+    backtesting._index_detail_data(rows)
+    detail = backtesting._detail_candles[pair][1]
+    # Columns are not copied from the detail dataframe
+    for column, name in zip(detail.columns, ['open', 'high', 'low', 'close']):
+        assert np.shares_memory(column, backtesting.detail_data[pair][name].values)
+
+    nr_found = 0
+    for index in range(len(rows[pair])):
+        row = rows[pair][index]
+        detail_rows = detail.candle_rows(index, row[5:])
+        df = backtesting.detail_data[pair]
+        expected = df.loc[(df['date'] >= row[0]) & (df['date'] < row[0] + timedelta(minutes=5))]
+        assert len(detail_rows) == len(expected)
+        if len(expected):
+            nr_found += 1
+            assert detail_rows[0][0] == expected['date'].iloc[0]
+            ohlc = expected[['open', 'high', 'low', 'close']]
+            assert detail_rows[-1][1:5] == ohlc.iloc[-1].tolist()
+            assert detail_rows[-1][5:] == list(row[5:])
+    assert 0 < nr_found < len(rows[pair])
+
+    # Converted detail data is reused until the dataframe changes
+    backtesting._index_detail_data(rows)
+    assert backtesting._detail_candles[pair][1] is detail
+    backtesting.detail_data[pair] = detail_df
+    backtesting._index_detail_data(rows)
+    assert backtesting._detail_candles[pair][1] is not detail
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -1990,6 +2359,49 @@ def test_backtest_start_multi_strat_caching(default_conf, mocker, caplog, testda
         assert log_has(line, caplog)
 
 
+def test_backtest_strategies_parallel(default_conf, mocker, testdatadir):
+    mocker.patch(f'{EXMS}.get_fee', return_value=0.0025)
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC']))
+    patched_configuration_load_config_file(mocker, default_conf)
+    args = [
+        'backtesting',
+        '--config', 'config.json',
+        '--datadir', str(testdatadir),
+        '--strategy-path', str(Path(__file__).parents[1] / 'strategy/strats'),
+        '--timeframe', '5m',
+        '--export', 'signals',
+        '--strategy-list', CURRENT_TEST_STRATEGY, 'StrategyTestV2',
+    ]
+    config = setup_optimize_configuration(get_args(args), RunMode.BACKTEST)
+    backtesting = Backtesting(config)
+    # Class-level mocks don't apply in worker processes
+    backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    backtesting.exchange._markets = get_markets()
+    data, timerange = backtesting.load_bt_data()
+
+    timeranges = [backtesting.backtest_one_strategy(strat, data, timerange)
+                  for strat in backtesting.strategylist]
+    sequential = backtesting.all_results
+    backtesting.all_results = {}
+    backtesting.processed_dfs = {}
+
+    min_date, max_date = backtesting.backtest_strategies_parallel(
+        backtesting.strategylist, data, timerange, 2)
+    # Timerange of all strategies
+    assert min_date == min(start for start, _ in timeranges)
+    assert max_date == max(end for _, end in timeranges)
+    assert list(backtesting.all_results) == [CURRENT_TEST_STRATEGY, 'StrategyTestV2']
+    assert list(backtesting.processed_dfs) == [CURRENT_TEST_STRATEGY, 'StrategyTestV2']
+    for strategy_name, results in sequential.items():
+        assert len(results['results']) > 0
+        pd.testing.assert_frame_equal(
+            backtesting.all_results[strategy_name]['results'], results['results'])
+
+
 def test_get_strategy_run_id(default_conf_usdt):
     default_conf_usdt.update({
         'strategy': 'StrategyTestV2',
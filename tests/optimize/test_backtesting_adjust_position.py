@@ -27,7 +27,8 @@ def test_backtest_position_adjustment(default_conf, fee, mocker, testdatadir) ->
     default_conf.update({
         "stake_amount": 100.0,
         "dry_run_wallet": 1000.0,
-        "strategy": "StrategyTestV3"
+        "strategy": "StrategyTestV3",
+        "backtest_wallet_check": True,
     })
     backtesting = Backtesting(default_conf)
     backtesting._set_strategy(backtesting.strategylist[0])
@@ -1,18 +1,23 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import joblib
+import numpy as np
 import pandas as pd
 import pytest
 from filelock import Timeout
+from joblib.externals.loky import get_reusable_executor
 from skopt.space import Integer
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
-from freqtrade.data.history import load_data
+from freqtrade.data.history import get_timerange, load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
@@ -457,7 +462,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, 'open')
     mocker.patch('freqtrade.configuration.config_validation.validate_config_schema')
-    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': None})
+    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': pd.DataFrame()})
 
     optimizer_param = {
         'buy_plusdi': 0.02,
@@ -533,6 +538,73 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
+def test_hyperopt_data_attached_once(mocker, hyperopt_conf, tmpdir, testdatadir):
+    patch_exchange(mocker)
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf['user_data_dir'] = Path(tmpdir)
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    loader = mocker.patch('freqtrade.optimize.hyperopt.load', side_effect=joblib.load)
+    h = Hyperopt(hyperopt_conf)
+    h.dump_hyperopt_data(data)
+
+    processed = h.load_hyperopt_data()
+    assert loader.call_count == 1
+    pd.testing.assert_frame_equal(processed['UNITTEST/BTC'], data['UNITTEST/BTC'])
+    # Arrays are mapped read-only from the data file, not copied
+    assert isinstance(processed['UNITTEST/BTC']['close'].values.base, np.memmap)
+    assert not processed['UNITTEST/BTC']['close'].values.flags.writeable
+    processed['UNITTEST/BTC']['enter_long'] = 1
+
+    processed = h.load_hyperopt_data()
+    assert loader.call_count == 1
+    assert 'enter_long' not in processed['UNITTEST/BTC']
+
+    # New data is attached again
+    h.dump_hyperopt_data(data)
+    h.load_hyperopt_data()
+    assert loader.call_count == 2
+
+
+def test_hyperopt_backtest_epoch_written_columns(mocker, hyperopt_conf, tmpdir, testdatadir,
+                                                 caplog):
+    patch_exchange(mocker)
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf['user_data_dir'] = Path(tmpdir)
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+
+    def backtest(processed, **kwargs):
+        # Strategy modifying an existing column in place
+        df = processed['UNITTEST/BTC']
+        df.loc[df.index[:5], 'close'] = 2.0
+        return {'results': df}
+
+    h = Hyperopt(hyperopt_conf)
+    h.min_date, h.max_date = get_timerange(data)
+    bt_mock = mocker.patch.object(h.backtesting, 'backtest', side_effect=backtest)
+    h.dump_hyperopt_data(data)
+
+    _, processed = h.backtest_epoch()
+    assert bt_mock.call_count == 2
+    assert (processed['UNITTEST/BTC']['close'].iloc[:5] == 2.0).all()
+    assert log_has("Strategy modifies columns ['close'] in place. Copying them for every epoch.",
+                   caplog)
+
+    # Following epochs only copy modified columns
+    _, processed = h.backtest_epoch()
+    assert bt_mock.call_count == 3
+    assert (processed['UNITTEST/BTC']['close'].iloc[:5] == 2.0).all()
+    assert processed['UNITTEST/BTC']['close'].values.flags.writeable
+    assert not processed['UNITTEST/BTC']['open'].values.flags.writeable
+
+    # The attached data is unchanged
+    processed = h.load_hyperopt_data()
+    pd.testing.assert_frame_equal(processed['UNITTEST/BTC'], data['UNITTEST/BTC'])
+
+    bt_mock.side_effect = ValueError('Other error')
+    with pytest.raises(ValueError, match='Other error'):
+        h.backtest_epoch()
+
+
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump')
     dumper2 = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_result')
@@ -978,6 +1050,150 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmpdir, fee)
     assert go.call_count == 3
 
 
+def test_in_strategy_auto_hyperopt_async(mocker, hyperopt_conf, tmpdir, fee) -> None:
+    mocker.patch(f'{EXMS}.validate_config', MagicMock())
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    mocker.patch(f'{EXMS}._load_markets')
+    mocker.patch(f'{EXMS}.markets',
+                 PropertyMock(return_value=get_markets()))
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'user_data_dir': Path(tmpdir),
+        'hyperopt_random_state': 42,
+        'spaces': ['buy'],
+        'epochs': 5,
+        'hyperopt_jobs': 2,
+        'hyperopt_scheduler': 'async',
+        'fee': fee.return_value,
+    })
+    batched = mocker.spy(Hyperopt, 'run_epochs_batched')
+    executors = []
+
+    def _get_executor(**kwargs):
+        executors.append(get_reusable_executor(**kwargs))
+        return executors[-1]
+
+    mocker.patch('freqtrade.optimize.hyperopt.get_reusable_executor', side_effect=_get_executor)
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    hyperopt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    hyperopt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    hyperopt.backtesting.exchange._markets = get_markets()
+    hyperopt.start()
+
+    assert batched.call_count == 0
+    # Workers are not kept alive after hyperopt
+    assert len(executors) == 1
+    assert executors[0]._flags.shutdown
+    assert len(hyperopt.opt.Xi) == 5
+    epochs, _ = HyperoptTools.load_filtered_results(hyperopt.results_file, hyperopt_conf)
+    assert [e['current_epoch'] for e in epochs] == [1, 2, 3, 4, 5]
+    assert [e['loss'] for e in epochs] == hyperopt.opt.yi
+    # Points of running epochs are not asked again
+    asked, _ = hyperopt.get_asked_points(n_points=1)
+    assert asked not in hyperopt.opt.Xi
+    assert hyperopt.get_asked_points(n_points=1, exclude=asked)[0] != asked
+
+
+def test_run_epochs_async_duplicates(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({'epochs': 3})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    # Points 1 and 2 have the same parameters
+    mocker.patch.object(hyperopt, 'get_asked_points',
+                        side_effect=[([[1], [2], [3]], [False, True, False])])
+    mocker.patch.object(hyperopt, '_get_params_dict', side_effect=lambda _, p: {'x': p[0]})
+    mocker.patch.object(hyperopt, '_get_reusable_epoch', side_effect=lambda p: (
+        None, 'hash3' if p == [3] else 'hash1'))
+    go = mocker.patch.object(hyperopt, 'generate_optimizer',
+                             side_effect=lambda p: {'loss': float(p[0]),
+                                                    'params_dict': {'x': p[0]}})
+    evaluate = mocker.patch.object(hyperopt, 'evaluate_result')
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        hyperopt.run_epochs_async(executor, 3, 0, MagicMock(), MagicMock())
+
+    # The duplicate point is not evaluated concurrently
+    assert sorted(c[0][0] for c in go.call_args_list) == [[1], [3]]
+    assert evaluate.call_count == 3
+    results = {c[0][0]['params_dict']['x']: c[0] for c in evaluate.call_args_list}
+    val, _, is_random = results[2]
+    assert val['loss'] == 1.0
+    assert val['params_hash'] == 'hash1'
+    assert is_random
+    told = [p for c in hyperopt.opt.tell.call_args_list for p in c[0][0]]
+    assert sorted(told) == [[1], [2], [3]]
+
+
+def test_hyperopt_epoch_cache(mocker, hyperopt_conf, tmpdir, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    results_dir = Path(tmpdir) / 'hyperopt_results'
+    results_dir.mkdir(parents=True)
+    hyperopt_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'user_data_dir': Path(tmpdir),
+        'hyperopt_random_state': 42,
+        'spaces': ['buy'],
+        'epochs': 4,
+    })
+    # Disabled by default
+    assert not Hyperopt(hyperopt_conf).epoch_cache_enabled
+
+    hyperopt_conf['epoch_cache'] = True
+    backtest_mock = mocker.spy(Backtesting, 'backtest')
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.start()
+    assert backtest_mock.call_count == 4
+    epochs, _ = HyperoptTools.load_filtered_results(hyperopt.results_file, hyperopt_conf)
+    assert len(epochs) == 4
+    assert all(e['run_id'] == hyperopt.run_id for e in epochs)
+    # Epochs are indexed by run_id
+    index_file = results_dir / 'epoch_cache' / f'{hyperopt.run_id}.jsonl'
+    assert len(index_file.read_text().splitlines()) == 4
+    # Results files of other runs are not read
+    (results_dir / 'strategy_HyperoptableStrategy_other.fthypt').write_text('invalid\n')
+
+    # Repeated run reuses all epochs
+    backtest_mock.reset_mock()
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.results_file = results_dir / 'strategy_HyperoptableStrategy_new.fthypt'
+    hyperopt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.start()
+    assert backtest_mock.call_count == 0
+    assert len(hyperopt.epoch_cache) == 4
+    # Reused epochs are not indexed again
+    assert len(index_file.read_text().splitlines()) == 4
+    cached_epochs, _ = HyperoptTools.load_filtered_results(hyperopt.results_file, hyperopt_conf)
+    assert [e['loss'] for e in cached_epochs] == [e['loss'] for e in epochs]
+    assert [e['params_details'] for e in cached_epochs] == [e['params_details'] for e in epochs]
+
+    # Points with identical parameters are only evaluated once
+    parallel = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
+                            side_effect=lambda p, asked: [{'loss': i} for i in range(len(asked))])
+    hyperopt.epoch_cache = {}
+    point, other = epochs[0]['params_dict'], epochs[1]['params_dict']
+    point = [point[d.name] for d in hyperopt.dimensions]
+    other = [other[d.name] for d in hyperopt.dimensions]
+    res = hyperopt.run_epochs(MagicMock(), [point, point, other])
+    assert parallel.call_args[0][1] == [point, other]
+    assert [r['loss'] for r in res] == [0, 0, 1]
+    assert res[0]['params_hash'] == res[1]['params_hash'] != res[2]['params_hash']
+    assert res[1]['params_dict'] == epochs[0]['params_dict']
+
+    # Epochs which can't be loaded anymore (e.g. modified results files) are evaluated again
+    hyperopt.epoch_cache = {res[0]['params_hash']: (index_file, 0)}
+    assert hyperopt._load_cached_epoch(res[0]['params_hash']) is None
+    assert hyperopt.epoch_cache == {}
+
+    hyperopt.epoch_cache_enabled = False
+    hyperopt.run_epochs(MagicMock(), [point, point])
+    assert parallel.call_args[0][1] == [point, point]
+
+
 def test_SKDecimal():
     space = SKDecimal(1, 2, decimals=2)
     assert 1.5 in space
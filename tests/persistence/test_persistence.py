@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring, C0103
+import random
 from datetime import datetime, timedelta, timezone
 from types import FunctionType
 
@@ -1146,6 +1147,96 @@ def test_calc_profit(
                          trade.open_rate)) == round(profit_ratio, 8)
 
 
+def _random_trade_math(rng, trading_mode, is_short, float_math):
+    """
+    Create a random trade, and run all trade value / profit calculations on it.
+    """
+    open_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    open_rate = 10 ** rng.uniform(-8, 5)
+    # Precise division is limited to 18 decimals - so keep stakes above dust.
+    amount = 10 ** rng.uniform(-1, 6) / open_rate
+    leverage = 1.0 if trading_mode == spot else rng.choice([1.0, 2.0, 3.5, 10.0])
+    entry_side, exit_side = ('sell', 'buy') if is_short else ('buy', 'sell')
+    trade = LocalTrade(
+        pair='ETH/USDT',
+        stake_amount=amount * open_rate / leverage,
+        amount=amount,
+        open_rate=open_rate,
+        open_date=open_date,
+        close_date=open_date + timedelta(minutes=rng.randint(1, 10_000)),
+        interest_rate=0.0005,
+        exchange=rng.choice(['binance', 'kraken']),
+        is_short=is_short,
+        leverage=leverage,
+        fee_open=rng.choice([0.0, 0.0005, 0.001, 0.0025, 0.0075]),
+        fee_close=rng.choice([0.0, 0.0005, 0.001, 0.0025, 0.0075]),
+        trading_mode=trading_mode,
+        funding_fees=rng.uniform(-1, 1) * amount * open_rate / 1000,
+        orders=[],
+    )
+    rates = [open_rate * rng.uniform(0.5, 1.5) for _ in range(3)]
+    amounts = [amount * rng.uniform(0.1, 1) for _ in range(2)]
+    amounts.append(sum(amounts) * rng.uniform(0.1, 0.9))
+    # Two entries - followed by a partial exit
+    for side, rate, order_amount in zip([entry_side, entry_side, exit_side], rates, amounts):
+        trade.orders.append(Order(
+            ft_order_side=side,
+            ft_pair=trade.pair,
+            ft_is_open=False,
+            status='closed',
+            symbol=trade.pair,
+            order_type='market',
+            side=side,
+            price=rate,
+            average=rate,
+            filled=order_amount,
+            remaining=0,
+            cost=rate * order_amount,
+            order_date=open_date,
+            order_filled_date=open_date,
+        ))
+    close_rate = open_rate * rng.uniform(0.5, 1.5)
+
+    LocalTrade.float_math = float_math
+    try:
+        results = [
+            trade._calc_open_trade_value(amount, open_rate),
+            trade.calc_close_trade_value(close_rate),
+            trade.calc_profit(close_rate),
+            trade.calc_profit_ratio(close_rate),
+            trade.calc_profit(close_rate, amounts[0], rates[0]),
+            trade.calc_profit_ratio(close_rate, amounts[0], rates[0]),
+        ]
+        trade.recalc_trade_from_orders()
+    finally:
+        LocalTrade.float_math = False
+    return results + [
+        trade.amount, trade.open_rate, trade.stake_amount, trade.open_trade_value,
+        trade.max_stake_amount, trade.realized_profit, trade.close_profit,
+    ]
+
+
+@pytest.mark.parametrize('trading_mode,is_short', [
+    (spot, False),
+    (margin, False),
+    (margin, True),
+    (futures, False),
+    (futures, True),
+])
+def test_float_math_matches_precise_math(trading_mode, is_short):
+    # Property based test - float math must match precise math for random trades.
+    # Precise division truncates to 18 decimals, which limits the relative precision
+    # of averaged open rates for low priced pairs to ~1e-10.
+    for seed in range(500):
+        precise = _random_trade_math(random.Random(seed), trading_mode, is_short, False)
+        floats = _random_trade_math(random.Random(seed), trading_mode, is_short, True)
+        # Absolute profits are differences of trade values - so scale tolerances by trade value
+        tolerance = 1e-8 + 1e-10 * precise[0]
+        for precise_value, float_value in zip(precise, floats):
+            assert float_value == pytest.approx(precise_value, rel=1e-9, abs=tolerance), seed
+    assert LocalTrade.float_math is False
+
+
 def test_adjust_stop_loss(fee):
     trade = Trade(
         pair='ADA/USDT',
@@ -1805,6 +1896,80 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_bt_trade_bookkeeping(fee):
+    Trade.use_db = False
+    LocalTrade.reset_trades()
+    trades = [
+        LocalTrade(
+            id=idx,
+            pair=pair,
+            stake_amount=10.0 * idx,
+            amount=idx,
+            open_rate=10.0,
+            open_date=dt_now() - timedelta(hours=idx),
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            exchange='binance',
+            is_open=True,
+            orders=[],
+        ) for idx, pair in enumerate(['ETH/USDT', 'XRP/USDT', 'ETH/USDT'], start=1)]
+    for trade in trades:
+        LocalTrade.add_bt_trade(trade)
+
+    assert LocalTrade.get_open_trade_count() == 3
+    assert Trade.total_open_trades_stakes() == 60.0
+    assert LocalTrade.get_trades_proxy(is_open=True) == trades
+    assert LocalTrade.get_trades_proxy(pair='ETH/USDT', is_open=True) == [trades[0], trades[2]]
+    assert LocalTrade.get_trades_proxy(pair='ETH/USDT', is_open=False) == []
+    assert LocalTrade.get_trades_proxy(pair='LTC/USDT') == []
+    assert 'LTC/USDT' not in LocalTrade.bt_trades_open_pp
+
+    # Stake changes of open trades (e.g. position adjustments) update the totals
+    trade = trades[1]
+    trade.orders.append(Order(
+        ft_order_side='buy', ft_pair=trade.pair, ft_is_open=False, status='closed',
+        symbol=trade.pair, order_type='market', side='buy', price=10.0, average=10.0,
+        filled=5.0, remaining=0, cost=50.0, order_date=trade.open_date,
+    ))
+    trade.recalc_trade_from_orders()
+    assert trade.stake_amount == 50.0
+    assert Trade.total_open_trades_stakes() == 90.0
+
+    # ... as do changes outside of recalc_trade_from_orders()
+    trades[2].stake_amount = 40.0
+    trades[2].realized_profit = 2.5
+    assert Trade.total_open_trades_stakes() == 100.0
+    assert LocalTrade.bt_open_realized_profit == 2.5
+    trades[2].stake_amount = 30.0
+    trades[2].realized_profit = 0.0
+    assert LocalTrade.bt_open_stake_amount == 90.0
+    assert LocalTrade.bt_open_realized_profit == 0.0
+
+    # List of open trades
+    assert isinstance(LocalTrade.trades_open, list)
+    assert LocalTrade.trades_open == trades
+    LocalTrade.trades_open.clear()
+    assert LocalTrade.get_open_trade_count() == 3
+
+    trades[0].close_profit_abs = 1.5
+    trades[0].is_open = False
+    LocalTrade.close_bt_trade(trades[0])
+    assert LocalTrade.get_open_trade_count() == 2
+    assert Trade.total_open_trades_stakes() == 80.0
+    assert Trade.get_total_closed_profit() == 1.5
+    assert LocalTrade.get_trades_proxy(pair='ETH/USDT', is_open=True) == [trades[2]]
+    assert LocalTrade.get_trades_proxy(pair='ETH/USDT', is_open=False) == [trades[0]]
+    assert LocalTrade.get_trades_proxy(pair='ETH/USDT') == [trades[0], trades[2]]
+
+    LocalTrade.remove_bt_trade(trades[1])
+    LocalTrade.remove_bt_trade(trades[2])
+    assert LocalTrade.get_open_trade_count() == 0
+    assert Trade.total_open_trades_stakes() == 0
+    assert LocalTrade.get_trades_proxy() == [trades[0]]
+    LocalTrade.reset_trades()
+    Trade.use_db = True
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize('is_short', [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2039,8 +2204,10 @@ def test_Trade_object_idem():
         'from_json',
         'validate_string_len',
     )
-    EXCLUDES2 = ('trades', 'trades_open', 'bt_trades_open_pp', 'bt_open_open_trade_count',
-                 'total_profit')
+    EXCLUDES2 = ('trades', 'trades_open', '_trades_open', 'bt_trades_open_pp',
+                 'bt_trades_closed_pp', 'bt_open_open_trade_count', 'bt_open_stake_amount',
+                 'bt_open_realized_profit', '_stake_amount', '_realized_profit',
+                 'total_profit', 'float_math')
 
     # Parent (LocalTrade) should have the same attributes
     for item in trade:
@@ -155,3 +155,57 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+def test_PairLocks_backtesting_index():
+    PairLocks.timeframe = '5m'
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    pairs = ['ETH/BTC', 'XRP/BTC', '*']
+    for idx in range(300):
+        # Lock end times are not created in order
+        PairLocks.lock_pair(pairs[idx % 3], start + timedelta(minutes=(idx * 37) % 1000),
+                            reason=f'lock{idx % 4}', now=start, side=['*', 'long'][idx % 2])
+    PairLocks.unlock_reason('lock1', now=start + timedelta(minutes=500))
+
+    all_locks = PairLocks.get_all_locks()
+    assert len(all_locks) == 300
+    for minute in range(0, 1100, 7):
+        now = start + timedelta(minutes=minute)
+        for pair in ['ETH/BTC', 'XRP/BTC', '*', 'LTC/BTC', None]:
+            for side in ['*', 'long', 'short']:
+                expected = [lock for lock in all_locks if (
+                    lock.lock_end_time >= now
+                    and lock.active
+                    and (pair is None or lock.pair == pair)
+                    and lock.side in ('*', side)
+                )]
+                locks = PairLocks.get_pair_locks(pair, now, side)
+                assert sorted(locks, key=id) == sorted(expected, key=id)
+
+    PairLocks.reset_locks()
+    assert PairLocks.get_pair_locks(None, start) == []
+    PairLocks.use_db = True
+
+
+def test_PairLocks_backtesting_index_prune():
+    PairLocks.timeframe = '5m'
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    for idx in range(100):
+        now = start + timedelta(minutes=5 * idx)
+        PairLocks.lock_pair('ETH/BTC', now + timedelta(minutes=12), now=now)
+        # Locks which ended before now are dropped from the index
+        assert len(PairLocks._locks_by_pair['ETH/BTC']) == min(idx + 1, 4)
+        assert len(PairLocks._lock_ends_by_pair['ETH/BTC']) == min(idx + 1, 4)
+        locks = PairLocks.get_pair_locks('ETH/BTC', now)
+        assert [lock.lock_end_time for lock in locks] == [
+            now + timedelta(minutes=minutes) for minutes in (0, 5, 10, 15)
+            if minutes >= 15 - 5 * idx]
+
+    # All locks are still reported
+    assert len(PairLocks.get_all_locks()) == 100
+    PairLocks.reset_locks()
+    PairLocks.use_db = True
@@ -1,13 +1,18 @@
 import random
 from datetime import datetime, timedelta, timezone
 
+import pandas as pd
 import pytest
 
 from freqtrade import constants
+from freqtrade.data.metrics import calculate_max_drawdown
 from freqtrade.enums import ExitType
-from freqtrade.persistence import PairLocks, Trade
+from freqtrade.persistence import LocalTrade, PairLocks, Trade
 from freqtrade.persistence.trade_model import Order
 from freqtrade.plugins.protectionmanager import ProtectionManager
+from freqtrade.plugins.protections.low_profit_pairs import LowProfitPairs
+from freqtrade.plugins.protections.max_drawdown_protection import MaxDrawdown
+from freqtrade.plugins.protections.stoploss_guard import StoplossGuard
 from tests.conftest import get_patched_freqtradebot, log_has_re
 
 
@@ -488,3 +493,76 @@ def test_protection_manager_desc(mocker, default_conf, protectionconf,
 
     short_desc = str(freqtrade.protections.short_desc())
     assert short_desc == desc_expected
+
+
+def test_protections_backtesting_index(default_conf, fee):
+    Trade.use_db = False
+    LocalTrade.reset_trades()
+    rng = random.Random(42)
+    pairs = ['XRP/BTC', 'ETH/BTC', 'NEO/BTC']
+    exit_reasons = [ExitType.STOP_LOSS.value, ExitType.TRAILING_STOP_LOSS.value,
+                    ExitType.ROI.value, ExitType.EXIT_SIGNAL.value]
+    stoploss_guard = StoplossGuard(default_conf, {
+        'lookback_period': 120, 'trade_limit': 2, 'required_profit': -0.01,
+        'only_per_side': True})
+    low_profit = LowProfitPairs(default_conf, {'lookback_period': 120, 'trade_limit': 2})
+    max_drawdown = MaxDrawdown(default_conf, {'lookback_period': 240, 'trade_limit': 3})
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+    def expected_trades(protection, look_back_until, pair=None, side=None):
+        # Brute force equivalent of get_closed_trades()
+        trades = [trade for trade in LocalTrade.trades
+                  if trade.close_date > look_back_until
+                  and (pair is None or trade.pair == pair)
+                  and (side is None or trade.trade_direction == side)
+                  and protection._is_relevant_trade(trade)]
+        return sorted(trades, key=lambda t: t.close_date)
+
+    for idx in range(200):
+        # Trades are closed mostly - but not strictly - in order of their (unique) close date
+        close_date = start + timedelta(minutes=5 * idx + rng.randint(-30, 0), seconds=idx)
+        trade = LocalTrade(
+            id=idx,
+            pair=rng.choice(pairs),
+            stake_amount=0.01,
+            amount=0.01,
+            open_rate=1.0,
+            open_date=close_date - timedelta(minutes=60),
+            close_date=close_date,
+            close_profit=rng.uniform(-0.05, 0.05),
+            exit_reason=rng.choice(exit_reasons),
+            is_short=rng.random() < 0.3,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            exchange='binance',
+            is_open=False,
+            orders=[],
+        )
+        LocalTrade.add_bt_trade(trade)
+
+        now = start + timedelta(minutes=5 * idx + rng.randint(-10, 10))
+        for protection in (stoploss_guard, low_profit, max_drawdown):
+            look_back_until = now - timedelta(minutes=protection._lookback_period)
+            for pair in [None, *pairs]:
+                for side in (None, 'long', 'short'):
+                    assert protection.get_closed_trades(look_back_until, pair, side) == (
+                        expected_trades(protection, look_back_until, pair, side))
+
+        trades = max_drawdown.get_closed_trades(now - timedelta(minutes=240))
+        try:
+            expected_drawdown = calculate_max_drawdown(
+                pd.DataFrame([t.to_json() for t in trades]), value_col='close_profit')[0]
+        except ValueError:
+            expected_drawdown = 0.0
+        assert MaxDrawdown._calculate_drawdown(trades) == pytest.approx(expected_drawdown)
+        trade_count, drawdown = max_drawdown._bt_closed_trades.get_drawdown(
+            now - timedelta(minutes=240))
+        assert trade_count == len(trades)
+        assert drawdown == pytest.approx(expected_drawdown)
+
+    # Trades are reset - e.g. for the next hyperopt epoch
+    LocalTrade.reset_trades()
+    assert stoploss_guard.get_closed_trades(start) == []
+    assert low_profit.stop_per_pair('XRP/BTC', start + timedelta(days=1), 'long') is None
+    assert max_drawdown.global_stop(start + timedelta(days=1), 'long') is None
+    Trade.use_db = True
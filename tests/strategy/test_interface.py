@@ -1,11 +1,13 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
@@ -292,6 +294,36 @@ def test_advise_all_indicators(default_conf, testdatadir) -> None:
     assert len(processed['UNITTEST/BTC']) == 103
 
 
+def test_advise_all_indicators_jobs(mocker, default_conf, testdatadir) -> None:
+    strategy = StrategyResolver.load_strategy(default_conf)
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC', 'ETH/BTC', 'LTC/BTC'])
+    assert len(data) == 3
+    expected = strategy.advise_all_indicators(data)
+
+    strategy.config['indicator_jobs'] = -1
+    processed = strategy.advise_all_indicators(data)
+    assert list(processed) == list(data)
+    for pair, df in processed.items():
+        assert df.equals(expected[pair])
+        assert df is not data[pair]
+
+    strategy.config['indicator_pool'] = 'processes'
+    processed = strategy.advise_all_indicators(data)
+    assert list(processed) == list(data)
+    for pair, df in processed.items():
+        assert df.equals(expected[pair])
+
+    # FreqAI is not thread-safe
+    strategy.config['freqai'] = {'enabled': True}
+    pool = mocker.patch('freqtrade.strategy.interface.ThreadPoolExecutor')
+    process_pool = mocker.patch('freqtrade.strategy.interface.get_reusable_executor')
+    processed = strategy.advise_all_indicators(data)
+    assert pool.call_count == 0
+    assert process_pool.call_count == 0
+    for pair, df in processed.items():
+        assert df.equals(expected[pair])
+
+
 def test_freqai_not_initialized(default_conf) -> None:
     strategy = StrategyResolver.load_strategy(default_conf)
     strategy.ft_bot_start()
@@ -676,6 +708,114 @@ def test_analyze_ticker_default(ohlcv_history, mocker, caplog) -> None:
     assert not log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+def test__analyze_ticker_incremental(mocker, testdatadir, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+
+    def populate_indicators(dataframe, metadata):
+        dataframe['sma'] = dataframe['close'].rolling(5).mean()
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=populate_indicators)
+    mocker.patch.multiple(
+        'freqtrade.strategy.interface.IStrategy',
+        advise_indicators=ind_mock,
+        # Columns added with signals don't prevent incremental analysis
+        advise_entry=MagicMock(side_effect=lambda x, meta: x.assign(
+            above_sma=x['close'] > x['sma'],
+            enter_long=(x['close'] > x['sma']).astype(int))),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x.assign(exit_long=0)),
+    )
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.startup_candle_count = 10
+    strategy.incremental_analysis = True
+    strategy.incremental_analysis_full_interval = 4
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC'])['UNITTEST/BTC']
+    metadata = {'pair': 'UNITTEST/BTC'}
+
+    def candles(start: int) -> DataFrame:
+        return data.iloc[start:start + 300].reset_index(drop=True)
+
+    strategy._analyze_ticker_internal(candles(0), metadata)
+    assert len(ind_mock.call_args[0][0]) == 300
+
+    # New candles are analyzed on startup_candle_count candles
+    for start, analyzed_candles in [(1, 11), (3, 12)]:
+        ret = strategy._analyze_ticker_internal(candles(start), metadata)
+        assert len(ind_mock.call_args[0][0]) == analyzed_candles
+        expected = strategy.analyze_ticker(candles(start), metadata)
+        # Indicators of the first candles have been calculated with more history before
+        assert_frame_equal(ret.iloc[10:], expected.iloc[10:])
+    assert log_has('Incremental TA Analysis of 2 candles for UNITTEST/BTC', caplog)
+
+    # Full analysis after incremental_analysis_full_interval candles
+    strategy._analyze_ticker_internal(candles(4), metadata)
+    assert len(ind_mock.call_args[0][0]) == 300
+    strategy._analyze_ticker_internal(candles(5), metadata)
+    assert len(ind_mock.call_args[0][0]) == 11
+    # ... and if candles don't line up
+    strategy._analyze_ticker_internal(candles(6).drop(index=150).reset_index(drop=True),
+                                      metadata)
+    assert len(ind_mock.call_args[0][0]) == 299
+
+    strategy.incremental_analysis = False
+    strategy._analyze_ticker_internal(candles(7), metadata)
+    assert len(ind_mock.call_args[0][0]) == 300
+
+
+def test__analyze_ticker_incremental_state(mocker, testdatadir) -> None:
+    def populate_indicators(dataframe, metadata):
+        dataframe['ema'] = dataframe['close'].ewm(span=20, adjust=False).mean()
+        return dataframe
+
+    def populate_indicators_incremental(dataframe, previous, metadata):
+        # Continue the EMA from the previous analysis
+        alpha = 2 / 21
+        ema = previous['ema'].iloc[-1]
+        for index, close in dataframe['close'].items():
+            ema = alpha * close + (1 - alpha) * ema
+            dataframe.loc[index, 'ema'] = ema
+        return dataframe
+
+    mocker.patch.multiple(
+        'freqtrade.strategy.interface.IStrategy',
+        advise_indicators=MagicMock(side_effect=populate_indicators),
+        advise_entry=MagicMock(side_effect=lambda x, meta: x.assign(enter_long=0)),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x.assign(exit_long=0)),
+    )
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.startup_candle_count = 10
+    strategy.incremental_analysis = True
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC'])['UNITTEST/BTC']
+    metadata = {'pair': 'UNITTEST/BTC'}
+
+    def candles(start: int) -> DataFrame:
+        return data.iloc[start:start + 300].reset_index(drop=True)
+
+    def expected(start: int) -> Series:
+        # EMA calculated from the first candle on
+        return populate_indicators(data.iloc[:start + 300].copy(), metadata)['ema'].iloc[-2:]
+
+    strategy._analyze_ticker_internal(candles(0), metadata)
+    ret = strategy._analyze_ticker_internal(candles(2), metadata)
+    # EMA calculated on startup_candle_count candles drifts
+    assert ret['ema'].iloc[-2:].tolist() != pytest.approx(expected(2).tolist())
+
+    strategy.populate_indicators_incremental = MagicMock(
+        side_effect=populate_indicators_incremental)
+    # Same candles as another pair, starting with a full analysis
+    metadata = {'pair': 'ETH/BTC'}
+    strategy._analyze_ticker_internal(candles(10), metadata)
+    assert strategy.populate_indicators_incremental.call_count == 0
+    for start in (12, 14):
+        ret = strategy._analyze_ticker_internal(candles(start), metadata)
+        assert len(strategy.populate_indicators_incremental.call_args[0][0]) == 2
+        assert len(strategy.populate_indicators_incremental.call_args[0][1]) == 298
+        assert ret['ema'].iloc[-2:].tolist() == pytest.approx(expected(start).tolist())
+    assert strategy.populate_indicators_incremental.call_count == 2
+
+
 def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) -> None:
     caplog.set_level(logging.DEBUG)
     ind_mock = MagicMock(side_effect=lambda x, meta: x)
@@ -718,6 +858,53 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+def test_analyze_concurrent(ohlcv_history, mocker, caplog) -> None:
+    def populate_indicators(dataframe, metadata):
+        if metadata['pair'] == 'XRP/BTC':
+            raise ValueError('xyz')
+        return dataframe
+
+    def ohlcv(pair, *args, **kwargs):
+        if pair == 'BAD/BTC':
+            raise KeyError(pair)
+        return ohlcv_history.copy()
+
+    mocker.patch.multiple(
+        'freqtrade.strategy.interface.IStrategy',
+        advise_indicators=MagicMock(side_effect=populate_indicators),
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({'analysis_jobs': 3})
+    strategy.dp = DataProvider({}, None, None)
+    mocker.patch.object(strategy.dp, 'ohlcv', side_effect=ohlcv)
+    published = []
+    mocker.patch.object(strategy.dp, '_emit_df', side_effect=lambda pair_key, df, new_candle:
+                        published.append((pair_key[0], threading.current_thread())))
+
+    pairs = ['ETH/BTC', 'BAD/BTC', 'XRP/BTC', 'LTC/BTC', 'NEO/BTC']
+    strategy.analyze(pairs)
+
+    # Published from the calling thread, in order of the whitelist
+    assert published == [(pair, threading.current_thread())
+                         for pair in ['ETH/BTC', 'LTC/BTC', 'NEO/BTC']]
+    for pair in ['ETH/BTC', 'LTC/BTC', 'NEO/BTC']:
+        assert len(strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)[0]) == len(
+            ohlcv_history)
+    assert strategy.dp.get_analyzed_dataframe('XRP/BTC', strategy.timeframe)[0].empty
+    assert log_has_re(r'Unable to analyze candle \(OHLCV\) data for pair XRP/BTC: xyz', caplog)
+    assert log_has('Unable to analyze candle (OHLCV) data for pair BAD/BTC', caplog)
+    assert strategy._ft_deferred_dfs is None
+
+    # FreqAI is not thread-safe - pairs are analyzed in the calling thread
+    strategy.config['freqai'] = {'enabled': True}
+    pool = mocker.patch('freqtrade.strategy.interface.ThreadPoolExecutor')
+    analyze_pair = mocker.spy(strategy, 'analyze_pair')
+    strategy.analyze(['ETH/BTC', 'LTC/BTC', 'NEO/BTC'])
+    assert pool.call_count == 0
+    assert analyze_pair.call_count == 3
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf['timeframe']
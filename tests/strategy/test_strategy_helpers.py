@@ -223,9 +223,11 @@ def test_stoploss_from_absolute():
 
 
 @pytest.mark.parametrize('trading_mode', ['futures', 'spot'])
-def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
+@pytest.mark.parametrize('indicator_jobs', [1, 2])
+def test_informative_decorator(mocker, default_conf_usdt, trading_mode, indicator_jobs):
     candle_def = CandleType.get_default(trading_mode)
     default_conf_usdt['candle_type_def'] = candle_def
+    default_conf_usdt['indicator_jobs'] = indicator_jobs
     test_data_5m = generate_test_data('5m', 40)
     test_data_30m = generate_test_data('30m', 40)
     test_data_1h = generate_test_data('1h', 40)
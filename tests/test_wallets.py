@@ -6,9 +6,10 @@ import pytest
 from sqlalchemy import select
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
-from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import Trade
-from tests.conftest import (EXMS, create_mock_trades, create_mock_trades_usdt,
+from freqtrade.exceptions import DependencyException, OperationalException
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.wallets import Wallets
+from tests.conftest import (EXMS, create_mock_trades, create_mock_trades_usdt, get_patched_exchange,
                             get_patched_freqtradebot, patch_wallet)
 
 
@@ -396,6 +397,40 @@ def test_sync_wallet_futures_dry(mocker, default_conf, fee):
     assert free + used == total
 
 
+@pytest.mark.parametrize('trading_mode', ['spot', 'futures'])
+def test_update_pair_backtesting(mocker, default_conf, fee, trading_mode):
+    default_conf['dry_run'] = True
+    default_conf['trading_mode'] = trading_mode
+    default_conf['margin_mode'] = 'isolated'
+    default_conf['backtest_wallet_check'] = True
+    Trade.use_db = False
+    LocalTrade.reset_trades()
+    exchange = get_patched_exchange(mocker, default_conf)
+    wallets = Wallets(default_conf, exchange, log=False)
+    create_mock_trades(fee, is_short=None, use_db=False)
+    wallets.update()
+    expected = wallets._calculate_dry()
+    assert expected[0]['BTC'].free < default_conf['dry_run_wallet']
+
+    trade = next(iter(LocalTrade.bt_trades_open_pp['ETC/BTC']))
+    LocalTrade.remove_bt_trade(trade)
+    wallets.update_pair('ETC/BTC')
+    assert 'ETC' not in wallets._wallets
+    assert 'ETC/BTC' not in wallets._positions
+    assert wallets._wallets['BTC'] != expected[0]['BTC']
+
+    # Amounts of open trades changed without updating the wallet of this pair
+    trade = next(iter(LocalTrade.bt_trades_open_pp['XRP/BTC']))
+    trade.amount *= 2
+    with pytest.raises(OperationalException, match=r'Wallets out of sync\..*'):
+        wallets.update_pair('ETH/BTC')
+    wallets.update_pair('XRP/BTC')
+    assert wallets._calculate_dry() == (wallets._wallets, wallets._positions)
+
+    LocalTrade.reset_trades()
+    Trade.use_db = True
+
+
 def test_check_exit_amount(mocker, default_conf, fee):
     freqtrade = get_patched_freqtradebot(mocker, default_conf)
     update_mock = mocker.patch("freqtrade.wallets.Wallets.update")